@@ -8,6 +8,7 @@ from flask import Blueprint, jsonify, request
 
 from ai_stub import stub_explain_from_context
 from cache import get_cache
+from cfbd_scheduler import PRIORITY_AGENT, cfbd_priority, get_scheduler
 from path_to_climb import compute_path_to_climb
 from ranking_service import get_or_calculate_rankings, DEFAULT_CONFIG
 from shareable_blurb import (
@@ -32,6 +33,7 @@ from spend_guards import (
     resolve_ai_mode,
     spend_status,
 )
+from team_lookup import TeamNotFoundError, team_index
 
 # In-season daily / offseason monthly — keep TTL past the period boundary
 TTL_BLURB_IN_SEASON = 36 * 60 * 60
@@ -85,44 +87,45 @@ def _top_quality_wins(team: Dict[str, Any], limit: int = 3) -> List[str]:
     return names
 
 
-def _build_team_context(rankings: Dict[str, Any], team_name: str) -> Optional[Dict[str, Any]]:
+def _build_team_context(rankings: Dict[str, Any], team_name: str) -> Dict[str, Any]:
+    """Context for a team by exact name or alias; a typo raises TeamNotFoundError with suggestions."""
     team_rankings = rankings.get('team_rankings', [])
-    for i, team in enumerate(team_rankings):
-        if team['team_name'].lower() != team_name.lower():
-            continue
-
-        team_above = team_rankings[i - 1] if i > 0 else None
-        team_below = team_rankings[i + 1] if i + 1 < len(team_rankings) else None
-        tq = float(team.get('team_quality_score') or 0)
-        rec = float(team.get('record_score') or 0)
-        cq = float(team.get('conference_quality_score') or 0)
-
-        return {
-            'rank': i + 1,
-            'team_name': team['team_name'],
-            'conference': team['conference'],
-            'final_ranking_score': team['final_ranking_score'],
-            'team_quality_score': team['team_quality_score'],
-            'record_score': team['record_score'],
-            'conference_quality_score': team['conference_quality_score'],
-            'formula_breakdown': {
-                'tq_contribution': round(tq * 0.65, 2),
-                'rec_contribution': round(rec * 0.27, 2),
-                'cq_contribution': round(cq * 0.08, 2),
-                'total': team.get('final_ranking_score'),
-            },
-            'records': team.get('records', {}),
-            'sos': team.get('sos'),
-            'sov': team.get('sov'),
-            'quality_wins': team.get('quality_wins'),
-            'quality_losses': team.get('quality_losses'),
-            'bad_losses': team.get('bad_losses'),
-            'top_quality_wins': _top_quality_wins(team),
-            'neighbor_ahead': team_above['team_name'] if team_above else None,
-            'neighbor_behind': team_below['team_name'] if team_below else None,
-            'path_to_climb': compute_path_to_climb(team, team_above),
-        }
-    return None
+    index = team_index(team_rankings)
+    i = index.find(team_name)
+    if i is None:
+        raise TeamNotFoundError(team_name, [team_rankings[row]['team_name'] for row in index.suggest(team_name)])
+    team = team_rankings[i]
+    team_above = team_rankings[i - 1] if i > 0 else None
+    team_below = team_rankings[i + 1] if i + 1 < len(team_rankings) else None
+    tq = float(team.get('team_quality_score') or 0)
+    rec = float(team.get('record_score') or 0)
+    cq = float(team.get('conference_quality_score') or 0)
+
+    return {
+        'rank': i + 1,
+        'team_name': team['team_name'],
+        'conference': team['conference'],
+        'final_ranking_score': team['final_ranking_score'],
+        'team_quality_score': team['team_quality_score'],
+        'record_score': team['record_score'],
+        'conference_quality_score': team['conference_quality_score'],
+        'formula_breakdown': {
+            'tq_contribution': round(tq * 0.65, 2),
+            'rec_contribution': round(rec * 0.27, 2),
+            'cq_contribution': round(cq * 0.08, 2),
+            'total': team.get('final_ranking_score'),
+        },
+        'records': team.get('records', {}),
+        'sos': team.get('sos'),
+        'sov': team.get('sov'),
+        'quality_wins': team.get('quality_wins'),
+        'quality_losses': team.get('quality_losses'),
+        'bad_losses': team.get('bad_losses'),
+        'top_quality_wins': _top_quality_wins(team),
+        'neighbor_ahead': team_above['team_name'] if team_above else None,
+        'neighbor_behind': team_below['team_name'] if team_below else None,
+        'path_to_climb': compute_path_to_climb(team, team_above),
+    }
 
 
 def _call_minimax(
@@ -222,6 +225,7 @@ def agent_health():
         'minimax_configured': bool(MINIMAX_API_KEY),
         'cfbd_mcp_configured': bool(CFBD_MCP_URL),
         **spend_status(),
+        'cfbd_scheduler': get_scheduler().status(),
     })
 
 
@@ -253,19 +257,22 @@ def explain_ranking():
         return jsonify({'error': 'team_name is required'}), 400
 
     # Offline: serve static/slim. Online: prefer full payload for wins_details.
-    rankings = get_or_calculate_rankings(
-        _data_processor,
-        year,
-        week,
-        request.args,
-        prefer_static=is_cfbd_offline(),
-    )
+    # Agent lookups yield CFBD slots to interactive /rankings misses
+    with cfbd_priority(PRIORITY_AGENT):
+        rankings = get_or_calculate_rankings(
+            _data_processor,
+            year,
+            week,
+            request.args,
+            prefer_static=is_cfbd_offline(),
+        )
     if not rankings:
         return jsonify({'error': f'No rankings data for {year}'}), 404
 
-    context = _build_team_context(rankings, team_name)
-    if not context:
-        return jsonify({'error': f"Team '{team_name}' not found in rankings"}), 404
+    try:
+        context = _build_team_context(rankings, team_name)
+    except TeamNotFoundError as e:
+        return jsonify({'error': str(e), 'suggestions': e.suggestions}), 404
 
     explanation, mode = _resolve_explanation(context, question)
 
@@ -360,19 +367,22 @@ def _blurb_http(kind: str):
             'spend': spend_status(),
         })
 
-    rankings = get_or_calculate_rankings(
-        _data_processor,
-        year,
-        week,
-        request.args,
-        prefer_static=is_cfbd_offline(),
-    )
+    # Agent lookups yield CFBD slots to interactive /rankings misses
+    with cfbd_priority(PRIORITY_AGENT):
+        rankings = get_or_calculate_rankings(
+            _data_processor,
+            year,
+            week,
+            request.args,
+            prefer_static=is_cfbd_offline(),
+        )
     if not rankings:
         return jsonify({'error': f'No rankings data for {year}'}), 404
 
-    context = _build_team_context(rankings, team_name)
-    if not context:
-        return jsonify({'error': f"Team '{team_name}' not found in rankings"}), 404
+    try:
+        context = _build_team_context(rankings, team_name)
+    except TeamNotFoundError as e:
+        return jsonify({'error': str(e), 'suggestions': e.suggestions}), 404
 
     blurb, mode = _resolve_blurb(context, kind=kind)
     if len(blurb) > BLURB_MAX_CHARS:
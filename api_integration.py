@@ -4,7 +4,10 @@ from typing import Dict, List, Optional, Any
 import os
 from dotenv import load_dotenv
 import requests
-from cache import get_cache, TTL_TEAMS, TTL_GAMES_HISTORICAL, TTL_GAMES_CURRENT, get_games_ttl
+from requests.adapters import HTTPAdapter
+from cache import get_cache, TTL_TEAMS, get_games_ttl
+from cfbd_scheduler import get_scheduler
+from game_store import GameStore, get_game_store
 from spend_guards import (
     CFBDOfflineError,
     is_cfbd_offline,
@@ -12,12 +15,32 @@ from spend_guards import (
 )
 
 
+def cfbd_fetch_concurrency() -> int:
+    """
+    Max concurrent CFBD requests (and pooled keep-alive connections) per client.
+
+    CFBD_FETCH_CONCURRENCY overrides; 1 restores strictly serial fetching.
+    """
+    raw = os.environ.get('CFBD_FETCH_CONCURRENCY', '').strip()
+    if raw:
+        try:
+            return max(1, int(raw))
+        except ValueError:
+            pass
+    return 4
+
+
 class CFBDApiClient:
-    """Centralized API client for CFBD data using direct HTTP requests"""
+    """Centralized API client for CFBD data using pooled HTTP requests"""
     
-    BASE_URL = "https://api.collegefootballdata.com"
+    BASE_URL = os.environ.get('CFBD_BASE_URL', "https://api.collegefootballdata.com")
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        game_store: Optional[GameStore] = None,
+    ):
         if api_key is None:
             load_dotenv()
             api_key = os.getenv('CFBD_API_KEY')
@@ -31,11 +54,29 @@ class CFBDApiClient:
             'Authorization': f'Bearer {api_key}',
             'accept': 'application/json'
         }
+        self.base_url = (base_url or self.BASE_URL).rstrip('/')
         self._cache = get_cache()
+        self.game_store = game_store or get_game_store()
+        self._session = self._build_session()
 
-    def _make_request(self, endpoint: str, params: Dict[str, Any] = None) -> Any:
-        """Helper to make API requests with error handling and spend guards."""
-        url = f"{self.BASE_URL}{endpoint}"
+    def _build_session(self) -> requests.Session:
+        """Shared keep-alive session sized for concurrent week fetches."""
+        session = requests.Session()
+        session.headers.update(self.headers)
+        pool_size = cfbd_fetch_concurrency()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def _make_request(self, endpoint: str, params: Dict[str, Any] = None, raise_errors: bool = False) -> Any:
+        """
+        Helper to make API requests with error handling and spend guards.
+
+        Transport/HTTP errors return [] unless raise_errors is set, so callers that
+        record empty responses can tell a failed call from a genuinely empty one.
+        """
+        url = f"{self.base_url}{endpoint}"
         if is_cfbd_offline():
             print(
                 f"CFBD OFFLINE: blocked live request {endpoint} params={params}. "
@@ -47,11 +88,19 @@ class CFBDApiClient:
             )
 
         try:
+            # Scheduler first: a refused slot must not consume the call budget
+            scheduler = get_scheduler()
+            priority = scheduler.acquire()
             call_n = register_live_cfbd_call()
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
-            remaining = response.headers.get('X-CallLimit-Remaining')
+            remaining = None
+            try:
+                response = self._session.get(url, params=params, timeout=30)
+                remaining = response.headers.get('X-CallLimit-Remaining')
+            finally:
+                # CFBD counts failed and timed-out calls against the quota too
+                scheduler.record_call(priority, remaining)
             print(
-                f"CFBD LIVE #{call_n}: {endpoint} params={params} "
+                f"CFBD LIVE #{call_n} [{priority}]: {endpoint} params={params} "
                 f"status={response.status_code} remaining={remaining}"
             )
             response.raise_for_status()
@@ -62,6 +111,8 @@ class CFBDApiClient:
             print(f"API Request Error to {endpoint}: {e}")
             if hasattr(e, 'response') and e.response is not None:
                 print(f"Response: {e.response.text}")
+            if raise_errors:
+                raise
             return []
 
     def _get_cache_key(self, prefix: str, *args, **kwargs) -> str:
@@ -69,16 +120,20 @@ class CFBDApiClient:
         return self._cache._generate_key(prefix, *args, **kwargs)
 
     def get_games(self, year: int, week: Optional[int] = None, season_type: str = 'regular') -> List[Dict]:
-        """Fetch games with caching, error handling and data transformation"""
+        """Fetch games via the local game store, hitting CFBD only for stale or unseen weeks"""
+        store = self.game_store
+        if store.covers(year, week, season_type):
+            print(f"Store HIT: games {year} week={week} type={season_type}")
+            return store.get_games(year, week=week, season_type=season_type)
+
+        # The shared cache outlives this container's store (e.g. R2 after a restart)
         cache_key = self._get_cache_key('games', year, week, season_type)
-        
-        # Try cache first
         cached = self._cache.get(cache_key)
         if cached is not None:
             print(f"Cache HIT: games {year} week={week} type={season_type}")
             return cached
         
-        print(f"Cache MISS: games {year} week={week} type={season_type}")
+        print(f"Store MISS: games {year} week={week} type={season_type}")
         
         params = {
             'year': year,
@@ -88,18 +143,18 @@ class CFBDApiClient:
             params['week'] = week
 
         try:
-            games = self._make_request('/games', params)
-        except CFBDOfflineError as e:
-            print(f"CFBD offline on games miss: {e}")
-            return []
+            games = self._make_request('/games', params, raise_errors=True)
+        except (CFBDOfflineError, requests.exceptions.RequestException) as e:
+            print(f"CFBD unavailable on games miss: {e}")
+            # Stale rows beat nothing when CFBD is unreachable
+            return store.get_games(year, week=week, season_type=season_type)
         result = [self._transform_game(game) for game in games if self._is_valid_game(game)]
         
-        # Cache with appropriate TTL
+        # Empty successful responses are recorded too: an empty week marks the season's end
+        store.upsert_games(year, week, season_type, result)
         if result:
-            ttl = get_games_ttl(year)
-            self._cache.set(cache_key, result, ttl, prefix='games')
-        
-        return result
+            self._cache.set(cache_key, result, get_games_ttl(year), prefix='games')
+        return store.get_games(year, week=week, season_type=season_type)
 
     def get_team_info(self) -> Dict[str, str]:
         """Fetch team conference affiliations with caching"""
@@ -125,6 +180,11 @@ class CFBDApiClient:
 
     def get_teams_with_logos(self) -> Dict[str, Dict[str, Any]]:
         """Fetch all team info including logos and colors with caching"""
+        stored = self.game_store.get_teams()
+        if stored is not None:
+            print("Store HIT: teams_with_logos")
+            return stored
+
         cache_key = self._get_cache_key('teams_with_logos')
         
         cached = self._cache.get(cache_key)
@@ -137,7 +197,7 @@ class CFBDApiClient:
             teams = self._make_request('/teams')
         except CFBDOfflineError as e:
             print(f"CFBD offline on teams_with_logos miss: {e}")
-            return {}
+            return self.game_store.get_teams(max_age=None) or {}
         result = {}
         for team in teams:
             result[team['school']] = {
@@ -152,6 +212,7 @@ class CFBDApiClient:
             }
         
         if result:
+            self.game_store.upsert_teams(result)
             self._cache.set(cache_key, result, TTL_TEAMS, prefix='teams')
         
         return result
@@ -214,6 +275,7 @@ class CFBDApiClient:
     def _transform_game(self, game: Dict) -> Dict:
         """Transform CFBD game dict to internal format"""
         return {
+            'id': game.get('id'),
             'week': game.get('week'),
             'year': game.get('season'),
             'home_team_name': game.get('homeTeam'),
@@ -1,26 +1,54 @@
 # filepath: c:\Users\micha\DevProjects\CFB-Ranking-System\app.py
+import hashlib
 import os
+import threading
 from datetime import datetime
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
 from dotenv import load_dotenv
 
-from data_processor import CFBDataProcessor
+from columnar_rankings import DEFAULT_PRECISION, MAX_PRECISION
+from data_processor import CFBDataProcessor, TeamRegistryUnavailable
+from json_provider import FastJSONProvider
+from rankings_history import get_rankings_history
+from rankings_query import parse_rankings_query
 from cache import get_cache
 from ranking_service import (
+    BATCH_MAX_ITEMS,
+    BatchItem,
     get_or_calculate_rankings,
-    slim_rankings_for_list,
+    columnar_variant,
+    get_rankings_body,
+    get_rankings_version,
+    get_static_rankings_body,
+    get_team_breakdowns,
+    get_team_shard_body,
+    iter_rankings_batch,
+    query_rankings_variant,
+    rankings_cache_key,
+    rankings_variant,
+    serialize_rankings,
+    store_rankings_body,
+    store_rankings_version,
+    stream_body,
+    stream_rankings,
+    team_breakdown_body,
     build_config,
     DEFAULT_CONFIG,
 )
 from agent_service import agent_bp, set_data_processor
-from path_to_climb import compute_path_to_climb
 from spend_guards import is_cfbd_offline
+from static_rankings import get_static_index, preload_season
+from team_breakdown import build_team_breakdown, find_team, suggest_teams
+from team_lookup import AUTOCOMPLETE_LIMIT, TeamNotFoundError, normalize_team_name, team_index
+from warm_state import load_warm_state, start_warm_state_writer
+from whatif import WHATIF_DIFF_LIMIT, parse_scenario, run_whatif
 
 load_dotenv()
 
 app = Flask(__name__)
+app.json = FastJSONProvider(app)
 
 # CORS: allow configured origins or wildcard in dev
 _cors_origins = os.environ.get('CORS_ORIGINS', '*')
@@ -31,12 +59,29 @@ else:
 
 cache = get_cache()
 api_key = os.getenv('CFBD_API_KEY')
-data_processor = CFBDataProcessor(api_key=api_key)
+# Serve immediately; the team registry warms in the background and requests
+# that need it wait up to TEAM_REGISTRY_TIMEOUT (TEAM_REGISTRY_EAGER=1 to block at boot)
+_eager_registry = os.environ.get('TEAM_REGISTRY_EAGER', '').lower() in ('1', 'true', 'yes')
+data_processor = CFBDataProcessor(api_key=api_key, lazy_registry=not _eager_registry)
+# Boot warm: one read seeds registry, week index and hot rankings
+load_warm_state(data_processor, cache)
+data_processor.warm_registry_async()
 set_data_processor(data_processor)
+start_warm_state_writer(data_processor, cache, lambda: get_current_season_week()[0])
+# Parse the latest static season into the in-process index off the request path
+threading.Thread(target=preload_season, name='static-preload', daemon=True).start()
 
 app.register_blueprint(agent_bp)
 
 
+@app.errorhandler(TeamRegistryUnavailable)
+def registry_unavailable(e):
+    response = jsonify({"error": "Team data is still loading; retry shortly."})
+    response.status_code = 503
+    response.headers['Retry-After'] = '5'
+    return response
+
+
 def get_current_season_week():
     now = datetime.now()
     year = now.year
@@ -89,7 +134,11 @@ def get_weeks():
 
 @app.route('/cache/stats', methods=['GET'])
 def cache_stats():
-    return jsonify(cache.get_stats())
+    return jsonify({
+        **cache.get_stats(),
+        "team_registry_ready": data_processor.registry_ready,
+        "static_index": get_static_index().stats(),
+    })
 
 
 @app.route('/cache/clear', methods=['POST'])
@@ -104,196 +153,411 @@ def clear_cache():
     return jsonify({"message": "Cache cleared successfully"})
 
 
+STATIC_MAX_AGE = int(os.environ.get('STATIC_CACHE_MAX_AGE', str(365 * 24 * 60 * 60)))
+
+
+def _accepted_encodings():
+    return [e for e in ('br', 'gzip') if request.accept_encodings[e]]
+
+
+def _static_response(body):
+    """Immutable archived-week response with a strong ETag; 304 on If-None-Match."""
+    # body.data views the file mapping: a 304 never copies it, a sent body is bytes for WSGI
+    not_modified = request.if_none_match.contains(body.etag)
+    response = Response(b'' if not_modified else bytes(body.data), mimetype='application/json')
+    if body.encoding:
+        response.headers['Content-Encoding'] = body.encoding
+    response.set_etag(body.etag)
+    response.headers['Cache-Control'] = f'public, max-age={STATIC_MAX_AGE}, immutable'
+    response.vary.add('Accept-Encoding')
+    return response.make_conditional(request)
+
+
+def _variant_etag(version, *variant) -> str:
+    """Per-response ETag: payload hash plus what the route derives from it."""
+    return hashlib.sha256('|'.join((version.digest, *variant)).encode()).hexdigest()[:32]
+
+
+def _not_modified(etag: str, max_age: int):
+    """304 for a matching If-None-Match, decided before the payload is touched."""
+    if not request.if_none_match.contains_weak(etag):
+        return None
+    return _with_validators(Response(status=304), etag, max_age)
+
+
+def _json_body(body: str, stream: bool = False) -> Response:
+    return Response(stream_body(body) if stream else body, mimetype='application/json')
+
+
+STREAM_RESPONSES = os.environ.get('RANKINGS_STREAM', '1').lower() not in ('0', 'false', 'no')
+
+
+def _streams(variant: str) -> bool:
+    """Stream the heaviest views (detail, all divisions) instead of building them in memory."""
+    if not STREAM_RESPONSES or variant.startswith('columnar:'):
+        return False
+    return variant == 'detail' or request.args.get('all_divisions', 'false').lower() == 'true'
+
+
+def _with_validators(response, etag: str, max_age: int):
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = f'public, max-age={max(0, max_age)}'
+    return response
+
+
+def _ensure_version(year, week, data, prefer_static):
+    """Version for data loaded without one (cache entries that predate ETags)."""
+    return get_rankings_version(year, week, request.args, prefer_static=prefer_static) or \
+        store_rankings_version(rankings_cache_key(year, week, request.args), data)
+
+
 @app.route('/rankings', methods=['GET'])
 def get_rankings():
     try:
         year = request.args.get('year', default=2023, type=int)
         week = request.args.get('week', default=None, type=int)
         detail = request.args.get('detail', 'false').lower() == 'true'
+        columnar = request.args.get('format', 'json') == 'columnar'
+        if columnar and detail:
+            return jsonify({"error": "format=columnar is only available for the list view."}), 400
+        precision = min(max(request.args.get('precision', DEFAULT_PRECISION, type=int), 0), MAX_PRECISION)
+        try:
+            query = parse_rankings_query(request.args)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        if query is None and not detail and (not columnar or precision == DEFAULT_PRECISION):
+            # Archived default-config slim weeks: ship the precomputed (compressed) bytes as-is
+            body = get_static_rankings_body(
+                year, week, request.args, _accepted_encodings(), columnar=columnar
+            )
+            if body is not None:
+                return _static_response(body)
+        if detail:
+            variant = 'detail'
+        else:
+            variant = columnar_variant(precision) if columnar else 'list'
+        etag_parts = (variant, query.key) if query is not None else (variant,)
+        version = get_rankings_version(year, week, request.args, prefer_static=not detail)
+        if version is not None:
+            etag = _variant_etag(version, *etag_parts)
+            not_modified = _not_modified(etag, version.max_age)
+            if not_modified is not None:
+                return not_modified
+            body = get_rankings_body(year, week, request.args, variant) if query is None else None
+            if body is not None:
+                return _with_validators(_json_body(body, stream=_streams(variant)), etag, version.max_age)
         # Detail views need full payloads (skip slim static files)
         data = get_or_calculate_rankings(
             data_processor, year, week, request.args, prefer_static=not detail
         )
         if not data:
             return jsonify({"error": f"No game data found for {year}."}), 404
-        if not detail and data.get('detail') is not False:
-            data = slim_rankings_for_list(data)
-        elif detail and 'rankings' in data:
-            # Avoid shipping the duplicate name-keyed map on the wire
-            data = {k: v for k, v in data.items() if k != 'rankings'}
-        return jsonify(data)
+        version = version or _ensure_version(year, week, data, not detail)
+        if query is not None:
+            # Filtered/projected views are cheap to rebuild; only full bodies are stored
+            body = serialize_rankings(query_rankings_variant(data, variant, query, version.digest))
+            return _with_validators(_json_body(body), _variant_etag(version, *etag_parts), version.max_age)
+        if _streams(variant):
+            # Envelope, then one team at a time, straight from the payload
+            response = Response(stream_rankings(rankings_variant(data, variant)), mimetype='application/json')
+            return _with_validators(response, _variant_etag(version, variant), version.max_age)
+        body = serialize_rankings(rankings_variant(data, variant))
+        # Backfill entries cached before bodies were stored
+        store_rankings_body(rankings_cache_key(year, week, request.args), variant, body, version.max_age)
+        return _with_validators(_json_body(body), _variant_etag(version, variant), version.max_age)
+    except TeamRegistryUnavailable:
+        raise
     except Exception as e:
         print(f"Error during ranking calculation: {e}")
         return jsonify({"error": "An internal error occurred during ranking calculation."}), 500
 
 
+# Config params a batch may vary per item (the ones /rankings reads)
+BATCH_CONFIG_KEYS = (
+    'all_divisions', 'power_conf_initial', 'group5_initial', 'fcs_initial', 'base_factor',
+    'team_quality_weight', 'conference_weight', 'record_weight', 'prior_strength',
+)
+
+
+def _int_list(value, name):
+    """[1, 2, 3, 8] from a JSON list or '1-3,8'; a JSON null stays None (full season)."""
+    if value is None:
+        return []
+    parts = value if isinstance(value, list) else str(value).split(',')
+    values = []
+    for part in parts:
+        text = '' if part is None else str(part).strip()
+        if part is None or text in ('final', 'null'):
+            values.append(None)
+            continue
+        if not text:
+            continue
+        try:
+            low, _, high = text.partition('-')
+            values.extend(range(int(low), int(high or low) + 1))
+        except ValueError:
+            raise ValueError(f'{name} must be integers or ranges like 1-5') from None
+    if any(v is not None and v < 1 for v in values):
+        raise ValueError(f'{name} must be >= 1')
+    return values
+
+
+def _batch_request():
+    """(items, variant) from a JSON body {"years", "weeks", "configs", "detail"} or the
+    query string (years=2024&weeks=1-5, config params apply to every item)."""
+    body = request.get_json(silent=True) if request.method == 'POST' else None
+    source = body if isinstance(body, dict) else request.args
+    years = _int_list(source.get('years'), 'years')
+    if not years or None in years:
+        raise ValueError('years is required')
+    weeks = _int_list(source.get('weeks'), 'weeks') or [None]
+    configs = source.get('configs') if source is body else None
+    if configs is None:
+        configs = [{k: request.args[k] for k in BATCH_CONFIG_KEYS if k in request.args}]
+    if not isinstance(configs, list) or not all(isinstance(c, dict) for c in configs):
+        raise ValueError('configs must be a list of objects')
+    args = [
+        {k: (str(v).lower() if isinstance(v, bool) else str(v))
+         for k, v in config.items() if k in BATCH_CONFIG_KEYS and v is not None}
+        for config in configs
+    ]
+    unique = {
+        (year, week, tuple(sorted(a.items()))): BatchItem(year, week, a)
+        for year in years for week in weeks for a in args
+    }
+    items = list(unique.values())
+    if len(items) > BATCH_MAX_ITEMS:
+        raise ValueError(f'At most {BATCH_MAX_ITEMS} year/week/config combinations per batch')
+    detail = str(source.get('detail', 'false')).lower() == 'true'
+    return items, 'detail' if detail else 'list'
+
+
+@app.route('/rankings/batch', methods=['GET', 'POST'])
+def get_rankings_batch():
+    try:
+        items, variant = _batch_request()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    def generate():
+        # NDJSON: one line per item, in the order results resolve; a failed item
+        # gets its own error line and the rest of the batch continues
+        try:
+            for item, source, body in iter_rankings_batch(data_processor, items, variant):
+                head = serialize_rankings(
+                    {'year': item.year, 'week': item.week, 'config': item.args, 'source': source}
+                )[:-1]
+                if source == 'error':
+                    yield f'{head},"error":"An internal error occurred during ranking calculation."}}\n'.encode('utf-8')
+                elif body is None:
+                    yield f'{head},"error":"No game data found."}}\n'.encode('utf-8')
+                else:
+                    yield f'{head},"rankings":{body}}}\n'.encode('utf-8')
+        except Exception as e:
+            print(f"Error during batch rankings: {e}")
+            yield b'{"error":"An internal error occurred during ranking calculation."}\n'
+
+    return Response(generate(), mimetype='application/x-ndjson')
+
+
 @app.route('/rankings/team/<team_name>', methods=['GET'])
 def get_team_breakdown(team_name):
     try:
         year = request.args.get('year', default=2023, type=int)
         week = request.args.get('week', default=None, type=int)
+        # Archived default-config weeks: precomputed per-team shard, no solver work
+        shard = get_team_shard_body(year, week, team_name, request.args, _accepted_encodings())
+        if shard is not None:
+            return _static_response(shard)
         # Offline: serve static/slim. Online: prefer full payload for wins_details.
+        prefer_static = is_cfbd_offline()
+        variant = ('team', team_name.lower())
+        version = get_rankings_version(year, week, request.args, prefer_static=prefer_static)
+        if version is not None:
+            not_modified = _not_modified(_variant_etag(version, *variant), version.max_age)
+            if not_modified is not None:
+                return not_modified
+            # Default-config payloads carry every team's breakdown, serialized once per payload hash
+            breakdowns = get_team_breakdowns(version.digest)
+            body = team_breakdown_body(breakdowns, team_name) if breakdowns else None
+            if body is not None:
+                return _with_validators(_json_body(body), _variant_etag(version, *variant), version.max_age)
         data = get_or_calculate_rankings(
             data_processor,
             year,
             week,
             request.args,
-            prefer_static=is_cfbd_offline(),
+            prefer_static=prefer_static,
         )
         if not data:
             return jsonify({"error": f"No game data found for {year}."}), 404
+        version = version or _ensure_version(year, week, data, prefer_static)
 
         team_rankings = data.get('team_rankings', [])
-        team_index = None
-        team_data = None
-        for i, team in enumerate(team_rankings):
-            if team['team_name'].lower() == team_name.lower():
-                team_index = i
-                team_data = team
-                break
-        if team_data is None:
-            return jsonify({"error": f"Team '{team_name}' not found in rankings."}), 404
-
-        teams_ahead = [
-            {'rank': i + 1, **team_rankings[i]}
-            for i in range(max(0, team_index - 3), team_index)
-        ]
-        teams_behind = [
-            {'rank': i + 1, **team_rankings[i]}
-            for i in range(team_index + 1, min(len(team_rankings), team_index + 4))
-        ]
-
-        def build_comparison(target, other, target_rank, other_rank):
-            diff_final = target['final_ranking_score'] - other['final_ranking_score']
-            diff_tq = target['team_quality_score'] - other['team_quality_score']
-            diff_rec = target['record_score'] - other['record_score']
-            diff_cq = target['conference_quality_score'] - other['conference_quality_score']
-            diff_sos = target['sos'] - other['sos']
-            diff_sov = target['sov'] - other['sov']
-            factors = []
-            tq_contrib = diff_tq * 0.65
-            if abs(tq_contrib) > 5:
-                factors.append({
-                    'factor': 'Team Quality (Elo)',
-                    'advantage': 'target' if tq_contrib > 0 else 'other',
-                    'diff': abs(diff_tq),
-                    'contribution': abs(tq_contrib),
-                    'explanation': (
-                        f"{'Higher' if diff_tq > 0 else 'Lower'} Elo rating "
-                        f"({target['team_quality_score']:.0f} vs {other['team_quality_score']:.0f})"
-                    ),
-                })
-            rec_contrib = diff_rec * 0.27
-            if abs(rec_contrib) > 5:
-                factors.append({
-                    'factor': 'Record Score (Resume)',
-                    'advantage': 'target' if rec_contrib > 0 else 'other',
-                    'diff': abs(diff_rec),
-                    'contribution': abs(rec_contrib),
-                    'explanation': (
-                        f"{'Stronger' if diff_rec > 0 else 'Weaker'} resume "
-                        f"({target['record_score']:.0f} vs {other['record_score']:.0f})"
-                    ),
-                })
-            cq_contrib = diff_cq * 0.08
-            if abs(cq_contrib) > 2:
-                factors.append({
-                    'factor': 'Conference Quality',
-                    'advantage': 'target' if cq_contrib > 0 else 'other',
-                    'diff': abs(diff_cq),
-                    'contribution': abs(cq_contrib),
-                    'explanation': (
-                        f"{'Stronger' if diff_cq > 0 else 'Weaker'} conference "
-                        f"({target['conference']} vs {other['conference']})"
-                    ),
-                })
-            if abs(diff_sos) > 20:
-                factors.append({
-                    'factor': 'Strength of Schedule',
-                    'advantage': 'target' if diff_sos > 0 else 'other',
-                    'diff': abs(diff_sos),
-                    'contribution': 0,
-                    'explanation': (
-                        f"{'Tougher' if diff_sos > 0 else 'Easier'} schedule "
-                        f"(avg opp: {target['sos']:.0f} vs {other['sos']:.0f})"
-                    ),
-                })
-            if abs(diff_sov) > 20:
-                factors.append({
-                    'factor': 'Strength of Victory',
-                    'advantage': 'target' if diff_sov > 0 else 'other',
-                    'diff': abs(diff_sov),
-                    'contribution': 0,
-                    'explanation': (
-                        f"{'Better' if diff_sov > 0 else 'Weaker'} quality wins "
-                        f"(avg win opp: {target['sov']:.0f} vs {other['sov']:.0f})"
-                    ),
-                })
-            factors.sort(key=lambda x: x['contribution'], reverse=True)
-            return {
-                'other_team': other['team_name'],
-                'other_rank': other_rank,
-                'other_conference': other['conference'],
-                'other_record': f"{other['records']['total_wins']}-{other['records']['total_losses']}",
-                'score_diff': diff_final,
-                'factors': factors,
-            }
-
-        comparisons_ahead = []
-        for t in teams_ahead:
-            comp = build_comparison(team_data, t, team_index + 1, t['rank'])
-            comp['direction'] = 'ahead'
-            comparisons_ahead.append(comp)
-        comparisons_behind = []
-        for t in teams_behind:
-            comp = build_comparison(team_data, t, team_index + 1, t['rank'])
-            comp['direction'] = 'behind'
-            comparisons_behind.append(comp)
-
-        response = {
-            'team': {
-                'rank': team_index + 1,
-                'name': team_data['team_name'],
-                'conference': team_data['conference'],
-                'record': f"{team_data['records']['total_wins']}-{team_data['records']['total_losses']}",
-                'conf_record': f"{team_data['records']['conf_wins']}-{team_data['records']['conf_losses']}",
-                'final_score': team_data['final_ranking_score'],
-                'team_quality': team_data['team_quality_score'],
-                'record_score': team_data['record_score'],
-                'conference_quality': team_data['conference_quality_score'],
-                'sos': team_data['sos'],
-                'sov': team_data['sov'],
-                'power_record': f"{team_data['records']['power_wins']}-{team_data['records']['power_losses']}",
-                'g5_record': f"{team_data['records']['group_five_wins']}-{team_data['records']['group_five_losses']}",
-                'logo': team_data.get('logo'),
-                'color': team_data.get('color'),
-            },
-            'formula_breakdown': {
-                'tq_contribution': team_data['team_quality_score'] * 0.65,
-                'rec_contribution': team_data['record_score'] * 0.27,
-                'cq_contribution': team_data['conference_quality_score'] * 0.08,
-                'total': team_data['final_ranking_score'],
-            },
-            'wins_details': team_data.get('wins_details') or [],
-            'losses_details': team_data.get('losses_details') or [],
-            'quality_wins': team_data.get('quality_wins'),
-            'quality_losses': team_data.get('quality_losses'),
-            'bad_losses': team_data.get('bad_losses'),
-            'top_10_wins': team_data.get('top_10_wins'),
-            'top_25_wins': team_data.get('top_25_wins'),
-            'comparisons_ahead': comparisons_ahead,
-            'comparisons_behind': comparisons_behind,
-            'path_to_climb': compute_path_to_climb(
-                team_data,
-                team_rankings[team_index - 1] if team_index > 0 else None,
-            ),
-        }
-        return jsonify(response)
+        row = find_team(team_rankings, team_name)
+        if row is None:
+            return jsonify({
+                "error": f"Team '{team_name}' not found in rankings.",
+                "suggestions": suggest_teams(team_rankings, team_name),
+            }), 404
+        response = build_team_breakdown(team_rankings, row)
+        return _with_validators(jsonify(response), _variant_etag(version, *variant), version.max_age)
+    except TeamRegistryUnavailable:
+        raise
     except Exception as e:
         print(f"Error during team breakdown: {e}")
         return jsonify({"error": "An internal error occurred during team breakdown."}), 500
 
 
+def _history_response(name, kind, weeks, year):
+    if not weeks:
+        return jsonify({"error": f"No ranking history for {kind} '{name}' in {year}."}), 404
+    # Live weeks can still be recomputed, so only a short shared cache
+    response = jsonify({kind: weeks[-1][f'{kind}_name'], 'year': year, 'weeks': weeks})
+    response.headers['Cache-Control'] = 'public, max-age=300'
+    return response
+
+
+@app.route('/rankings/team/<team_name>/history', methods=['GET'])
+def get_team_history(team_name):
+    try:
+        year = request.args.get('year', default=2023, type=int)
+        weeks = get_rankings_history().team_history(team_name, year)
+        for week in weeks:
+            wins, losses = week.pop('wins'), week.pop('losses')
+            week['record'] = f"{wins}-{losses}" if wins is not None else None
+        return _history_response(team_name, 'team', weeks, year)
+    except Exception as e:
+        print(f"Error during team history: {e}")
+        return jsonify({"error": "An internal error occurred during team history."}), 500
+
+
+@app.route('/rankings/conference/<conference_name>/history', methods=['GET'])
+def get_conference_history(conference_name):
+    try:
+        year = request.args.get('year', default=2023, type=int)
+        weeks = get_rankings_history().conference_history(conference_name, year)
+        return _history_response(conference_name, 'conference', weeks, year)
+    except Exception as e:
+        print(f"Error during conference history: {e}")
+        return jsonify({"error": "An internal error occurred during conference history."}), 500
+
+
+@app.route('/rankings/compare', methods=['GET'])
+def compare_rankings():
+    # numpy stays off the import path of app
+    from team_compare import MAX_COMPARE_TEAMS, compare_teams
+
+    try:
+        year = request.args.get('year', default=2023, type=int)
+        week = request.args.get('week', default=None, type=int)
+        names = [name for name in request.args.get('teams', '').split(',') if normalize_team_name(name)]
+        top = request.args.get('top', default=None, type=int)
+        if bool(names) == (top is not None):
+            return jsonify({"error": "Provide either teams or top."}), 400
+        if not 2 <= (top or len(names)) <= MAX_COMPARE_TEAMS:
+            return jsonify({"error": f"Compare between 2 and {MAX_COMPARE_TEAMS} teams."}), 400
+        # ?teams=A,B,C (names or aliases) or ?top=N; component scores are all in the slim list
+        variant = ('compare', ','.join(normalize_team_name(name) for name in names) or f'top={top}')
+        version = get_rankings_version(year, week, request.args, prefer_static=True)
+        if version is not None:
+            not_modified = _not_modified(_variant_etag(version, *variant), version.max_age)
+            if not_modified is not None:
+                return not_modified
+        data = get_or_calculate_rankings(data_processor, year, week, request.args, prefer_static=True)
+        if not data:
+            return jsonify({"error": f"No game data found for {year}."}), 404
+        version = version or _ensure_version(year, week, data, True)
+
+        team_rankings = data.get('team_rankings', [])
+        if top is not None:
+            rows = list(range(min(top, len(team_rankings))))
+        else:
+            rows = [find_team(team_rankings, name) for name in names]
+            missing = [name for name, row in zip(names, rows) if row is None]
+            if missing:
+                return jsonify({
+                    "error": f"Teams not found in rankings: {', '.join(missing)}.",
+                    "suggestions": {name: suggest_teams(team_rankings, name) for name in missing},
+                }), 404
+            rows = list(dict.fromkeys(rows))
+        response = jsonify({'year': year, 'week': data.get('week', week), **compare_teams(team_rankings, rows)})
+        return _with_validators(response, _variant_etag(version, *variant), version.max_age)
+    except TeamRegistryUnavailable:
+        raise
+    except Exception as e:
+        print(f"Error during team comparison: {e}")
+        return jsonify({"error": "An internal error occurred during team comparison."}), 500
+
+
+@app.route('/rankings/whatif', methods=['POST'])
+def get_whatif_rankings():
+    try:
+        # Body {"games": [{"winner", "loser", "week"?, "home"?, "winner_score"?, "loser_score"?}], "limit"?};
+        # year, week and config params come from the query string, as for /rankings
+        year = request.args.get('year', default=2023, type=int)
+        week = request.args.get('week', default=None, type=int)
+        body = request.get_json(silent=True)
+        if not isinstance(body, dict):
+            return jsonify({"error": "Expected a JSON body with games."}), 400
+        try:
+            scenario = parse_scenario(body.get('games'))
+            limit = min(max(int(body.get('limit', WHATIF_DIFF_LIMIT)), 1), 200)
+            result = run_whatif(data_processor, year, week, request.args, scenario, limit)
+        except TeamNotFoundError as e:
+            return jsonify({"error": str(e), "suggestions": e.suggestions}), 404
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        if result is None:
+            return jsonify({"error": f"No game data found for {year}."}), 404
+        return jsonify(result)
+    except TeamRegistryUnavailable:
+        raise
+    except Exception as e:
+        print(f"Error during what-if rankings: {e}")
+        return jsonify({"error": "An internal error occurred during what-if rankings."}), 500
+
+
+@app.route('/rankings/teams/autocomplete', methods=['GET'])
+def autocomplete_teams():
+    try:
+        year = request.args.get('year', default=2023, type=int)
+        week = request.args.get('week', default=None, type=int)
+        prefix = request.args.get('q', '')
+        if not normalize_team_name(prefix):
+            return jsonify({"error": "q is required."}), 400
+        limit = min(max(request.args.get('limit', AUTOCOMPLETE_LIMIT, type=int), 1), 50)
+        # Names, ranks and logos are all in the slim list payload
+        variant = ('autocomplete', normalize_team_name(prefix), str(limit))
+        version = get_rankings_version(year, week, request.args, prefer_static=True)
+        if version is not None:
+            not_modified = _not_modified(_variant_etag(version, *variant), version.max_age)
+            if not_modified is not None:
+                return not_modified
+        data = get_or_calculate_rankings(data_processor, year, week, request.args, prefer_static=True)
+        if not data:
+            return jsonify({"error": f"No game data found for {year}."}), 404
+        version = version or _ensure_version(year, week, data, True)
+
+        team_rankings = data.get('team_rankings', [])
+        teams = [
+            {
+                'team_name': team_rankings[i]['team_name'],
+                'rank': i + 1,
+                'conference': team_rankings[i].get('conference'),
+                'logo': team_rankings[i].get('logo'),
+            }
+            for i in team_index(team_rankings).complete(prefix, limit)
+        ]
+        response = jsonify({'query': prefix, 'year': year, 'week': data.get('week', week), 'teams': teams})
+        return _with_validators(response, _variant_etag(version, *variant), version.max_age)
+    except TeamRegistryUnavailable:
+        raise
+    except Exception as e:
+        print(f"Error during team autocomplete: {e}")
+        return jsonify({"error": "An internal error occurred during team autocomplete."}), 500
+
+
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5001))
     debug_mode = os.environ.get('FLASK_DEBUG', 'false').lower() == 'true'
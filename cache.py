@@ -3,7 +3,6 @@ Pluggable cache backends for CFB Rankings API.
 Default: file + memory. Optional: R2 when CACHE_BACKEND=r2 and R2 credentials set.
 """
 import os
-import json
 import hashlib
 import time
 from abc import ABC, abstractmethod
@@ -12,6 +11,8 @@ from typing import Any, Optional, Dict, List
 from functools import wraps
 import threading
 
+import fast_json
+
 CACHE_DIR = os.environ.get('CACHE_DIR', os.path.join(os.path.dirname(__file__), '.cache'))
 
 TTL_TEAMS = 24 * 60 * 60
@@ -53,11 +54,11 @@ class FileCacheBackend(CacheBackend):
             return None
         try:
             with open(path, 'r', encoding='utf-8') as f:
-                entry = json.load(f)
+                entry = fast_json.load(f)
             if entry['expires_at'] > time.time():
                 return entry['data']
             os.remove(path)
-        except (json.JSONDecodeError, IOError, KeyError, OSError):
+        except (fast_json.JSONDecodeError, IOError, KeyError, OSError):
             try:
                 os.remove(path)
             except OSError:
@@ -68,7 +69,7 @@ class FileCacheBackend(CacheBackend):
         entry = {'data': data, 'expires_at': time.time() + ttl, 'created_at': time.time()}
         try:
             with open(self._path(key), 'w', encoding='utf-8') as f:
-                json.dump(entry, f)
+                fast_json.dump(entry, f)
         except (IOError, TypeError) as e:
             print(f"Cache write error for {key}: {e}")
 
@@ -110,7 +111,7 @@ class R2CacheBackend(FileCacheBackend):
         if self._client and self._bucket:
             try:
                 obj = self._client.get_object(Bucket=self._bucket, Key=f"cache/{key}.json")
-                entry = json.loads(obj['Body'].read().decode('utf-8'))
+                entry = fast_json.loads(obj['Body'].read())
                 if entry['expires_at'] > time.time():
                     return entry['data']
                 self._client.delete_object(Bucket=self._bucket, Key=f"cache/{key}.json")
@@ -125,7 +126,7 @@ class R2CacheBackend(FileCacheBackend):
                 self._client.put_object(
                     Bucket=self._bucket,
                     Key=f"cache/{key}.json",
-                    Body=json.dumps(entry).encode('utf-8'),
+                    Body=fast_json.dumps_bytes(entry),
                 )
             except Exception as e:
                 print(f"R2 cache write error: {e}")
@@ -156,15 +157,15 @@ class Cache:
         try:
             if os.path.exists(self._index_path):
                 with open(self._index_path, 'r', encoding='utf-8') as f:
-                    self._prefix_index = json.load(f)
-        except (json.JSONDecodeError, IOError):
+                    self._prefix_index = fast_json.load(f)
+        except (fast_json.JSONDecodeError, IOError):
             self._prefix_index = {}
 
     def _save_index(self) -> None:
         try:
             os.makedirs(os.path.dirname(self._index_path), exist_ok=True)
             with open(self._index_path, 'w', encoding='utf-8') as f:
-                json.dump(self._prefix_index, f)
+                fast_json.dump(self._prefix_index, f)
         except IOError as e:
             print(f"Cache index write error: {e}")
 
@@ -204,6 +205,27 @@ class Cache:
             if prefix:
                 self._register_key(prefix, key)
 
+    def export_memory(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Unexpired memory entries for keys (data + expires_at), for warm-state snapshots."""
+        now = time.time()
+        with self._lock:
+            return {
+                key: {'data': entry['data'], 'expires_at': entry['expires_at']}
+                for key in keys
+                if (entry := self._memory_cache.get(key)) and entry['expires_at'] > now
+            }
+
+    def seed_memory(self, entries: Dict[str, Dict[str, Any]]) -> int:
+        """Load exported entries into the memory layer only; returns how many were live."""
+        now = time.time()
+        seeded = 0
+        with self._lock:
+            for key, entry in entries.items():
+                if entry.get('expires_at', 0) > now and key not in self._memory_cache:
+                    self._memory_cache[key] = {'data': entry['data'], 'expires_at': entry['expires_at']}
+                    seeded += 1
+        return seeded
+
     def invalidate(self, key: str) -> None:
         with self._lock:
             self._memory_cache.pop(key, None)
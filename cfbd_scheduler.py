@@ -0,0 +1,304 @@
+"""
+Budget-aware scheduler for live CFBD requests.
+
+Every live call goes through one process-wide CFBDScheduler that:
+  - rate limits with a token bucket (CFBD_RATE_PER_SEC / CFBD_BURST),
+  - serves waiting callers by priority class: interactive > agent > precompute,
+  - slows down as CFBD's X-CallLimit-Remaining shrinks and refuses lower
+    classes once the remaining quota hits their reserve floor,
+  - records calls per day in a SQLite ledger shared by all workers.
+
+Callers pick a class with `with cfbd_priority('agent'): ...`; unmarked calls
+are interactive.
+"""
+from __future__ import annotations
+
+import contextvars
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from cache import CACHE_DIR
+from spend_guards import CFBDOfflineError
+
+PRIORITY_INTERACTIVE = 'interactive'
+PRIORITY_AGENT = 'agent'
+PRIORITY_PRECOMPUTE = 'precompute'
+PRIORITIES = (PRIORITY_INTERACTIVE, PRIORITY_AGENT, PRIORITY_PRECOMPUTE)
+_PRIORITY_ORDER = {name: i for i, name in enumerate(PRIORITIES)}
+
+_current_priority: contextvars.ContextVar[str] = contextvars.ContextVar(
+    'cfbd_priority', default=PRIORITY_INTERACTIVE
+)
+
+
+class CFBDQuotaReservedError(CFBDOfflineError):
+    """Raised when remaining CFBD quota is reserved for a higher priority class."""
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.environ.get(name, '').strip()
+    if raw:
+        try:
+            return max(0.0, float(raw))
+        except ValueError:
+            pass
+    return default
+
+
+def _env_int(name: str) -> Optional[int]:
+    raw = os.environ.get(name, '').strip()
+    if raw:
+        try:
+            return max(0, int(raw))
+        except ValueError:
+            return None
+    return None
+
+
+def current_priority() -> str:
+    return _current_priority.get()
+
+
+@contextmanager
+def cfbd_priority(priority: str) -> Iterator[None]:
+    """Tag CFBD calls made inside the block with a priority class."""
+    if priority not in _PRIORITY_ORDER:
+        raise ValueError(f'Unknown CFBD priority {priority!r}; expected one of {PRIORITIES}')
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+class CallLedger:
+    """Per-day CFBD call counts and last-seen quota, shared across workers via SQLite."""
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS cfbd_calls ('
+                'day TEXT NOT NULL, priority TEXT NOT NULL, calls INTEGER NOT NULL, '
+                'PRIMARY KEY (day, priority))'
+            )
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS cfbd_quota ('
+                'id INTEGER PRIMARY KEY CHECK (id = 1), remaining INTEGER, observed_at REAL)'
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=5.0)
+
+    @staticmethod
+    def today() -> str:
+        return datetime.now(timezone.utc).strftime('%Y-%m-%d')
+
+    def record_call(self, priority: str, day: Optional[str] = None) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                'INSERT INTO cfbd_calls (day, priority, calls) VALUES (?, ?, 1) '
+                'ON CONFLICT(day, priority) DO UPDATE SET calls = calls + 1',
+                (day or self.today(), priority),
+            )
+
+    def record_remaining(self, remaining: int) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                'INSERT INTO cfbd_quota (id, remaining, observed_at) VALUES (1, ?, ?) '
+                'ON CONFLICT(id) DO UPDATE SET remaining = excluded.remaining, '
+                'observed_at = excluded.observed_at',
+                (remaining, time.time()),
+            )
+
+    def calls_for_day(self, day: Optional[str] = None) -> Dict[str, int]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                'SELECT priority, calls FROM cfbd_calls WHERE day = ?',
+                (day or self.today(),),
+            ).fetchall()
+        return {priority: calls for priority, calls in rows}
+
+    def last_remaining(self, max_age: float = 24 * 60 * 60) -> Optional[int]:
+        """Last X-CallLimit-Remaining any worker saw; stale readings are ignored."""
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT remaining, observed_at FROM cfbd_quota WHERE id = 1'
+            ).fetchone()
+        if not row or time.time() - row[1] > max_age:
+            return None
+        return row[0]
+
+
+class CFBDScheduler:
+    """Token bucket with priority admission and quota-aware slowdown."""
+
+    def __init__(
+        self,
+        rate_per_sec: Optional[float] = None,
+        burst: Optional[float] = None,
+        ledger: Optional[CallLedger] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate = rate_per_sec if rate_per_sec is not None else _env_float('CFBD_RATE_PER_SEC', 10.0)
+        self.burst = burst if burst is not None else _env_float('CFBD_BURST', 20.0)
+        self.ledger = ledger or CallLedger(
+            os.environ.get('CFBD_LEDGER_PATH', os.path.join(CACHE_DIR, 'cfbd_ledger.sqlite3'))
+        )
+        self._clock = clock
+        self._tokens = self.burst
+        self._refilled_at = clock()
+        self._cond = threading.Condition()
+        self._waiting = {name: 0 for name in PRIORITIES}
+        self._remaining: Optional[int] = self.ledger.last_remaining()
+
+    # --- quota policy -----------------------------------------------------
+
+    @staticmethod
+    def reserve_floor(priority: str) -> int:
+        """Remaining-quota floor below which this class is refused."""
+        defaults = {
+            PRIORITY_PRECOMPUTE: ('CFBD_PRECOMPUTE_FLOOR', 200),
+            PRIORITY_AGENT: ('CFBD_AGENT_FLOOR', 50),
+        }
+        if priority not in defaults:
+            return 0
+        name, default = defaults[priority]
+        floor = _env_int(name)
+        return default if floor is None else floor
+
+    def effective_rate(self) -> float:
+        """Full rate above CFBD_SLOWDOWN_AT remaining calls, scaled down linearly below it."""
+        slowdown_at = _env_int('CFBD_SLOWDOWN_AT')
+        if slowdown_at is None:
+            slowdown_at = 500
+        if self._remaining is None or self._remaining >= slowdown_at:
+            return self.rate
+        return self.rate * max(0.1, self._remaining / slowdown_at)
+
+    def _daily_usage(self) -> Optional[Dict[str, int]]:
+        """Today's ledger counts when CFBD_DAILY_MAX_CALLS is set (read outside the lock)."""
+        if _env_int('CFBD_DAILY_MAX_CALLS') is None:
+            return None
+        return self.ledger.calls_for_day()
+
+    def _check_quota(self, priority: str, used: Optional[Dict[str, int]]) -> None:
+        if self._remaining is not None and self._remaining <= self.reserve_floor(priority):
+            raise CFBDQuotaReservedError(
+                f'CFBD quota low ({self._remaining} remaining); {priority} calls are '
+                f'reserved below {self.reserve_floor(priority)}.'
+            )
+        daily_max = _env_int('CFBD_DAILY_MAX_CALLS')
+        if daily_max is None or used is None:
+            return
+        total = sum(used.values())
+        if total >= daily_max:
+            raise CFBDQuotaReservedError(f'CFBD daily call cap reached ({total}/{daily_max}).')
+        if priority == PRIORITY_PRECOMPUTE:
+            share = _env_float('CFBD_PRECOMPUTE_DAILY_SHARE', 0.5)
+            if used.get(PRIORITY_PRECOMPUTE, 0) >= int(daily_max * share):
+                raise CFBDQuotaReservedError(
+                    f'CFBD precompute share of the daily cap used ({int(daily_max * share)}).'
+                )
+
+    # --- token bucket -----------------------------------------------------
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.effective_rate())
+        self._refilled_at = now
+
+    def _outranked(self, priority: str) -> bool:
+        rank = _PRIORITY_ORDER[priority]
+        return any(self._waiting[p] for p in PRIORITIES[:rank])
+
+    def acquire(self, priority: Optional[str] = None, timeout: Optional[float] = None) -> str:
+        """
+        Block until a token is available for this priority class.
+
+        Higher classes waiting at the same time are always served first.
+        Raises CFBDQuotaReservedError when quota is reserved for higher classes
+        or the wait exceeds timeout.
+        """
+        priority = priority or current_priority()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        # Ledger I/O stays outside the lock so waiters don't queue behind disk
+        used = self._daily_usage()
+        with self._cond:
+            self._check_quota(priority, used)
+            self._waiting[priority] += 1
+            try:
+                while True:
+                    self._refill()
+                    if self._tokens >= 1 and not self._outranked(priority):
+                        self._tokens -= 1
+                        return priority
+                    rate = self.effective_rate()
+                    wait = (1 - self._tokens) / rate if rate > 0 and self._tokens < 1 else 0.05
+                    if deadline is not None:
+                        left = deadline - time.monotonic()
+                        if left <= 0:
+                            raise CFBDQuotaReservedError(
+                                f'Timed out waiting for a CFBD {priority} slot.'
+                            )
+                        wait = min(wait, left)
+                    self._cond.wait(max(wait, 0.001))
+            finally:
+                self._waiting[priority] -= 1
+                self._cond.notify_all()
+
+    def record_call(self, priority: str, remaining: Optional[str] = None) -> None:
+        """Ledger a sent live call (failed ones count too) and absorb the X-CallLimit-Remaining header."""
+        try:
+            self.ledger.record_call(priority)
+            if remaining is not None and str(remaining).strip().lstrip('-').isdigit():
+                value = int(remaining)
+                with self._cond:
+                    self._remaining = value
+                    self._cond.notify_all()
+                self.ledger.record_remaining(value)
+        except sqlite3.Error as e:
+            print(f"CFBD ledger write error: {e}")
+
+    def status(self) -> Dict[str, Any]:
+        with self._cond:
+            self._refill()
+            tokens = self._tokens
+            waiting = dict(self._waiting)
+        try:
+            calls_today = self.ledger.calls_for_day()
+        except sqlite3.Error:
+            calls_today = {}
+        return {
+            'rate_per_sec': self.rate,
+            'effective_rate_per_sec': round(self.effective_rate(), 3),
+            'tokens': round(tokens, 2),
+            'waiting': waiting,
+            'quota_remaining': self._remaining,
+            'calls_today': calls_today,
+        }
+
+
+_scheduler: Optional[CFBDScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> CFBDScheduler:
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = CFBDScheduler()
+        return _scheduler
+
+
+def reset_scheduler(scheduler: Optional[CFBDScheduler] = None) -> None:
+    """Swap the process scheduler (tests / benchmarks)."""
+    global _scheduler
+    with _scheduler_lock:
+        _scheduler = scheduler
@@ -0,0 +1,117 @@
+"""
+Columnar wire format for the rankings list (`/rankings?format=columnar`).
+
+Instead of one object per team, each table is sent as one array per field:
+
+    {"format": "columnar", "version": 1, "precision": 3, "year": ..., "week": ...,
+     "team_rankings": {"length": 136, "columns": {
+         "team_name": ["Alabama", ...],
+         "conference": {"dict": ["SEC", ...], "codes": [0, ...]},
+         "records.total_wins": [4, ...], ...}},
+     "conference_rankings": {...}}
+
+Nested dicts flatten to dotted column names, floats are rounded to
+`precision` decimals, and low-cardinality string columns (conference names,
+conference types) are dictionary-encoded (code -1 = null). Fields missing
+from a row decode as null, and a nested field that is null (or empty) in
+some rows is an empty record there: its leaves decode as null. frontend/src/lib/api.ts has the matching decoder.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+COLUMNAR_FORMAT = 'columnar'
+COLUMNAR_VERSION = 1
+DEFAULT_PRECISION = 3
+MAX_PRECISION = 6
+TABLES = ('team_rankings', 'conference_rankings')
+
+
+def is_columnar(doc: Any) -> bool:
+    return isinstance(doc, dict) and doc.get('format') == COLUMNAR_FORMAT
+
+
+def _flatten(row: Dict[str, Any], prefix: str = '') -> Dict[str, Any]:
+    flat: Dict[str, Any] = {}
+    for key, value in row.items():
+        name = f'{prefix}{key}'
+        if isinstance(value, dict) and value:
+            flat.update(_flatten(value, f'{name}.'))
+        else:
+            flat[name] = value
+    return flat
+
+
+def _round(value: Any, precision: int) -> Any:
+    if isinstance(value, float):
+        value = round(value, precision)
+        return int(value) if value.is_integer() else value
+    return value
+
+
+def _encode_column(values: List[Any], precision: int) -> Any:
+    if all(v is None or isinstance(v, str) for v in values):
+        distinct: Dict[str, int] = {}
+        for v in values:
+            if v is not None and v not in distinct:
+                distinct[v] = len(distinct)
+        if len(values) > 1 and len(distinct) * 2 <= len(values):
+            return {'dict': list(distinct), 'codes': [-1 if v is None else distinct[v] for v in values]}
+        return values
+    return [_round(v, precision) for v in values]
+
+
+def encode_table(rows: List[Dict[str, Any]], precision: int = DEFAULT_PRECISION) -> Dict[str, Any]:
+    flat_rows = [_flatten(row) for row in rows]
+    names: Dict[str, None] = {}
+    for row in flat_rows:
+        names.update(dict.fromkeys(row))
+    # Nested in some rows, null or {} in others: keep the leaf columns only
+    parents = {name.rsplit('.', i)[0] for name in names for i in range(1, name.count('.') + 1)}
+    for name in parents.intersection(names):
+        if all(row.get(name) in (None, {}) for row in flat_rows):
+            del names[name]
+    return {
+        'length': len(flat_rows),
+        'columns': {
+            name: _encode_column([row.get(name) for row in flat_rows], precision)
+            for name in names
+        },
+    }
+
+
+def decode_table(table: Dict[str, Any]) -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = [{} for _ in range(table['length'])]
+    for name, column in table['columns'].items():
+        if isinstance(column, dict):
+            lookup = column['dict']
+            values = [None if code < 0 else lookup[code] for code in column['codes']]
+        else:
+            values = column
+        *parents, leaf = name.split('.')
+        for row, value in zip(rows, values):
+            target = row
+            for parent in parents:
+                if not isinstance(target.get(parent), dict):
+                    target[parent] = {}
+                target = target[parent]
+            if (value is None or value == {}) and isinstance(target.get(leaf), dict):
+                continue
+            target[leaf] = value
+    return rows
+
+
+def encode_columnar(payload: Dict[str, Any], precision: int = DEFAULT_PRECISION) -> Dict[str, Any]:
+    """Columnar form of a slim rankings payload (other top-level fields pass through)."""
+    doc = {k: v for k, v in payload.items() if k not in TABLES}
+    doc.update({'format': COLUMNAR_FORMAT, 'version': COLUMNAR_VERSION, 'precision': precision})
+    for table in TABLES:
+        doc[table] = encode_table(payload.get(table) or [], precision)
+    return doc
+
+
+def decode_columnar(doc: Dict[str, Any]) -> Dict[str, Any]:
+    payload = {k: v for k, v in doc.items() if k not in TABLES + ('format', 'version', 'precision')}
+    for table in TABLES:
+        payload[table] = decode_table(doc[table]) if table in doc else []
+    return payload
@@ -1,7 +1,13 @@
 # filepath: c:\Users\micha\DevProjects\CFB-Ranking-System\data_processor.py
+import os
 from typing import List, Dict, Any, Optional
+import contextvars
+import threading
 from collections import defaultdict
-from api_integration import CFBDApiClient
+from concurrent.futures import ThreadPoolExecutor
+from api_integration import CFBDApiClient, cfbd_fetch_concurrency
+from game_store import GameStore
+from spend_guards import is_cfbd_offline
 
 # --- Conference Classification Constants ---
 POWER_4_CONFERENCES = {
@@ -11,36 +17,133 @@ GROUP_OF_5_CONFERENCES = {
     "American Athletic", "Conference USA", "Mid-American", "Mountain West", "Sun Belt"
 }
 
+def team_registry_timeout() -> float:
+    """Seconds a request waits on a still-warming team registry (TEAM_REGISTRY_TIMEOUT)."""
+    raw = os.environ.get('TEAM_REGISTRY_TIMEOUT', '').strip()
+    if raw:
+        try:
+            return max(0.0, float(raw))
+        except ValueError:
+            pass
+    return 20.0
+
+
+class TeamRegistryUnavailable(RuntimeError):
+    """Raised when the lazily warmed team registry is not ready within the timeout."""
+
+
 class CFBDataProcessor:
     """
     Handles fetching, cleaning, and organizing college football game data.
     """
     
-    def __init__(self, api_key: Optional[str] = None, api_client: Optional[CFBDApiClient] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_client: Optional[CFBDApiClient] = None,
+        lazy_registry: bool = False,
+    ):
         """
         Initialize the data processor.
         
         Args:
             api_key: CFBD API key (used if api_client is not provided)
-            api_client: Existing CFBDApiClient instance
+            api_client: Existing CFBDApiClient instance (or SnapshotApiClient);
+                when omitted and CFBD_SNAPSHOT_DIR is set, snapshots are used
+            lazy_registry: Don't load the team registry now; it is loaded on
+                first use or warmed in the background via warm_registry_async()
         """
         if api_client:
             self.api_client = api_client
+        elif os.environ.get('CFBD_SNAPSHOT_DIR'):
+            # Fully offline: serve games and teams from columnar season snapshots
+            from season_snapshot import SnapshotApiClient
+            self.api_client = SnapshotApiClient(os.environ['CFBD_SNAPSHOT_DIR'])
         else:
             self.api_client = CFBDApiClient(api_key=api_key)
             
-        self.team_conference_map = {}
-        self.team_info_map = {}  # Full team info including logos
-        self._initialize_conference_map()
+        self._team_conference_map: Dict[str, Any] = {}
+        self._team_info_map: Dict[str, Dict[str, Any]] = {}  # Full team info including logos
+        self._registry_ready = threading.Event()
+        self._registry_lock = threading.Lock()
+        self._registry_thread: Optional[threading.Thread] = None
+        if not lazy_registry:
+            self._load_registry()
 
     def _initialize_conference_map(self):
         """Fetch and store team conference mappings and full team info."""
-        self.team_info_map = self.api_client.get_teams_with_logos()
+        team_info = self.api_client.get_teams_with_logos()
+        self.team_info_map = team_info
         self.team_conference_map = {
             team: info['conference'] 
-            for team, info in self.team_info_map.items()
+            for team, info in team_info.items()
         }
 
+    def _load_registry(self) -> None:
+        try:
+            self._initialize_conference_map()
+        except Exception as e:
+            print(f"Team registry load failed: {e}")
+        finally:
+            self._registry_ready.set()
+
+    def seed_registry(self, team_info: Dict[str, Dict[str, Any]]) -> bool:
+        """Install a team registry loaded elsewhere (warm-state boot); False if already loaded."""
+        with self._registry_lock:
+            if self._registry_ready.is_set() or self._registry_thread is not None:
+                return False
+            self.team_info_map = team_info
+            self.team_conference_map = {
+                team: info.get('conference') for team, info in team_info.items()
+            }
+            self._registry_ready.set()
+            return True
+
+    @property
+    def registry_ready(self) -> bool:
+        return self._registry_ready.is_set()
+
+    def warm_registry_async(self) -> None:
+        """Start loading the team registry on a background thread (idempotent)."""
+        with self._registry_lock:
+            if self._registry_ready.is_set() or self._registry_thread is not None:
+                return
+            self._registry_thread = threading.Thread(
+                target=self._load_registry, name='team-registry-warm', daemon=True
+            )
+            self._registry_thread.start()
+
+    def wait_for_registry(self, timeout: Optional[float] = None) -> bool:
+        """Block until the team registry is loaded; False if still warming after timeout."""
+        if self._registry_ready.is_set():
+            return True
+        self.warm_registry_async()
+        return self._registry_ready.wait(team_registry_timeout() if timeout is None else timeout)
+
+    def _require_registry(self) -> None:
+        if not self.wait_for_registry():
+            raise TeamRegistryUnavailable(
+                f'Team registry still loading after {team_registry_timeout():.0f}s'
+            )
+
+    @property
+    def team_info_map(self) -> Dict[str, Dict[str, Any]]:
+        self._require_registry()
+        return self._team_info_map
+
+    @team_info_map.setter
+    def team_info_map(self, value: Dict[str, Dict[str, Any]]) -> None:
+        self._team_info_map = value
+
+    @property
+    def team_conference_map(self) -> Dict[str, Any]:
+        self._require_registry()
+        return self._team_conference_map
+
+    @team_conference_map.setter
+    def team_conference_map(self, value: Dict[str, Any]) -> None:
+        self._team_conference_map = value
+
     def get_team_logo(self, team_name: str) -> Optional[str]:
         """Get the primary logo URL for a team."""
         info = self.team_info_map.get(team_name, {})
@@ -74,13 +177,27 @@ class CFBDataProcessor:
 
         When through_week is set and use_week_scoped_fetch is True, fetches
         week-by-week via CFBD week param instead of downloading the full season.
+        Cache misses for those weeks are fetched concurrently (bounded by
+        CFBD_FETCH_CONCURRENCY) over the client's pooled session.
         """
         raw_games: List[Dict[str, Any]] = []
 
+        store = self._game_store()
         if through_week and use_week_scoped_fetch:
-            for week_num in range(1, through_week + 1):
-                week_games = self.api_client.get_games(year=year, week=week_num)
-                raw_games.extend(week_games)
+            weeks = list(range(1, through_week + 1))
+            plan = self._plan_weeks(store, year, weeks)
+            if plan is not None and plan['source'] == 'store':
+                # Every week already covered: one indexed range query
+                raw_games = store.get_games(year, through_week=through_week)
+            elif plan is not None and plan['source'] == 'season':
+                # One full-season call is cheaper than fetching each missing week
+                raw_games = [
+                    g for g in self.api_client.get_games(year=year)
+                    if g['week'] is not None and g['week'] <= through_week
+                ]
+            else:
+                for week_games in self._fetch_weeks(year, weeks):
+                    raw_games.extend(week_games)
         else:
             raw_games = self.api_client.get_games(year=year)
             if through_week:
@@ -96,8 +213,54 @@ class CFBDataProcessor:
 
         return self._process_raw_games(raw_games)
 
+    def _game_store(self) -> Optional[GameStore]:
+        """The client's local game store, when it has one (mocks and stubs may not)."""
+        store = getattr(self.api_client, 'game_store', None)
+        return store if isinstance(store, GameStore) else None
+
+    @staticmethod
+    def _plan_weeks(store: Optional[GameStore], year: int, weeks: List[int]) -> Optional[Dict[str, Any]]:
+        """Pick the fewest-CFBD-calls source for a week range and log the savings."""
+        if store is None or is_cfbd_offline():
+            # Offline every source is local; per-week reads also see legacy cache blobs
+            return None
+        plan = store.plan_weeks(year, weeks)
+        print(
+            f"GAMES PLAN: {year} weeks {weeks[0]}-{weeks[-1]} via {plan['source']} "
+            f"calls={plan['calls']} (week-by-week {plan['naive_calls']}, "
+            f"saved {plan['naive_calls'] - plan['calls']})"
+        )
+        return plan
+
+    def _fetch_weeks(self, year: int, weeks: List[int], season_type: str = 'regular') -> List[List[Dict[str, Any]]]:
+        """Fetch several weeks with bounded concurrency; results keep week order."""
+        workers = min(cfbd_fetch_concurrency(), len(weeks))
+        if workers <= 1:
+            return [
+                self.api_client.get_games(year=year, week=w, season_type=season_type)
+                for w in weeks
+            ]
+        # Each task runs in a copy of the caller's context so the CFBD priority class follows it
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='cfbd-week') as pool:
+            futures = [
+                pool.submit(
+                    contextvars.copy_context().run,
+                    self.api_client.get_games,
+                    year=year,
+                    week=w,
+                    season_type=season_type,
+                )
+                for w in weeks
+            ]
+            return [f.result() for f in futures]
+
     def get_available_weeks(self, year: int) -> List[int]:
         """Return sorted week numbers with completed games for a season."""
+        store = self._game_store()
+        if store is not None and store.covers(year, None):
+            weeks = store.available_weeks(year)
+            if weeks:
+                return weeks
         games = self.api_client.get_games(year=year)
         weeks = sorted({g['week'] for g in games if g.get('week') is not None})
         return weeks if weeks else list(range(1, 16))
@@ -0,0 +1,99 @@
+"""
+Fast JSON encode/decode shared by Flask responses, the cache and static files.
+
+Uses orjson when installed (FAST_JSON=0 forces the stdlib), falling back to
+the stdlib json module with the same output contract: compact separators,
+UTF-8, str dict keys, NumPy scalars/arrays and dates handled by `default`.
+json_provider.FastJSONProvider plugs this into Flask.
+"""
+from __future__ import annotations
+
+import dataclasses
+import decimal
+import json
+import os
+import uuid
+from datetime import date
+from typing import Any, Optional
+
+JSONDecodeError = json.JSONDecodeError  # orjson.JSONDecodeError subclasses this
+
+if os.environ.get('FAST_JSON', '1').lower() in ('0', 'false', 'no'):
+    orjson = None
+else:
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+
+BACKEND = 'orjson' if orjson is not None else 'json'
+
+
+def default(obj: Any) -> Any:
+    """Coerce types neither encoder handles natively (NumPy, dates, decimals, sets)."""
+    # NumPy scalars and arrays, without importing numpy
+    if hasattr(obj, 'tolist') and hasattr(obj, 'dtype'):
+        return obj.tolist()
+    if isinstance(obj, date):
+        return obj.isoformat()
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+if orjson is not None:
+    _OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def dumps_bytes(obj: Any, *, sort_keys: bool = False, indent: Optional[int] = None) -> bytes:
+        option = _OPTIONS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option)
+
+    def loads(data: Any) -> Any:
+        if isinstance(data, (memoryview, bytearray)):
+            data = bytes(data)
+        return orjson.loads(data)
+
+else:
+    def dumps_bytes(obj: Any, *, sort_keys: bool = False, indent: Optional[int] = None) -> bytes:
+        return dumps(obj, sort_keys=sort_keys, indent=indent).encode('utf-8')
+
+    def loads(data: Any) -> Any:
+        if isinstance(data, (memoryview, bytearray)):
+            data = bytes(data)
+        return json.loads(data)
+
+
+def dumps(obj: Any, *, sort_keys: bool = False, indent: Optional[int] = None) -> str:
+    if orjson is not None:
+        return dumps_bytes(obj, sort_keys=sort_keys, indent=indent).decode('utf-8')
+    separators = (',', ': ') if indent else (',', ':')
+    return json.dumps(
+        obj,
+        default=default,
+        ensure_ascii=False,
+        sort_keys=sort_keys,
+        indent=indent,
+        separators=separators,
+    )
+
+
+def dump(obj: Any, fp, *, sort_keys: bool = False, indent: Optional[int] = None) -> None:
+    """Write to a text-mode file."""
+    fp.write(dumps(obj, sort_keys=sort_keys, indent=indent))
+
+
+def load(fp) -> Any:
+    return loads(fp.read())
+
@@ -90,7 +90,7 @@ export function isLikelyArchivedWeek(year: number, week: number, now = new Date(
 	return week < currentWeek;
 }
 
-type StaticManifest = { years: Record<string, number[]> };
+type StaticManifest = { years: Record<string, number[]>; deltas?: number[] };
 
 let staticManifestPromise: Promise<StaticManifest | null> | null = null;
 
@@ -119,26 +119,215 @@ export async function hasStaticRankings(year: number, week: number): Promise<boo
 	return Array.isArray(weeks) && weeks.includes(week);
 }
 
+type DeltaEntry = { week: number; from_week?: number; path: string; bytes: number; etag: string };
+type DeltaManifest = { weeks: number[]; base: DeltaEntry; deltas: DeltaEntry[] };
+type DeltaColumn = unknown[] | { at: number[]; values: unknown[] };
+type DeltaTable = {
+	changed?: { rows: number[]; columns: Record<string, DeltaColumn> };
+	unset?: Record<string, string[]>;
+	added?: Record<string, unknown>[];
+	removed?: string[];
+	order?: number[];
+};
+export type WeekDelta = {
+	week: number;
+	from_week: number;
+	set?: Record<string, unknown>;
+	unset?: string[];
+	tables?: Record<string, DeltaTable>;
+};
+
+const DELTA_TABLE_KEYS: Record<string, string> = {
+	team_rankings: 'team_name',
+	conference_rankings: 'conference_name',
+};
+
+function setPath(row: Record<string, unknown>, name: string, value: unknown): void {
+	const path = name.split('.');
+	const leaf = path.pop() as string;
+	let target = row;
+	for (const key of path) {
+		if (typeof target[key] !== 'object' || target[key] === null) target[key] = {};
+		target = target[key] as Record<string, unknown>;
+	}
+	target[leaf] = value;
+}
+
+function deletePath(row: Record<string, unknown>, name: string): void {
+	const path = name.split('.');
+	const leaf = path.pop() as string;
+	let target: Record<string, unknown> | undefined = row;
+	for (const key of path) target = target?.[key] as Record<string, unknown> | undefined;
+	if (target) delete target[leaf];
+}
+
+function applyTableDelta(
+	old: Record<string, unknown>[],
+	diff: DeltaTable,
+	key: string
+): Record<string, unknown>[] {
+	const changedRows = diff.changed?.rows ?? [];
+	const patches = new Map<number, Record<string, unknown>>();
+	for (const [field, column] of Object.entries(diff.changed?.columns ?? {})) {
+		const at = Array.isArray(column) ? null : column.at;
+		const values = Array.isArray(column) ? column : column.values;
+		values.forEach((value, j) => {
+			const index = changedRows[at ? at[j] : j];
+			const patch = patches.get(index) ?? {};
+			patch[field] = value;
+			patches.set(index, patch);
+		});
+	}
+	const removed = new Set(diff.removed ?? []);
+	const rows: Record<string, unknown>[] = [];
+	old.forEach((row, index) => {
+		const name = row[key] as string;
+		if (removed.has(name)) return;
+		const patch = patches.get(index);
+		const gone = diff.unset?.[name];
+		if (patch || gone) {
+			row = structuredClone(row);
+			for (const field of gone ?? []) deletePath(row, field);
+			for (const [field, value] of Object.entries(patch ?? {})) setPath(row, field, value);
+		}
+		rows.push(row);
+	});
+	rows.push(...(diff.added ?? []));
+	return diff.order?.length ? diff.order.map((i) => rows[i]) : rows;
+}
+
+/** Apply a week delta (see week_deltas.py) to the previous week's slim payload. */
+export function applyWeekDelta(
+	prev: Record<string, unknown>,
+	delta: WeekDelta
+): Record<string, unknown> {
+	if (delta.from_week !== prev.week) {
+		throw new Error(`Delta for week ${delta.week} does not apply to week ${prev.week}`);
+	}
+	const next: Record<string, unknown> = { ...prev };
+	for (const key of delta.unset ?? []) delete next[key];
+	Object.assign(next, delta.set ?? {});
+	for (const [table, key] of Object.entries(DELTA_TABLE_KEYS)) {
+		const diff = delta.tables?.[table];
+		if (diff) next[table] = applyTableDelta((prev[table] ?? []) as Record<string, unknown>[], diff, key);
+	}
+	return next;
+}
+
+async function fetchStaticJson<T>(path: string): Promise<T | null> {
+	try {
+		const response = await fetch(path, { signal: AbortSignal.timeout(3000) });
+		if (!response.ok) return null;
+		return (await response.json()) as T;
+	} catch {
+		return null;
+	}
+}
+
+// Slim payloads already downloaded or rebuilt this session, by `${year}-${week}`
+const staticPayloads = new Map<string, Record<string, unknown>>();
+const deltaManifests = new Map<number, Promise<DeltaManifest | null>>();
+
+async function loadDeltaManifest(year: number): Promise<DeltaManifest | null> {
+	const manifest = await loadStaticManifest();
+	if (!manifest?.deltas?.includes(year)) return null;
+	if (!deltaManifests.has(year)) {
+		deltaManifests.set(year, fetchStaticJson<DeltaManifest>(`/rankings/${year}/delta/manifest.json`));
+	}
+	return deltaManifests.get(year) ?? null;
+}
+
+/**
+ * Rebuild a week from the nearest earlier week already in memory plus the
+ * season's delta patches, when those are smaller than the full file.
+ */
+async function rankingsFromDeltas(year: number, week: number): Promise<Record<string, unknown> | null> {
+	const manifest = await loadDeltaManifest(year);
+	if (!manifest?.weeks.includes(week)) return null;
+	const byWeek = new Map(manifest.deltas.map((entry) => [entry.week, entry]));
+	const chain: DeltaEntry[] = [];
+	let current = week;
+	let start: Record<string, unknown> | undefined;
+	while (!start) {
+		const entry = byWeek.get(current);
+		if (entry?.from_week === undefined) return null;
+		chain.unshift(entry);
+		current = entry.from_week;
+		start = staticPayloads.get(`${year}-${current}`);
+	}
+	if (chain.reduce((total, entry) => total + entry.bytes, 0) >= manifest.base.bytes) return null;
+	const deltas = await Promise.all(
+		chain.map((entry) => fetchStaticJson<WeekDelta>(`/rankings/${year}/delta/${entry.path}`))
+	);
+	let payload = start;
+	for (const delta of deltas) {
+		if (!delta) return null;
+		payload = applyWeekDelta(payload, delta);
+		staticPayloads.set(`${year}-${delta.week}`, payload);
+	}
+	return payload;
+}
+
+function toRankingsResponse(data: Record<string, unknown>, year: number, week: number): RankingsResponse {
+	return {
+		teams: ((data.team_rankings || data.teams || []) as Record<string, unknown>[]).map(mapTeamFromApi),
+		conferences: ((data.conference_rankings || data.conferences || []) as Record<string, unknown>[]).map(
+			mapConferenceFromApi
+		),
+		year: (data.year || year) as number,
+		week: (data.week || week) as number,
+		generated_at: (data.generated_at || new Date().toISOString()) as string,
+	};
+}
+
 async function fetchStaticRankings(year: number, week: number): Promise<RankingsResponse | null> {
 	if (!(await hasStaticRankings(year, week))) return null;
 	try {
-		const response = await fetch(`/rankings/${year}/week-${week}.json`, {
-			signal: AbortSignal.timeout(3000),
-		});
-		if (!response.ok) return null;
-		const data = await response.json();
-		return {
-			teams: (data.team_rankings || data.teams || []).map(mapTeamFromApi),
-			conferences: (data.conference_rankings || data.conferences || []).map(mapConferenceFromApi),
-			year: data.year || year,
-			week: data.week || week,
-			generated_at: data.generated_at || new Date().toISOString(),
-		};
+		const key = `${year}-${week}`;
+		let data = staticPayloads.get(key) ?? (await rankingsFromDeltas(year, week));
+		if (!data) {
+			data = await fetchStaticJson<Record<string, unknown>>(`/rankings/${year}/week-${week}.json`);
+			if (!data) return null;
+			staticPayloads.set(key, data);
+		}
+		return toRankingsResponse(data, year, week);
 	} catch {
 		return null;
 	}
 }
 
+type ColumnarColumn = unknown[] | { dict: unknown[]; codes: number[] };
+
+interface ColumnarTable {
+	length: number;
+	columns: Record<string, ColumnarColumn>;
+}
+
+/** Rebuild row objects from a columnar table (dotted names → nested objects, code -1 → null). */
+export function decodeColumnarTable(table: ColumnarTable): Record<string, unknown>[] {
+	const rows: Record<string, unknown>[] = Array.from({ length: table.length }, () => ({}));
+	for (const [name, column] of Object.entries(table.columns)) {
+		const values = Array.isArray(column)
+			? column
+			: column.codes.map((code) => (code < 0 ? null : column.dict[code]));
+		values.forEach((value, i) => setPath(rows[i], name, value));
+	}
+	return rows;
+}
+
+/** Decode `format=columnar` rankings (see columnar_rankings.py); other payloads pass through. */
+export function decodeColumnarRankings(data: Record<string, unknown>): Record<string, unknown> {
+	if (data?.format !== 'columnar') return data;
+	const envelope = new Set(['format', 'version', 'precision']);
+	const decoded: Record<string, unknown> = Object.fromEntries(
+		Object.entries(data).filter(([key]) => !envelope.has(key))
+	);
+	for (const table of ['team_rankings', 'conference_rankings']) {
+		decoded[table] = data[table] ? decodeColumnarTable(data[table] as ColumnarTable) : [];
+	}
+	return decoded;
+}
+
 export async function fetchRankingsFromApi(
 	year: number,
 	week: number,
@@ -151,7 +340,7 @@ export async function fetchRankingsFromApi(
 	}
 
 	const allDivisions = view === 'fcs' ? 'true' : 'false';
-	const url = `${API_BASE}/rankings?year=${year}&week=${week}&all_divisions=${allDivisions}`;
+	const url = `${API_BASE}/rankings?year=${year}&week=${week}&all_divisions=${allDivisions}&format=columnar`;
 	const response = await fetch(url);
 	if (!response.ok) {
 		const error = await response.json().catch(() => ({ error: 'Unknown error' }));
@@ -159,14 +348,7 @@ export async function fetchRankingsFromApi(
 			(error as { message?: string }).message ||
 			`HTTP ${response.status}`);
 	}
-	const data = await response.json();
-	return {
-		teams: (data.team_rankings || data.teams || []).map(mapTeamFromApi),
-		conferences: (data.conference_rankings || data.conferences || []).map(mapConferenceFromApi),
-		year: data.year || year,
-		week: data.week || week,
-		generated_at: data.generated_at || new Date().toISOString(),
-	};
+	return toRankingsResponse(decodeColumnarRankings(await response.json()), year, week);
 }
 
 export async function fetchAvailableWeeks(year: number): Promise<number[]> {
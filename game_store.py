@@ -0,0 +1,382 @@
+"""
+Persistent local game store (SQLite) behind CFBDApiClient / CFBDataProcessor.
+
+Games are keyed by CFBD game id and indexed by season, week, team and date.
+Each CFBD fetch upserts only new or changed rows, drops rows the fetch no
+longer returns and bumps a per-week change version, so repeat refreshes
+rewrite nothing and any season seen before is
+answered from indexed queries without touching the network.
+
+A fetch made once its season was historical never goes stale; anything
+fetched during the season follows TTL_GAMES_CURRENT like the old cache
+blobs did, even after the season ends (in-season fetches drop unscored
+games, so they can be partial).
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from cache import CACHE_DIR, TTL_GAMES_CURRENT, TTL_TEAMS, is_historical_season
+
+GAME_STORE_PATH = os.environ.get('GAME_STORE_PATH', os.path.join(CACHE_DIR, 'games.sqlite3'))
+
+# week_fetches.week for a whole-season fetch
+SEASON_WEEK = -1
+# Missing weeks at which one whole-season call replaces per-week calls: a season
+# payload is every week's games, so two or three stale weeks are cheaper one by one
+SEASON_FETCH_MIN_WEEKS = int(os.environ.get('GAMES_SEASON_FETCH_MIN_WEEKS', '4'))
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS games ('
+    ' game_key TEXT PRIMARY KEY,'
+    ' cfbd_id INTEGER,'
+    ' season INTEGER NOT NULL,'
+    ' season_type TEXT NOT NULL,'
+    ' week INTEGER,'
+    ' start_date TEXT,'
+    ' home_team TEXT,'
+    ' away_team TEXT,'
+    ' payload TEXT NOT NULL,'
+    ' content_hash TEXT NOT NULL,'
+    ' version INTEGER NOT NULL,'
+    ' updated_at REAL NOT NULL)',
+    'CREATE INDEX IF NOT EXISTS idx_games_season_week ON games (season, season_type, week)',
+    'CREATE INDEX IF NOT EXISTS idx_games_home ON games (home_team, season)',
+    'CREATE INDEX IF NOT EXISTS idx_games_away ON games (away_team, season)',
+    'CREATE INDEX IF NOT EXISTS idx_games_date ON games (start_date)',
+    'CREATE TABLE IF NOT EXISTS week_fetches ('
+    ' season INTEGER NOT NULL,'
+    ' season_type TEXT NOT NULL,'
+    ' week INTEGER NOT NULL,'
+    ' version INTEGER NOT NULL DEFAULT 0,'
+    ' game_count INTEGER NOT NULL DEFAULT 0,'
+    ' fetched_at REAL NOT NULL,'
+    ' final INTEGER NOT NULL DEFAULT 0,'
+    ' PRIMARY KEY (season, season_type, week))',
+    'CREATE TABLE IF NOT EXISTS teams ('
+    ' school TEXT PRIMARY KEY,'
+    ' cfbd_id INTEGER,'
+    ' conference TEXT,'
+    ' classification TEXT,'
+    ' payload TEXT NOT NULL,'
+    ' updated_at REAL NOT NULL)',
+    'CREATE INDEX IF NOT EXISTS idx_teams_id ON teams (cfbd_id)',
+    'CREATE INDEX IF NOT EXISTS idx_teams_conference ON teams (conference)',
+)
+
+
+def game_key(game: Dict[str, Any]) -> str:
+    """CFBD id when present; otherwise a stable natural key (legacy cache blobs)."""
+    if game.get('id') is not None:
+        return str(game['id'])
+    return (
+        f"{game.get('year')}:{game.get('season_type') or 'regular'}:{game.get('week')}:"
+        f"{game.get('home_team_name')}:{game.get('away_team_name')}:{game.get('date')}"
+    )
+
+
+def _content_hash(payload: str) -> str:
+    return hashlib.sha1(payload.encode(), usedforsecurity=False).hexdigest()
+
+
+class GameStore:
+    """SQLite-backed games/teams tables with per-week change versions."""
+
+    def __init__(self, path: str = GAME_STORE_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            columns = {row[1] for row in conn.execute('PRAGMA table_info(week_fetches)')}
+            if 'final' not in columns:
+                # Stores from before the flag: their fetches expire and get re-flagged
+                conn.execute('ALTER TABLE week_fetches ADD COLUMN final INTEGER NOT NULL DEFAULT 0')
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=10.0)
+
+    # --- freshness --------------------------------------------------------
+
+    @staticmethod
+    def _fresh(fetched_at: float, final: int, now: float) -> bool:
+        """Fetched, and either final (season already over at fetch time) or within TTL_GAMES_CURRENT."""
+        return bool(fetched_at) and (bool(final) or now - fetched_at < TTL_GAMES_CURRENT)
+
+    def week_fetch(self, year: int, week: Optional[int], season_type: str = 'regular') -> Optional[Dict[str, Any]]:
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT version, game_count, fetched_at, final FROM week_fetches '
+                'WHERE season = ? AND season_type = ? AND week = ?',
+                (year, season_type, SEASON_WEEK if week is None else week),
+            ).fetchone()
+        if row is None:
+            return None
+        return {'version': row[0], 'game_count': row[1], 'fetched_at': row[2], 'final': bool(row[3])}
+
+    def is_fresh(self, year: int, week: Optional[int], season_type: str = 'regular') -> bool:
+        """True when this (season, week) was fetched and is still within its TTL."""
+        fetch = self.week_fetch(year, week, season_type)
+        return fetch is not None and self._fresh(fetch['fetched_at'], fetch['final'], time.time())
+
+    def fresh_weeks(self, year: int, season_type: str = 'regular') -> Dict[int, int]:
+        """Week -> stored game count for every individually fetched, still-fresh week."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                'SELECT week, game_count, fetched_at, final FROM week_fetches '
+                'WHERE season = ? AND season_type = ? AND week >= 0 AND fetched_at > 0',
+                (year, season_type),
+            ).fetchall()
+        now = time.time()
+        return {
+            week: count for week, count, fetched_at, final in rows
+            if self._fresh(fetched_at, final, now)
+        }
+
+    def weeks_complete(self, year: int, season_type: str = 'regular') -> bool:
+        """
+        True when final week fetches assemble the whole season: weeks 1..N all
+        fetched with games, and week N+1 fetched and empty (the season's end).
+
+        Only fetches made after the season ended count. In-season, next week's
+        unscored games are filtered out, so an empty week is not the end.
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                'SELECT week, game_count FROM week_fetches '
+                'WHERE season = ? AND season_type = ? AND week >= 0 AND fetched_at > 0 AND final = 1',
+                (year, season_type),
+            ).fetchall()
+        final = dict(rows)
+        played = [w for w, count in final.items() if count > 0]
+        if not played:
+            return False
+        last = max(played)
+        return all(w in final for w in range(1, last + 1)) and final.get(last + 1) == 0
+
+    def covers(self, year: int, week: Optional[int], season_type: str = 'regular') -> bool:
+        """True when stored rows answer this request: a fresh season covers any week, and a
+        complete set of post-season week fetches covers the season."""
+        if self.is_fresh(year, None, season_type):
+            return True
+        if week is None:
+            return self.weeks_complete(year, season_type)
+        return self.is_fresh(year, week, season_type)
+
+    def plan_weeks(self, year: int, weeks: List[int], season_type: str = 'regular') -> Dict[str, Any]:
+        """
+        Cheapest way to answer a week range, in CFBD calls.
+
+        source 'store'  — every week already covered, 0 calls
+        source 'weeks'  — fetch only the missing weeks (one call each)
+        source 'season' — one full-season call, once SEASON_FETCH_MIN_WEEKS or
+                          more weeks are missing
+        naive_calls is what week-by-week fetching of the missing weeks costs.
+        """
+        if self.is_fresh(year, None, season_type):
+            missing: List[int] = []
+        else:
+            fresh = self.fresh_weeks(year, season_type)
+            missing = [w for w in weeks if w not in fresh]
+        naive = len(missing)
+        if not missing:
+            return {'source': 'store', 'fetch_weeks': [], 'calls': 0, 'naive_calls': naive}
+        if len(missing) >= SEASON_FETCH_MIN_WEEKS:
+            return {'source': 'season', 'fetch_weeks': [], 'calls': 1, 'naive_calls': naive}
+        return {'source': 'weeks', 'fetch_weeks': missing, 'calls': len(missing), 'naive_calls': naive}
+
+    def has_season(self, year: int, season_type: str = 'regular') -> bool:
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT 1 FROM week_fetches WHERE season = ? AND season_type = ? LIMIT 1',
+                (year, season_type),
+            ).fetchone()
+        return row is not None
+
+    # --- games ------------------------------------------------------------
+
+    def upsert_games(
+        self,
+        year: int,
+        week: Optional[int],
+        season_type: str,
+        games: Iterable[Dict[str, Any]],
+    ) -> int:
+        """
+        Insert new games, rewrite only rows whose content changed, and drop stored
+        games the fetch no longer returns (cancelled or moved).
+
+        Records the fetch for (year, week) — week None means the whole season —
+        and bumps the change version of every week that gained, changed or lost
+        a game. Returns the number of rows written or removed.
+        """
+        now = time.time()
+        changed_weeks: Dict[int, int] = {}
+        scope = '' if week is None else ' AND week = ?'
+        scope_params = (year, season_type, *(() if week is None else (week,)))
+        fetched = set()
+        written = 0
+        with self._connect() as conn:
+            for game in games:
+                fetched.add(game_key(game))
+                payload = json.dumps(game, sort_keys=True, separators=(',', ':'))
+                digest = _content_hash(payload)
+                game_week = game.get('week')
+                before = conn.total_changes
+                conn.execute(
+                    'INSERT INTO games (game_key, cfbd_id, season, season_type, week, start_date, '
+                    'home_team, away_team, payload, content_hash, version, updated_at) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1, ?) '
+                    'ON CONFLICT(game_key) DO UPDATE SET '
+                    'week = excluded.week, start_date = excluded.start_date, '
+                    'home_team = excluded.home_team, away_team = excluded.away_team, '
+                    'payload = excluded.payload, content_hash = excluded.content_hash, '
+                    'version = games.version + 1, updated_at = excluded.updated_at '
+                    'WHERE games.content_hash != excluded.content_hash',
+                    (
+                        game_key(game), game.get('id'), year, season_type, game_week,
+                        game.get('date'), game.get('home_team_name'), game.get('away_team_name'),
+                        payload, digest, now,
+                    ),
+                )
+                if conn.total_changes == before:
+                    continue
+                written += 1
+                if game_week is not None:
+                    changed_weeks[game_week] = changed_weeks.get(game_week, 0) + 1
+
+            stored = conn.execute(
+                'SELECT game_key, week FROM games WHERE season = ? AND season_type = ?' + scope, scope_params,
+            ).fetchall()
+            gone = [(key, game_week) for key, game_week in stored if key not in fetched]
+            conn.executemany('DELETE FROM games WHERE game_key = ?', [(key,) for key, _ in gone])
+            for _, game_week in gone:
+                if game_week is not None:
+                    changed_weeks[game_week] = changed_weeks.get(game_week, 0) + 1
+
+            fetch_week = SEASON_WEEK if week is None else week
+            for w in changed_weeks:
+                if w == fetch_week:
+                    continue
+                # Changed rows from a wider fetch bump that week's version only
+                conn.execute(
+                    'INSERT INTO week_fetches (season, season_type, week, version, game_count, fetched_at) '
+                    'VALUES (?, ?, ?, 1, 0, 0) '
+                    'ON CONFLICT(season, season_type, week) DO UPDATE SET version = week_fetches.version + 1',
+                    (year, season_type, w),
+                )
+            # Final: the season was over when fetched, so this fetch never expires
+            conn.execute(
+                'INSERT INTO week_fetches (season, season_type, week, version, game_count, fetched_at, final) '
+                'VALUES (?, ?, ?, ?, (SELECT COUNT(*) FROM games WHERE season = ? AND season_type = ?'
+                + scope + '), ?, ?) '
+                'ON CONFLICT(season, season_type, week) DO UPDATE SET '
+                'version = week_fetches.version + excluded.version, '
+                'game_count = excluded.game_count, fetched_at = excluded.fetched_at, '
+                'final = excluded.final',
+                (
+                    year, season_type, fetch_week, 1 if changed_weeks else 0,
+                    *scope_params, now,
+                    int(is_historical_season(year)),
+                ),
+            )
+        if changed_weeks:
+            print(f"GAME STORE: {year} {season_type} upserted {written} and removed {len(gone)} "
+                  f"games in weeks {sorted(changed_weeks)}")
+        return written + len(gone)
+
+    def get_games(
+        self,
+        year: int,
+        week: Optional[int] = None,
+        season_type: str = 'regular',
+        through_week: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Indexed read of stored games, ordered by week, date then key."""
+        sql = 'SELECT payload FROM games WHERE season = ? AND season_type = ?'
+        params: List[Any] = [year, season_type]
+        if week is not None:
+            sql += ' AND week = ?'
+            params.append(week)
+        elif through_week is not None:
+            sql += ' AND week <= ?'
+            params.append(through_week)
+        sql += ' ORDER BY week, start_date, game_key'
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def get_team_games(self, team: str, year: int) -> List[Dict[str, Any]]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                'SELECT payload FROM games WHERE season = ? AND (home_team = ? OR away_team = ?) '
+                'ORDER BY start_date, week',
+                (year, team, team),
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def available_weeks(self, year: int, season_type: str = 'regular') -> List[int]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                'SELECT DISTINCT week FROM games WHERE season = ? AND season_type = ? '
+                'AND week IS NOT NULL ORDER BY week',
+                (year, season_type),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def week_versions(self, year: int, season_type: str = 'regular') -> Dict[int, int]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                'SELECT week, version FROM week_fetches WHERE season = ? AND season_type = ? AND week >= 0',
+                (year, season_type),
+            ).fetchall()
+        return {week: version for week, version in rows}
+
+    # --- teams ------------------------------------------------------------
+
+    def upsert_teams(self, teams: Dict[str, Dict[str, Any]]) -> None:
+        now = time.time()
+        with self._connect() as conn:
+            conn.executemany(
+                'INSERT INTO teams (school, cfbd_id, conference, classification, payload, updated_at) '
+                'VALUES (?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT(school) DO UPDATE SET cfbd_id = excluded.cfbd_id, '
+                'conference = excluded.conference, classification = excluded.classification, '
+                'payload = excluded.payload, updated_at = excluded.updated_at',
+                [
+                    (
+                        school, info.get('id'), info.get('conference'), info.get('classification'),
+                        json.dumps(info, separators=(',', ':')), now,
+                    )
+                    for school, info in teams.items()
+                ],
+            )
+
+    def get_teams(self, max_age: Optional[float] = TTL_TEAMS) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Stored team registry, or None when empty or older than max_age."""
+        with self._connect() as conn:
+            rows = conn.execute('SELECT school, payload, updated_at FROM teams').fetchall()
+        if not rows:
+            return None
+        if max_age is not None and time.time() - min(row[2] for row in rows) > max_age:
+            return None
+        return {school: json.loads(payload) for school, payload, _ in rows}
+
+
+_store: Optional[GameStore] = None
+_store_lock = threading.Lock()
+
+
+def get_game_store() -> GameStore:
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = GameStore()
+        return _store
@@ -0,0 +1,23 @@
+"""Flask JSON provider backed by fast_json (orjson when available)."""
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+import fast_json
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Drop-in for Flask's default provider; keeps its sort_keys setting and trailing newline."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return fast_json.dumps(obj, sort_keys=kwargs.get('sort_keys', self.sort_keys))
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return fast_json.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            fast_json.dumps_bytes(obj, sort_keys=self.sort_keys) + b'\n',
+            mimetype=self.mimetype,
+        )
@@ -14,12 +14,10 @@ from datetime import datetime
 from typing import Dict, List, Optional, Any, Union
 
 from dotenv import load_dotenv
-from tabulate import tabulate
 
 from api_integration import CFBDApiClient
 from data_processor import CFBDataProcessor
 from ranking_algorithm import TeamQualityRanker
-from visualizations import RankingVisualizer
 
 # Setup logging
 logging.basicConfig(
@@ -241,7 +239,8 @@ class CFBRankingApp:
         else:
             rankings_map = full_rankings_data['rankings']
         
-        # Create visualizer
+        # Create visualizer (matplotlib/pandas load on first use)
+        from visualizations import RankingVisualizer
         visualizer = RankingVisualizer()
         
         # Display rankings table
@@ -272,7 +271,8 @@ class CFBRankingApp:
         # Create timestamp for filenames
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
-        # Create visualizer
+        # Create visualizer (matplotlib/pandas load on first use)
+        from visualizations import RankingVisualizer
         visualizer = RankingVisualizer()
         
         # Generate team rankings chart
@@ -391,6 +391,9 @@ class CFBRankingApp:
             ["Milestone Mult", f"{team1_data.get('milestone_mult', 1.0):.2f}x", f"{team2_data.get('milestone_mult', 1.0):.2f}x"]
         ]
         
+        from tabulate import tabulate
+        from visualizations import RankingVisualizer
+
         print("\nTeam Comparison:")
         print(tabulate(comparison, tablefmt="fancy_grid"))
 
@@ -4,18 +4,12 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional
 
 from path_to_climb import compute_path_to_climb
+from team_lookup import team_index
 
 CFP_BAND = 12
 DEFAULT_TOP_MOVEMENTS = 5
 
 
-def _rank_map(rankings: Dict[str, Any]) -> Dict[str, int]:
-    return {
-        t['team_name']: i + 1
-        for i, t in enumerate(rankings.get('team_rankings') or [])
-    }
-
-
 def _team_rows(rankings: Dict[str, Any]) -> List[Dict[str, Any]]:
     rows = []
     for i, t in enumerate(rankings.get('team_rankings') or []):
@@ -61,13 +55,14 @@ def extract_week_facts(
     )
 
     if has_wow:
-        prev = _rank_map(previous_rankings)
+        prev = team_index(previous_rankings['team_rankings'])
         for i, t in enumerate(teams):
             name = t.get('team_name')
-            if not name or name not in prev:
+            previous_index = prev.find(name) if name else None
+            if previous_index is None:
                 continue
             rank = i + 1
-            previous_rank = prev[name]
+            previous_rank = previous_index + 1
             delta = previous_rank - rank  # positive = climbed
             entry = {
                 'team_name': name,
@@ -1,7 +1,6 @@
 
 import math
 import statistics
-import numpy as np
 from typing import List, Dict, Any, Optional, TypedDict
 from collections import defaultdict
 
@@ -567,6 +566,9 @@ class TeamQualityRanker:
             if data['conference_type'] == 'Power 4'
         ]
         
+        # numpy is only needed here; keep it off the web app's import path
+        import numpy as np
+
         if fbs_elos:
             p75 = np.percentile(fbs_elos, 75)  # Top 25% of FBS
             p90 = np.percentile(fbs_elos, 90)  # Top 10% of FBS (Quality Loss)
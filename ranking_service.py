@@ -1,12 +1,20 @@
 """Shared ranking calculation logic used by API routes and agent endpoints."""
 import hashlib
 import json
+import os
+import time
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
 
 from data_processor import CFBDataProcessor
 from ranking_algorithm import TeamQualityRanker
 from cache import get_cache, TTL_RANKINGS, TTL_PRIORS
+import fast_json
+from columnar_rankings import DEFAULT_PRECISION, encode_columnar
+from rankings_query import RankingsQuery, apply_rankings_query
+from team_breakdown import build_team_breakdowns
+from team_lookup import normalize_team_name, team_index
+from warm_state import note_rankings_request
 
 ALGO_VERSION = 'v5.1'
 
@@ -54,6 +62,24 @@ def build_config(request_args) -> Dict[str, Any]:
     return config
 
 
+# Request params that change the computed payload (besides year/week)
+_CONFIG_ARG_KEYS = (
+    'power_conf_initial', 'group5_initial', 'fcs_initial', 'base_factor',
+    'team_quality_weight', 'conference_weight', 'record_weight', 'prior_strength',
+)
+
+
+def is_default_rankings_request(request_args) -> bool:
+    """FBS rankings with the default config (what history and static files hold)."""
+    return request_args.get('all_divisions', 'false') == 'false' and \
+        all(request_args.get(k) is None for k in _CONFIG_ARG_KEYS)
+
+
+def _static_week(year: int, week: Optional[int], request_args) -> bool:
+    """Archived week with the default config: the only requests static files answer."""
+    return week is not None and is_default_rankings_request(request_args) and is_archived_week(year, week)
+
+
 def rankings_cache_key(year: int, week: Optional[int], request_args) -> str:
     cache = get_cache()
     cache_params = {
@@ -136,6 +162,98 @@ def slim_rankings_for_list(rankings_data: Dict[str, Any]) -> Dict[str, Any]:
     return slim
 
 
+def columnar_variant(precision: int = DEFAULT_PRECISION) -> str:
+    return f'columnar:{precision}'
+
+
+RESPONSE_VARIANTS = ('list', 'detail', columnar_variant())
+
+
+def rankings_variant(data: Dict[str, Any], variant: str) -> Dict[str, Any]:
+    """Shape a payload for /rankings: slim list, columnar list, or detail without the name-keyed map."""
+    if variant.startswith('columnar:'):
+        return encode_columnar(rankings_variant(data, 'list'), int(variant.split(':', 1)[1]))
+    if variant == 'list':
+        return data if data.get('detail') is False else slim_rankings_for_list(data)
+    if 'rankings' in data:
+        # Avoid shipping the duplicate name-keyed map on the wire
+        return {k: v for k, v in data.items() if k != 'rankings'}
+    return data
+
+
+def query_rankings_variant(
+    data: Dict[str, Any],
+    variant: str,
+    query: RankingsQuery,
+    version: str,
+) -> Dict[str, Any]:
+    """rankings_variant with fields/limit/offset/conference filters applied to its rows."""
+    rows = rankings_variant(data, 'detail' if variant == 'detail' else 'list')
+    shaped = apply_rankings_query(rows, query, version)
+    return rankings_variant(shaped, variant) if variant.startswith('columnar:') else shaped
+
+
+def serialize_rankings(data: Dict[str, Any]) -> str:
+    return fast_json.dumps(data)
+
+
+STREAM_CHUNK_BYTES = int(os.environ.get('STREAM_CHUNK_BYTES', str(64 * 1024)))
+
+
+def stream_rankings(data: Dict[str, Any]) -> Iterator[bytes]:
+    """serialize_rankings as chunks, byte for byte (same key order, so the same ETag):
+    the keys before team_rankings, then team objects one at a time (batched to
+    ~STREAM_CHUNK_BYTES), then the keys after it. The whole body never exists at once."""
+    if 'team_rankings' not in data:
+        yield fast_json.dumps_bytes(data)
+        return
+    keys = list(data)
+    split = keys.index('team_rankings')
+    head = fast_json.dumps_bytes({k: data[k] for k in keys[:split]})[1:-1]
+    tail = fast_json.dumps_bytes({k: data[k] for k in keys[split + 1:]})[1:-1]
+    pending = [b'{', head + b',' if head else b'', b'"team_rankings":[']
+    size = 0
+    for i, team in enumerate(data['team_rankings'] or []):
+        chunk = fast_json.dumps_bytes(team)
+        pending.append(b',' + chunk if i else chunk)
+        size += len(chunk)
+        if size >= STREAM_CHUNK_BYTES:
+            yield b''.join(pending)
+            pending, size = [], 0
+    pending.append(b'],' + tail + b'}' if tail else b']}')
+    yield b''.join(pending)
+
+
+def stream_body(body: str) -> Iterator[bytes]:
+    """A stored body as ~STREAM_CHUNK_BYTES encoded slices (no full-size bytes copy)."""
+    for start in range(0, len(body), STREAM_CHUNK_BYTES):
+        yield body[start:start + STREAM_CHUNK_BYTES].encode('utf-8')
+
+
+def _body_key(cache_key: str, variant: str) -> str:
+    return get_cache()._generate_key('rankings_body', cache_key, variant)
+
+
+def store_rankings_body(cache_key: str, variant: str, body: str, ttl: int = TTL_RANKINGS) -> None:
+    get_cache().set(_body_key(cache_key, variant), body, ttl, prefix='rankings_computed')
+
+
+def store_rankings_bodies(cache_key: str, data: Dict[str, Any], ttl: int = TTL_RANKINGS) -> None:
+    """Pre-serialize every /rankings response variant beside the cached payload."""
+    for variant in RESPONSE_VARIANTS:
+        store_rankings_body(cache_key, variant, serialize_rankings(rankings_variant(data, variant)), ttl)
+
+
+def get_rankings_body(
+    year: int,
+    week: Optional[int],
+    request_args,
+    variant: str,
+) -> Optional[str]:
+    """Ready-to-send JSON for a cached computed payload, or None."""
+    return get_cache().get(_body_key(rankings_cache_key(year, week, request_args), variant))
+
+
 def is_archived_week(
     year: int,
     week: Optional[int],
@@ -166,30 +284,48 @@ def is_archived_week(
     return week < current_week
 
 
-def calculate_rankings_logic(
-    data_processor: CFBDataProcessor,
-    year: int,
-    week: Optional[int],
-    request_args,
-) -> Optional[Dict[str, Any]]:
-    print(f"Fetching games for {year}, week: {week if week else 'all'}...")
-    games = data_processor.get_games_for_season(year, through_week=week)
-    print(f"Fetched {len(games)} games.")
-    if not games:
-        return None
-
-    games_by_week = data_processor.organize_games_by_week(games)
+def rankings_config(request_args, week: Optional[int]) -> Dict[str, Any]:
+    """build_config plus the week-dependent prior strength (unless the request sets it)."""
     config = build_config(request_args)
-
     if request_args.get('prior_strength') is not None:
         config['prior_strength'] = float(request_args.get('prior_strength'))
     else:
         calc_week = week if week is not None else 15
         config['prior_strength'] = max(0.0, 0.7 * (12.0 - calc_week) / 11.0)
+    return config
 
-    priors = compute_priors(data_processor, year, config)
-    print(f"Calculated priors for {len(priors)} teams.")
 
+class SolverRun(NamedTuple):
+    """The final-pass ranker and the inputs that pass ran with."""
+    ranker: TeamQualityRanker
+    reference_ranks: Optional[Dict[str, float]]
+    conf_stddevs: Dict[str, float]
+
+
+def replay_weeks(
+    ranker: TeamQualityRanker,
+    games_by_week: Dict[int, List[Dict[str, Any]]],
+    reference_ranks: Optional[Dict[str, float]],
+    from_week: Optional[int] = None,
+    before_week=None,
+) -> None:
+    """Feed weeks >= from_week into ranker in order; before_week(week, ranker) runs ahead of each."""
+    for week_num in sorted(games_by_week.keys()):
+        if from_week is not None and week_num < from_week:
+            continue
+        if before_week is not None:
+            before_week(week_num, ranker)
+        for game in games_by_week[week_num]:
+            ranker.update_quality_scores(game, reference_ranks)
+
+
+def run_solver(
+    games_by_week: Dict[int, List[Dict[str, Any]]],
+    config: Dict[str, Any],
+    priors: Dict[str, float],
+    before_week=None,
+) -> SolverRun:
+    """Iterative solve; before_week is passed to replay_weeks for the final pass only."""
     print("Calculating rankings (Iterative V5.1)...")
     reference_ranks = None
     conf_stddevs = {}
@@ -197,20 +333,29 @@ def calculate_rankings_logic(
 
     for i in range(num_iterations):
         print(f"  Iteration {i+1}/{num_iterations}...")
+        final = i == num_iterations - 1
         ranker = TeamQualityRanker(config, priors)
         if conf_stddevs:
             ranker.set_conference_stddevs(conf_stddevs)
-        for week_num in sorted(games_by_week.keys()):
-            for game in games_by_week[week_num]:
-                ranker.update_quality_scores(game, reference_ranks)
-        if i < num_iterations - 1:
+        replay_weeks(ranker, games_by_week, reference_ranks, before_week=before_week if final else None)
+        if not final:
             temp_results = ranker.calculate_final_rankings()
             reference_ranks = {
                 t['team_name']: t['team_quality_score']
                 for t in temp_results['team_rankings']
             }
             conf_stddevs = ranker.compute_conference_stddevs()
+    return SolverRun(ranker, reference_ranks, conf_stddevs)
 
+
+def finish_rankings(
+    ranker: TeamQualityRanker,
+    data_processor: CFBDataProcessor,
+    year: int,
+    week: Optional[int],
+    request_args,
+) -> Dict[str, Any]:
+    """API payload from a solved ranker: scores, logos, conference FCS records, division filter."""
     rankings_data = ranker.calculate_final_rankings()
     rankings_data = ranker.normalize_scores(rankings_data)
 
@@ -251,6 +396,141 @@ def calculate_rankings_logic(
     return rankings_data
 
 
+def calculate_rankings_logic(
+    data_processor: CFBDataProcessor,
+    year: int,
+    week: Optional[int],
+    request_args,
+    games: Optional[List[Dict[str, Any]]] = None,
+) -> Optional[Dict[str, Any]]:
+    """Rankings for year/week; `games` (through that week) skips the fetch when the caller has them."""
+    if games is None:
+        print(f"Fetching games for {year}, week: {week if week else 'all'}...")
+        games = data_processor.get_games_for_season(year, through_week=week)
+        print(f"Fetched {len(games)} games.")
+    if not games:
+        return None
+
+    games_by_week = data_processor.organize_games_by_week(games)
+    config = rankings_config(request_args, week)
+
+    priors = compute_priors(data_processor, year, config)
+    print(f"Calculated priors for {len(priors)} teams.")
+
+    run = run_solver(games_by_week, config, priors)
+    return finish_rankings(run.ranker, data_processor, year, week, request_args)
+
+
+class RankingsVersion(NamedTuple):
+    """Content hash of the payload a rankings request resolves to, and its remaining life."""
+    digest: str
+    max_age: int
+
+
+def payload_digest(data: Dict[str, Any]) -> str:
+    return hashlib.sha256(fast_json.dumps_bytes(data, sort_keys=True)).hexdigest()[:32]
+
+
+def _version_key(cache_key: str) -> str:
+    return get_cache()._generate_key('rankings_version', cache_key)
+
+
+def store_rankings_version(cache_key: str, data: Dict[str, Any], ttl: int = TTL_RANKINGS) -> RankingsVersion:
+    """Cache the payload hash beside its rankings entry (same TTL), for ETags."""
+    digest = payload_digest(data)
+    get_cache().set(
+        _version_key(cache_key),
+        {'digest': digest, 'expires_at': time.time() + ttl},
+        ttl,
+        prefix='rankings_computed',
+    )
+    return RankingsVersion(digest, ttl)
+
+
+def get_rankings_version(
+    year: int,
+    week: Optional[int],
+    request_args,
+    *,
+    prefer_static: bool = True,
+) -> Optional[RankingsVersion]:
+    """Version of the payload get_or_calculate_rankings would return, without loading it."""
+    if prefer_static and _static_week(year, week, request_args):
+        try:
+            from static_rankings import read_static_digest
+            digest = read_static_digest(year, week)
+        except Exception as e:
+            print(f"Static rankings read error: {e}")
+            digest = None
+        if digest is not None:
+            return RankingsVersion(digest[:32], TTL_RANKINGS)
+    meta = get_cache().get(_version_key(rankings_cache_key(year, week, request_args)))
+    if not meta:
+        return None
+    remaining = int(meta['expires_at'] - time.time())
+    return RankingsVersion(meta['digest'], remaining) if remaining > 0 else None
+
+
+def get_static_rankings_body(
+    year: int, week: Optional[int], request_args, accept_encodings=(), columnar: bool = False,
+):
+    """Precomputed slim bytes (+ encoding, ETag) for an archived default-config week, served without parsing."""
+    if not _static_week(year, week, request_args):
+        return None
+    try:
+        from static_rankings import read_static_rankings_body
+        body = read_static_rankings_body(year, week, accept_encodings, columnar=columnar)
+    except Exception as e:
+        print(f"Static rankings read error: {e}")
+        return None
+    if body is not None:
+        print(f"STATIC HIT: rankings {year} week={week} ({body.encoding or 'identity'})")
+    return body
+
+
+def _breakdowns_key(digest: str) -> str:
+    return get_cache()._generate_key('team_breakdowns', digest)
+
+
+def store_team_breakdowns(digest: str, data: Dict[str, Any], ttl: int = TTL_RANKINGS) -> Dict[str, Any]:
+    """Serialize every team's /rankings/team breakdown once, keyed by payload hash.
+
+    Entry: {"bodies": [JSON per team, rank order], "positions": {lookup key: row}}.
+    """
+    teams = data.get('team_rankings') or []
+    entry = {
+        'bodies': [fast_json.dumps(breakdown) for breakdown in build_team_breakdowns(teams)],
+        'positions': dict(team_index(teams).positions),
+    }
+    get_cache().set(_breakdowns_key(digest), entry, ttl, prefix='rankings_computed')
+    return entry
+
+
+def get_team_breakdowns(digest: str) -> Optional[Dict[str, Any]]:
+    return get_cache().get(_breakdowns_key(digest))
+
+
+def team_breakdown_body(breakdowns: Dict[str, Any], team_name: str) -> Optional[str]:
+    """Stored breakdown JSON for a team name or alias (no fuzzy matching), or None."""
+    row = breakdowns['positions'].get(normalize_team_name(team_name))
+    return breakdowns['bodies'][row] if row is not None else None
+
+
+def get_team_shard_body(year: int, week: Optional[int], team_name: str, request_args, accept_encodings=()):
+    """Precomputed team breakdown bytes for an archived default-config week (no solver work)."""
+    if not _static_week(year, week, request_args):
+        return None
+    try:
+        from static_rankings import read_team_shard_body
+        body = read_team_shard_body(year, week, team_name, accept_encodings)
+    except Exception as e:
+        print(f"Team shard read error: {e}")
+        return None
+    if body is not None:
+        print(f"STATIC HIT: team {team_name} {year} week={week}")
+    return body
+
+
 def get_or_calculate_rankings(
     data_processor: CFBDataProcessor,
     year: int,
@@ -259,8 +539,8 @@ def get_or_calculate_rankings(
     *,
     prefer_static: bool = True,
 ) -> Optional[Dict[str, Any]]:
-    # Archived weeks: try precomputed static file first (no CFBD / no solver)
-    if prefer_static and week is not None and is_archived_week(year, week):
+    # Archived default-config weeks: try precomputed static file first (no CFBD / no solver)
+    if prefer_static and _static_week(year, week, request_args):
         try:
             from static_rankings import read_static_rankings
             static = read_static_rankings(year, week)
@@ -272,6 +552,7 @@ def get_or_calculate_rankings(
 
     cache = get_cache()
     key = rankings_cache_key(year, week, request_args)
+    note_rankings_request(key)
     cached = cache.get(key)
     if cached is not None:
         print(f"Cache HIT: computed rankings {year} week={week}")
@@ -280,11 +561,132 @@ def get_or_calculate_rankings(
     print(f"Cache MISS: computed rankings {year} week={week}")
     data = calculate_rankings_logic(data_processor, year, week, request_args)
     if data:
-        cache.set(key, data, TTL_RANKINGS, prefix='rankings_computed')
-        if week is not None and is_archived_week(year, week):
+        store_computed_rankings(key, year, week, data, request_args)
+    return data
+
+
+def record_rankings_history(year: int, week: int, digest: str, data: Dict[str, Any]) -> None:
+    """Append a default-config week to the rankings history store (never fails the caller)."""
+    try:
+        from rankings_history import get_rankings_history
+        get_rankings_history().record_week(year, week, digest, data)
+    except Exception as e:
+        print(f"Rankings history write error: {e}")
+
+
+def store_computed_rankings(
+    key: str,
+    year: int,
+    week: Optional[int],
+    data: Dict[str, Any],
+    request_args=None,
+) -> None:
+    """Cache a freshly computed payload with its version and bodies; default-config payloads also get
+    team breakdowns, history and (if past) static files."""
+    get_cache().set(key, data, TTL_RANKINGS, prefix='rankings_computed')
+    version = store_rankings_version(key, data)
+    store_rankings_bodies(key, data)
+    if not is_default_rankings_request(request_args or {}):
+        # Custom and all-divisions payloads are one-offs: their team pages build on request
+        return
+    try:
+        store_team_breakdowns(version.digest, data)
+    except Exception as e:
+        print(f"Team breakdown precompute error: {e}")
+    if week is None:
+        return
+    record_rankings_history(year, week, version.digest, data)
+    if is_archived_week(year, week):
+        try:
+            from static_rankings import write_static_columnar, write_static_rankings, write_team_shards
+            slim = slim_rankings_for_list(data)
+            write_static_rankings(slim, year, week)
+            write_static_columnar(slim, year, week)
+            write_team_shards(data, year, week)
+        except Exception as e:
+            print(f"Static rankings write error: {e}")
+
+
+BATCH_MAX_ITEMS = int(os.environ.get('BATCH_MAX_ITEMS', '64'))
+# Before this week a season's games are regular-season only, so one fetch through
+# the latest requested week covers every earlier week by filtering on `week`
+_SHARED_FETCH_BEFORE_WEEK = 15
+
+
+class BatchItem(NamedTuple):
+    year: int
+    week: Optional[int]
+    args: Dict[str, str]  # rankings_cache_key / build_config params
+
+
+def _batch_hit(item: BatchItem, variant: str) -> Optional[Tuple[str, str]]:
+    """(source, body) from static files (default config only) or the cache, without computing."""
+    if variant == 'list':
+        static = get_static_rankings_body(item.year, item.week, item.args)
+        if static is not None:
+            return 'static', bytes(static.data).decode('utf-8')
+    key = rankings_cache_key(item.year, item.week, item.args)
+    note_rankings_request(key)
+    body = get_cache().get(_body_key(key, variant))
+    if body is None:
+        cached = get_cache().get(key)
+        if cached is None:
+            return None
+        body = serialize_rankings(rankings_variant(cached, variant))
+    return 'cache', body
+
+
+def _batch_error(item: BatchItem, e: Exception) -> Tuple[BatchItem, str, None]:
+    print(f"Batch item {item.year} week={item.week} config={item.args} error: {e}")
+    return item, 'error', None
+
+
+def iter_rankings_batch(
+    data_processor: CFBDataProcessor,
+    items: Sequence[BatchItem],
+    variant: str = 'list',
+) -> Iterator[Tuple[BatchItem, str, Optional[str]]]:
+    """(item, source, body) for every item as it resolves: static and cache hits first,
+    then misses per season, sharing one game fetch (and the season's cached priors).
+    body is None when there is no data for the item; source is 'error' (body None)
+    when that item failed, and the rest of the batch still runs."""
+    misses: Dict[int, List[BatchItem]] = {}
+    for item in items:
+        try:
+            hit = _batch_hit(item, variant)
+        except Exception as e:
+            yield _batch_error(item, e)
+            continue
+        if hit is not None:
+            yield (item, *hit)
+        else:
+            misses.setdefault(item.year, []).append(item)
+
+    for year, pending in misses.items():
+        shared = [i for i in pending if i.week is not None and i.week < _SHARED_FETCH_BEFORE_WEEK]
+        games: Optional[List[Dict[str, Any]]] = None
+        if len(shared) > 1:
+            through = max(i.week for i in shared)
+            print(f"Batch: fetching games for {year} through week {through} once for {len(shared)} weeks")
             try:
-                from static_rankings import write_static_rankings
-                write_static_rankings(slim_rankings_for_list(data), year, week)
+                games = data_processor.get_games_for_season(year, through_week=through)
             except Exception as e:
-                print(f"Static rankings write error: {e}")
-    return data
+                # Each item falls back to its own fetch (and its own error line)
+                print(f"Batch: shared fetch for {year} failed: {e}")
+        for item in sorted(pending, key=lambda i: (i.week is None, i.week or 0)):
+            try:
+                if games is not None and item in shared:
+                    key = rankings_cache_key(year, item.week, item.args)
+                    data = calculate_rankings_logic(
+                        data_processor, year, item.week, item.args,
+                        games=[g for g in games if g['week'] <= item.week],
+                    )
+                    if data:
+                        store_computed_rankings(key, year, item.week, data, item.args)
+                else:
+                    data = get_or_calculate_rankings(data_processor, year, item.week, item.args, prefer_static=False)
+                body = serialize_rankings(rankings_variant(data, variant)) if data else None
+            except Exception as e:
+                yield _batch_error(item, e)
+                continue
+            yield item, 'computed', body
@@ -0,0 +1,188 @@
+"""
+Append-only rankings history (SQLite) behind the team and conference trajectory APIs.
+
+Every computed or precomputed default-config week is recorded as a snapshot
+(season, week, payload digest) with one row per team and per conference,
+indexed by (team, season, week) and (conference, season, week). Recording
+a week's latest payload again is a no-op; a recomputed live week appends a
+new snapshot (or re-promotes an earlier one with the same digest, so A -> B
+-> A ends on A) and reads use the latest one per week by sequence. A
+season's trajectory is one indexed query, with no payload loading or solver
+work.
+"""
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from cache import CACHE_DIR
+from team_lookup import canonical_team_key, normalize_team_name
+
+RANKINGS_HISTORY_PATH = os.environ.get(
+    'RANKINGS_HISTORY_PATH', os.path.join(CACHE_DIR, 'rankings_history.sqlite3'),
+)
+
+# Score columns copied from each team row
+TEAM_FIELDS = (
+    'final_ranking_score', 'team_quality_score', 'record_score',
+    'conference_quality_score', 'sos', 'sov',
+)
+CONFERENCE_FIELDS = ('average_team_quality', 'number_of_teams')
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS snapshots ('
+    ' id INTEGER PRIMARY KEY AUTOINCREMENT,'
+    ' season INTEGER NOT NULL,'
+    ' week INTEGER NOT NULL,'
+    ' digest TEXT NOT NULL,'
+    ' recorded_at REAL NOT NULL,'
+    ' seq INTEGER NOT NULL DEFAULT 0,'
+    ' UNIQUE (season, week, digest))',
+    'CREATE TABLE IF NOT EXISTS team_ranks ('
+    ' snapshot_id INTEGER NOT NULL,'
+    ' season INTEGER NOT NULL,'
+    ' week INTEGER NOT NULL,'
+    ' team_key TEXT NOT NULL,'
+    ' team TEXT NOT NULL,'
+    ' conference TEXT,'
+    ' rank INTEGER NOT NULL,'
+    ' wins INTEGER,'
+    ' losses INTEGER,'
+    + ''.join(f' {field} REAL,' for field in TEAM_FIELDS) +
+    ' PRIMARY KEY (snapshot_id, team_key))',
+    'CREATE INDEX IF NOT EXISTS idx_team_ranks_team ON team_ranks (team_key, season, week)',
+    'CREATE TABLE IF NOT EXISTS conference_ranks ('
+    ' snapshot_id INTEGER NOT NULL,'
+    ' season INTEGER NOT NULL,'
+    ' week INTEGER NOT NULL,'
+    ' conference_key TEXT NOT NULL,'
+    ' conference TEXT NOT NULL,'
+    ' conference_type TEXT,'
+    ' rank INTEGER NOT NULL,'
+    + ''.join(f' {field} REAL,' for field in CONFERENCE_FIELDS) +
+    ' PRIMARY KEY (snapshot_id, conference_key))',
+    'CREATE INDEX IF NOT EXISTS idx_conference_ranks_conference ON conference_ranks (conference_key, season, week)',
+)
+
+# Latest snapshot of each week in a season (SQLite takes id from the MAX(seq) row)
+_LATEST = 'SELECT id FROM (SELECT id, MAX(seq) FROM snapshots WHERE season = ? GROUP BY week)'
+
+
+class RankingsHistory:
+    """SQLite-backed per-week team and conference ranks."""
+
+    def __init__(self, path: str = RANKINGS_HISTORY_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            columns = {row[1] for row in conn.execute('PRAGMA table_info(snapshots)')}
+            if 'seq' not in columns:
+                # Histories from before the sequence: insertion order was the order
+                conn.execute('ALTER TABLE snapshots ADD COLUMN seq INTEGER NOT NULL DEFAULT 0')
+                conn.execute('UPDATE snapshots SET seq = id')
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=10.0)
+
+    def record_week(self, year: int, week: int, digest: str, data: Dict[str, Any]) -> bool:
+        """Make a week's payload its latest snapshot; False when it already is."""
+        teams = data.get('team_rankings') or []
+        conferences = data.get('conference_rankings') or []
+        with self._connect() as conn:
+            latest = conn.execute(
+                'SELECT digest FROM snapshots WHERE season = ? AND week = ? ORDER BY seq DESC LIMIT 1',
+                (year, week),
+            ).fetchone()
+            if latest is not None and latest[0] == digest:
+                return False
+            seq = conn.execute('SELECT COALESCE(MAX(seq), 0) + 1 FROM snapshots').fetchone()[0]
+            # An earlier payload come back: its rows are already stored, just promote it
+            cursor = conn.execute(
+                'UPDATE snapshots SET seq = ?, recorded_at = ? WHERE season = ? AND week = ? AND digest = ?',
+                (seq, time.time(), year, week, digest),
+            )
+            if cursor.rowcount:
+                return True
+            cursor = conn.execute(
+                'INSERT INTO snapshots (season, week, digest, recorded_at, seq) VALUES (?, ?, ?, ?, ?)',
+                (year, week, digest, time.time(), seq),
+            )
+            snapshot = cursor.lastrowid
+            conn.executemany(
+                'INSERT OR IGNORE INTO team_ranks (snapshot_id, season, week, team_key, team, conference, '
+                'rank, wins, losses, ' + ', '.join(TEAM_FIELDS) + ') '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?' + ', ?' * len(TEAM_FIELDS) + ')',
+                [
+                    (
+                        snapshot, year, week, normalize_team_name(team['team_name']), team['team_name'],
+                        team.get('conference'), i + 1,
+                        (team.get('records') or {}).get('total_wins'),
+                        (team.get('records') or {}).get('total_losses'),
+                        *(team.get(field) for field in TEAM_FIELDS),
+                    )
+                    for i, team in enumerate(teams)
+                ],
+            )
+            conn.executemany(
+                'INSERT OR IGNORE INTO conference_ranks (snapshot_id, season, week, conference_key, conference, '
+                'conference_type, rank, ' + ', '.join(CONFERENCE_FIELDS) + ') '
+                'VALUES (?, ?, ?, ?, ?, ?, ?' + ', ?' * len(CONFERENCE_FIELDS) + ')',
+                [
+                    (
+                        snapshot, year, week, normalize_team_name(conf['conference_name']),
+                        conf['conference_name'], conf.get('conference_type'), i + 1,
+                        *(conf.get(field) for field in CONFERENCE_FIELDS),
+                    )
+                    for i, conf in enumerate(conferences)
+                ],
+            )
+        return True
+
+    def team_history(self, team_name: str, year: int) -> List[Dict[str, Any]]:
+        """A team's rank and scores for every recorded week of a season (name or alias)."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                'SELECT week, team, conference, rank, wins, losses, ' + ', '.join(TEAM_FIELDS) +
+                ' FROM team_ranks WHERE team_key = ? AND season = ? AND snapshot_id IN (' + _LATEST + ')'
+                ' ORDER BY week',
+                (canonical_team_key(team_name), year, year),
+            ).fetchall()
+        names = ('week', 'team_name', 'conference', 'rank', 'wins', 'losses', *TEAM_FIELDS)
+        return [dict(zip(names, row)) for row in rows]
+
+    def conference_history(self, conference_name: str, year: int) -> List[Dict[str, Any]]:
+        """A conference's rank and averages for every recorded week of a season."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                'SELECT week, conference, conference_type, rank, ' + ', '.join(CONFERENCE_FIELDS) +
+                ' FROM conference_ranks WHERE conference_key = ? AND season = ? AND snapshot_id IN ('
+                + _LATEST + ') ORDER BY week',
+                (normalize_team_name(conference_name), year, year),
+            ).fetchall()
+        names = ('week', 'conference_name', 'conference_type', 'rank', *CONFERENCE_FIELDS)
+        return [dict(zip(names, row)) for row in rows]
+
+    def recorded_weeks(self, year: int) -> List[int]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                'SELECT DISTINCT week FROM snapshots WHERE season = ? ORDER BY week', (year,),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+
+_history: Optional[RankingsHistory] = None
+_history_lock = threading.Lock()
+
+
+def get_rankings_history() -> RankingsHistory:
+    global _history
+    with _history_lock:
+        if _history is None:
+            _history = RankingsHistory()
+        return _history
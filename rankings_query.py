@@ -0,0 +1,149 @@
+"""
+Field projection, paging and conference filters for /rankings.
+
+    /rankings?year=2024&week=5&limit=25&fields=team_name,final_ranking_score,logo
+    /rankings?year=2024&week=5&conference=SEC,Big Ten&conference_type=Power 4
+
+Filters select teams by conference / conference type (comma-separated,
+case-insensitive) using per-payload row indexes, which are built once per
+payload version and kept in a small LRU, so a query costs index lookups plus
+copying the rows it returns. offset/limit page the filtered rows, fields
+projects them (team_name is always kept). Every returned row gets its overall
+`rank`, and the payload gains `query: {"total", "offset", "limit"}`. Conference
+filters also apply to conference_rankings; with `fields`, that table is only
+included when `conference_rankings` is one of the fields.
+"""
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+QUERY_INDEX_ENTRIES = int(os.environ.get('QUERY_INDEX_ENTRIES', '64'))
+# Query param -> team row field it filters on
+FILTER_FIELDS = {'conference': 'conference', 'conference_type': 'conference_type'}
+
+
+class RankingsQuery(NamedTuple):
+    fields: Optional[Tuple[str, ...]]
+    limit: Optional[int]
+    offset: int
+    conference: Optional[Tuple[str, ...]]
+    conference_type: Optional[Tuple[str, ...]]
+
+    @property
+    def key(self) -> str:
+        """Canonical form, for ETags and cache keys."""
+        parts = []
+        for name, value in self._asdict().items():
+            if isinstance(value, tuple):
+                value = ','.join(value)
+            if value not in (None, 0, ''):
+                parts.append(f'{name}={value}')
+        return '&'.join(parts)
+
+
+def _split(value: Optional[str], lower: bool = False) -> Optional[Tuple[str, ...]]:
+    if not value:
+        return None
+    items = (item.strip() for item in value.split(','))
+    items = (item.lower() if lower else item for item in items if item)
+    return tuple(dict.fromkeys(items)) or None
+
+
+def _non_negative(args, name: str) -> Optional[int]:
+    raw = args.get(name)
+    if raw in (None, ''):
+        return None
+    try:
+        value = int(raw)
+    except (TypeError, ValueError):
+        raise ValueError(f'{name} must be an integer') from None
+    if value < 0:
+        raise ValueError(f'{name} must be >= 0')
+    return value
+
+
+def parse_rankings_query(args) -> Optional[RankingsQuery]:
+    """Query from request args; None when no projection/paging/filter is asked for.
+
+    Raises ValueError for malformed limit/offset.
+    """
+    query = RankingsQuery(
+        fields=_split(args.get('fields')),
+        limit=_non_negative(args, 'limit'),
+        offset=_non_negative(args, 'offset') or 0,
+        conference=_split(args.get('conference'), lower=True),
+        conference_type=_split(args.get('conference_type'), lower=True),
+    )
+    return query if query.key else None
+
+
+class QueryIndex:
+    """Row positions of a team list by lowercase conference / conference type."""
+
+    def __init__(self, teams: List[Dict[str, Any]]):
+        self.size = len(teams)
+        self.positions: Dict[str, Dict[str, List[int]]] = {name: {} for name in FILTER_FIELDS}
+        for i, team in enumerate(teams):
+            for name, field in FILTER_FIELDS.items():
+                value = str(team.get(field) or '').lower()
+                self.positions[name].setdefault(value, []).append(i)
+
+    def select(self, query: RankingsQuery) -> List[int]:
+        selected: Optional[set] = None
+        for name in FILTER_FIELDS:
+            wanted = getattr(query, name)
+            if not wanted:
+                continue
+            rows = {i for value in wanted for i in self.positions[name].get(value, ())}
+            selected = rows if selected is None else selected & rows
+        return list(range(self.size)) if selected is None else sorted(selected)
+
+
+_indexes: 'OrderedDict[str, QueryIndex]' = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def query_index(version: str, teams: List[Dict[str, Any]]) -> QueryIndex:
+    """Index for a payload version (built once, LRU of QUERY_INDEX_ENTRIES)."""
+    with _indexes_lock:
+        index = _indexes.get(version)
+        if index is not None and index.size == len(teams):
+            _indexes.move_to_end(version)
+            return index
+    index = QueryIndex(teams)
+    with _indexes_lock:
+        _indexes[version] = index
+        while len(_indexes) > QUERY_INDEX_ENTRIES:
+            _indexes.popitem(last=False)
+    return index
+
+
+def _project(team: Dict[str, Any], rank: int, fields: Optional[Tuple[str, ...]]) -> Dict[str, Any]:
+    if fields is None:
+        return {'rank': rank, **team}
+    row = {'rank': rank, 'team_name': team.get('team_name')}
+    row.update((field, team[field]) for field in fields if field in team)
+    return row
+
+
+def apply_rankings_query(payload: Dict[str, Any], query: RankingsQuery, version: str) -> Dict[str, Any]:
+    """New payload with filtered, paged and projected team rows (input not mutated)."""
+    teams = payload.get('team_rankings') or []
+    selected = query_index(version, teams).select(query)
+    end = None if query.limit is None else query.offset + query.limit
+    page = selected[query.offset:end]
+    result = dict(payload)
+    result['team_rankings'] = [_project(teams[i], i + 1, query.fields) for i in page]
+    if query.fields is not None and 'conference_rankings' not in query.fields:
+        result.pop('conference_rankings', None)
+    elif query.conference or query.conference_type:
+        result['conference_rankings'] = [
+            conf for conf in payload.get('conference_rankings') or []
+            if (not query.conference or str(conf.get('conference_name', '')).lower() in query.conference)
+            and (not query.conference_type or str(conf.get('conference_type', '')).lower() in query.conference_type)
+        ]
+    result['query'] = {'total': len(selected), 'offset': query.offset, 'limit': query.limit}
+    return result
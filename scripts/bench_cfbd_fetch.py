@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Benchmark cold week-scoped game fetches against a local fake CFBD server.
+
+Usage:
+  ./venv/bin/python scripts/bench_cfbd_fetch.py
+  ./venv/bin/python scripts/bench_cfbd_fetch.py --through-week 14 --latency-ms 120 --concurrency 1 4 8
+
+Each run uses an empty cache and game store, so every week is a live (fake)
+CFBD call. Reports wall time of week-by-week fetching per concurrency level,
+checks the spend-guard call count matches the requests the server actually
+saw, then times the planner path of get_games_for_season (one season call).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+os.environ['CFBD_OFFLINE'] = '0'
+os.environ.setdefault('CFBD_API_KEY', 'bench-key')
+os.environ.pop('CFBD_MAX_CALLS', None)
+
+from api_integration import CFBDApiClient  # noqa: E402
+from cache import Cache, FileCacheBackend  # noqa: E402
+from cfbd_scheduler import CallLedger, CFBDScheduler, reset_scheduler  # noqa: E402
+from data_processor import CFBDataProcessor  # noqa: E402
+from game_store import GameStore  # noqa: E402
+from spend_guards import get_cfbd_call_count, reset_cfbd_call_count  # noqa: E402
+
+
+class FakeCFBD(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    latency_s = 0.08
+    season_weeks = 14
+    hits = 0
+    connections = set()
+    lock = threading.Lock()
+
+    def do_GET(self):  # noqa: N802 - http.server API
+        with FakeCFBD.lock:
+            FakeCFBD.hits += 1
+            FakeCFBD.connections.add(self.client_address)
+        time.sleep(FakeCFBD.latency_s)
+        query = parse_qs(urlparse(self.path).query)
+        weeks = [int(query['week'][0])] if 'week' in query else list(range(1, FakeCFBD.season_weeks + 1))
+        games = [
+            {
+                'id': week * 1000 + i,
+                'week': week,
+                'season': int(query.get('year', ['2024'])[0]),
+                'homeTeam': f'Home{week}-{i}',
+                'awayTeam': f'Away{week}-{i}',
+                'homePoints': 24,
+                'awayPoints': 17,
+                'homeConference': 'SEC',
+                'awayConference': 'ACC',
+            }
+            for week in weeks
+            for i in range(60)
+        ]
+        body = json.dumps(games).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('X-CallLimit-Remaining', '1000')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def run_once(base_url: str, through_week: int, concurrency: int, planned: bool = False) -> dict:
+    os.environ['CFBD_FETCH_CONCURRENCY'] = str(concurrency)
+    reset_cfbd_call_count()
+    FakeCFBD.hits = 0
+    FakeCFBD.connections = set()
+    with tempfile.TemporaryDirectory() as tmp:
+        # Unthrottled scheduler with a throwaway ledger: measure the transport only
+        reset_scheduler(CFBDScheduler(
+            rate_per_sec=1000.0,
+            burst=1000,
+            ledger=CallLedger(f'{tmp}/ledger.sqlite3'),
+        ))
+        store = GameStore(f'{tmp}/games.sqlite3')
+        store.upsert_teams({'Home1-0': {'conference': 'SEC'}})
+        client = CFBDApiClient(api_key='bench-key', base_url=base_url, game_store=store)
+        client._cache = Cache(backend=FileCacheBackend(cache_dir=tmp))
+        processor = CFBDataProcessor(api_client=client)
+        start = time.perf_counter()
+        if planned:
+            games = processor.get_games_for_season(2024, through_week=through_week)
+        else:
+            weeks = list(range(1, through_week + 1))
+            games = [g for week_games in processor._fetch_weeks(2024, weeks) for g in week_games]
+        elapsed = time.perf_counter() - start
+    return {
+        'concurrency': concurrency,
+        'seconds': elapsed,
+        'games': len(games),
+        'server_hits': FakeCFBD.hits,
+        'budget_calls': get_cfbd_call_count(),
+        'connections': len(FakeCFBD.connections),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark pooled CFBD week fetches')
+    parser.add_argument('--through-week', type=int, default=14)
+    parser.add_argument('--latency-ms', type=float, default=80.0)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 8])
+    args = parser.parse_args()
+
+    FakeCFBD.latency_s = args.latency_ms / 1000.0
+    FakeCFBD.season_weeks = args.through_week
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeCFBD)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f'http://127.0.0.1:{server.server_address[1]}'
+
+    print(f'Fake CFBD at {base_url} latency={args.latency_ms:.0f}ms weeks=1..{args.through_week}')
+    baseline = None
+    ok = True
+    for n in args.concurrency:
+        result = run_once(base_url, args.through_week, n)
+        baseline = baseline or result['seconds']
+        exact = result['server_hits'] == result['budget_calls']
+        ok = ok and exact
+        print(
+            f"concurrency={n:<3} {result['seconds'] * 1000:8.1f} ms "
+            f"speedup={baseline / result['seconds']:.2f}x "
+            f"hits={result['server_hits']} budget={result['budget_calls']} "
+            f"connections={result['connections']} games={result['games']}"
+            + ('' if exact else '  BUDGET MISMATCH')
+        )
+    planned = run_once(base_url, args.through_week, max(args.concurrency), planned=True)
+    print(
+        f"planner         {planned['seconds'] * 1000:8.1f} ms "
+        f"speedup={baseline / planned['seconds']:.2f}x "
+        f"hits={planned['server_hits']} budget={planned['budget_calls']} games={planned['games']}"
+    )
+    server.shutdown()
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
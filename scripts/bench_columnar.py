@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Compare row-oriented and columnar rankings payload sizes.
+
+Usage:
+  ./venv/bin/python scripts/bench_columnar.py
+  ./venv/bin/python scripts/bench_columnar.py --precision 2
+
+Encodes every frontend/static/rankings/2024/week-*.json list payload with
+columnar_rankings.encode_columnar and reports raw and gzip sizes, plus the
+decode round-trip time.
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import fast_json  # noqa: E402
+from columnar_rankings import DEFAULT_PRECISION, decode_columnar, encode_columnar  # noqa: E402
+
+FIXTURES = ROOT / 'frontend' / 'static' / 'rankings' / '2024'
+
+
+def sizes(body: bytes) -> tuple:
+    return len(body), len(gzip.compress(body, 6))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Compare row vs columnar rankings sizes')
+    parser.add_argument('--precision', type=int, default=DEFAULT_PRECISION)
+    args = parser.parse_args()
+
+    paths = sorted(
+        (p for p in FIXTURES.glob('week-*.json') if '.' not in p.stem),  # skip .story/.why files
+        key=lambda p: int(p.stem.split('-')[1]),
+    )
+    totals = [0, 0, 0, 0]
+    decode_s = 0.0
+    for path in paths:
+        payload = fast_json.loads(path.read_bytes())
+        rows = sizes(fast_json.dumps_bytes(payload))
+        doc = encode_columnar(payload, args.precision)
+        cols = sizes(fast_json.dumps_bytes(doc))
+        start = time.perf_counter()
+        decode_columnar(doc)
+        decode_s += time.perf_counter() - start
+        for i, n in enumerate(rows + cols):
+            totals[i] += n
+        print(
+            f'{path.name:<13} rows {rows[0]:>8} B (gz {rows[1]:>6})  '
+            f'columnar {cols[0]:>7} B (gz {cols[1]:>6})'
+        )
+    raw, raw_gz, col, col_gz = totals
+    print(
+        f'total         rows {raw:>8} B (gz {raw_gz:>6})  columnar {col:>7} B (gz {col_gz:>6})  '
+        f'-{100 * (1 - col / raw):.1f}% raw, -{100 * (1 - col_gz / raw_gz):.1f}% gzip, '
+        f'decode {decode_s / len(paths) * 1000:.2f} ms/file'
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark conditional /rankings requests against the frontend's polling pattern.
+
+Usage:
+  ./venv/bin/python scripts/bench_conditional.py
+  ./venv/bin/python scripts/bench_conditional.py --polls 50 --week 5
+
+The frontend re-requests the same rankings URL whenever its 5-minute client
+cache lapses. This primes a computed-rankings cache entry from a 2024 static
+fixture (as a live week, so it is not served from static files) and replays
+N polls of the list, detail and team views: once unconditionally, once with
+If-None-Match from the previous response. Reports bytes on the wire and
+mean latency per request.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+_tmp = tempfile.TemporaryDirectory()
+os.environ['CACHE_DIR'] = _tmp.name
+os.environ['CFBD_OFFLINE'] = '1'
+os.environ.setdefault('CFBD_API_KEY', 'bench-key')
+os.environ['WARM_STATE_INTERVAL'] = '0'
+
+from app import app  # noqa: E402
+from cache import TTL_RANKINGS, get_cache  # noqa: E402
+from ranking_service import rankings_cache_key, store_rankings_version  # noqa: E402
+
+LIVE_YEAR = 2099  # never archived, so requests go through the computed cache
+
+
+def prime(week: int) -> dict:
+    fixture = ROOT / 'frontend' / 'static' / 'rankings' / '2024' / f'week-{week}.json'
+    payload = json.loads(fixture.read_text())
+    payload.update({'year': LIVE_YEAR, 'week': week})
+    key = rankings_cache_key(LIVE_YEAR, week, {})
+    get_cache().set(key, payload, TTL_RANKINGS, prefix='rankings_computed')
+    store_rankings_version(key, payload)
+    return payload
+
+
+def poll(client, url: str, polls: int, conditional: bool) -> dict:
+    etag = None
+    total_bytes = 0
+    not_modified = 0
+    start = time.perf_counter()
+    for _ in range(polls):
+        headers = {'If-None-Match': etag} if conditional and etag else {}
+        response = client.get(url, headers=headers)
+        total_bytes += len(response.data)
+        not_modified += response.status_code == 304
+        etag = response.headers.get('ETag') or etag
+    elapsed = time.perf_counter() - start
+    return {'bytes': total_bytes, 'ms': elapsed / polls * 1000, 'not_modified': not_modified}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark ETag/304 savings for /rankings polling')
+    parser.add_argument('--polls', type=int, default=20)
+    parser.add_argument('--week', type=int, default=5)
+    args = parser.parse_args()
+
+    payload = prime(args.week)
+    team = payload['team_rankings'][0]['team_name']
+    urls = {
+        'list': f'/rankings?year={LIVE_YEAR}&week={args.week}',
+        'detail': f'/rankings?year={LIVE_YEAR}&week={args.week}&detail=true',
+        'team': f'/rankings/team/{team}?year={LIVE_YEAR}&week={args.week}',
+    }
+    client = app.test_client()
+    print(f'{args.polls} polls per view, payload from 2024 week {args.week}')
+    for view, url in urls.items():
+        full = poll(client, url, args.polls, conditional=False)
+        cond = poll(client, url, args.polls, conditional=True)
+        print(
+            f"{view:<7} full {full['bytes']:>9} B {full['ms']:6.2f} ms/req | "
+            f"conditional {cond['bytes']:>8} B {cond['ms']:6.2f} ms/req "
+            f"({cond['not_modified']} x 304) "
+            f"saved {100 * (1 - cond['bytes'] / full['bytes']):.1f}% bytes"
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark JSON serialization over the 2024 static rankings fixtures.
+
+Usage:
+  ./venv/bin/python scripts/bench_json.py
+  ./venv/bin/python scripts/bench_json.py --repeat 50
+
+Compares stdlib json with fast_json (orjson when installed) for parsing and
+serializing every frontend/static/rankings/2024/week-*.json file, and Flask's
+DefaultJSONProvider with FastJSONProvider for building a response.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from flask import Flask  # noqa: E402
+from flask.json.provider import DefaultJSONProvider  # noqa: E402
+
+import fast_json  # noqa: E402
+from json_provider import FastJSONProvider  # noqa: E402
+
+FIXTURES = ROOT / 'frontend' / 'static' / 'rankings' / '2024'
+
+
+def timed(fn, items, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for item in items:
+            fn(item)
+    return (time.perf_counter() - start) / (repeat * len(items)) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark stdlib json vs fast_json')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    raws = [p.read_bytes() for p in sorted(FIXTURES.glob('week-*.json'))]
+    payloads = [json.loads(raw) for raw in raws]
+    total_kb = sum(len(r) for r in raws) / 1024
+    print(f'{len(raws)} files ({total_kb:.0f} KB) from {FIXTURES}, backend={fast_json.BACKEND}')
+
+    app = Flask(__name__)
+    default_provider = DefaultJSONProvider(app)
+    fast_provider = FastJSONProvider(app)
+    rows = [
+        ('loads', lambda r: json.loads(r), fast_json.loads, raws),
+        ('dumps', lambda p: json.dumps(p, separators=(',', ':')), fast_json.dumps_bytes, payloads),
+        ('dumps sorted', lambda p: json.dumps(p, sort_keys=True), lambda p: fast_json.dumps_bytes(p, sort_keys=True), payloads),
+    ]
+    with app.app_context():
+        rows.append(('flask response', default_provider.response, fast_provider.response, payloads))
+        for name, baseline, fast, items in rows:
+            slow_ms = timed(baseline, items, args.repeat)
+            fast_ms = timed(fast, items, args.repeat)
+            print(f'{name:<15} stdlib {slow_ms:7.3f} ms/file  fast {fast_ms:7.3f} ms/file  {slow_ms / fast_ms:5.1f}x')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
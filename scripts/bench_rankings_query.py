@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Report /rankings payload sizes for common widget queries.
+
+Usage:
+  ./venv/bin/python scripts/bench_rankings_query.py
+  ./venv/bin/python scripts/bench_rankings_query.py --week 10 --repeat 200
+
+Serves the 2024 frontend/static/rankings fixtures as the static root (an
+archived week, so no solver runs) and compares the full list with
+fields/limit/offset/conference queries: raw and gzip bytes, and mean latency
+through the Flask test client.
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+_tmp = tempfile.TemporaryDirectory()
+os.environ['STATIC_RANKINGS_DIR'] = str(ROOT / 'frontend' / 'static' / 'rankings')
+os.environ['CACHE_DIR'] = _tmp.name
+os.environ['CFBD_OFFLINE'] = '1'
+os.environ.setdefault('CFBD_API_KEY', 'bench-key')
+os.environ['WARM_STATE_INTERVAL'] = '0'
+
+from app import app  # noqa: E402
+
+QUERIES = {
+    'full list': '',
+    'top 25 (name, score, logo)': '&limit=25&fields=final_ranking_score,logo',
+    'top 25 columnar': '&limit=25&fields=final_ranking_score,logo&format=columnar',
+    'SEC only': '&conference=SEC',
+    'Power 4 standings': '&conference_type=Power 4&fields=conference,final_ranking_score,records',
+    'page 2 of 25': '&limit=25&offset=25&fields=final_ranking_score',
+}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Widget query payload sizes for /rankings')
+    parser.add_argument('--week', type=int, default=5)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    client = app.test_client()
+    base = f'/rankings?year=2024&week={args.week}'
+    full_raw = full_gz = None
+    print(f'2024 week {args.week}, {args.repeat} requests per query')
+    for label, params in QUERIES.items():
+        response = client.get(base + params)
+        assert response.status_code == 200, response.data[:200]
+        raw = len(response.data)
+        gz = len(gzip.compress(response.data, 6))
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            client.get(base + params)
+        ms = (time.perf_counter() - start) / args.repeat * 1000
+        full_raw, full_gz = full_raw or raw, full_gz or gz
+        print(
+            f'{label:<28} {raw:>8} B (gz {gz:>6} B)  '
+            f'-{100 * (1 - raw / full_raw):5.1f}% raw -{100 * (1 - gz / full_gz):5.1f}% gz  {ms:6.2f} ms'
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark reading a season from loose week files vs its {year}.bundle.
+
+Usage:
+  ./venv/bin/python scripts/bench_season_bundle.py
+  ./venv/bin/python scripts/bench_season_bundle.py --repeat 200
+
+Copies the frontend/static/rankings/{year} fixtures into a temporary static
+root (adding .gz siblings), packs write_season_bundle, then times cold and
+warm body/JSON reads of every week, story and why file through each layout
+and reports how many files the static index had to open.
+"""
+from __future__ import annotations
+
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import fast_json  # noqa: E402
+from static_rankings import (  # noqa: E402
+    bundle_path_for,
+    get_static_index,
+    read_static_rankings,
+    read_static_rankings_body,
+    read_week_story,
+    read_why_blurbs,
+    write_season_bundle,
+    write_static_rankings,
+)
+
+FIXTURES = ROOT / 'frontend' / 'static' / 'rankings'
+
+
+def read_season(year: int, weeks, root: str) -> None:
+    for week in weeks:
+        read_static_rankings_body(year, week, ['gzip'], root=root)
+        read_static_rankings(year, week, root=root)
+        read_week_story(year, week, root=root)
+        read_why_blurbs(year, week, root=root)
+
+
+def timed(year: int, weeks, root: str, repeat: int) -> tuple:
+    index = get_static_index()
+    index.clear()
+    loads_before = index.loads
+    start = time.perf_counter()
+    read_season(year, weeks, root)
+    cold_ms = (time.perf_counter() - start) * 1000
+    opened = index.loads - loads_before
+    start = time.perf_counter()
+    for _ in range(repeat):
+        read_season(year, weeks, root)
+    warm_us = (time.perf_counter() - start) / (repeat * len(weeks)) * 1e6
+    return cold_ms, warm_us, opened
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark season bundle reads')
+    parser.add_argument('--year', type=int, default=2024)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    source = FIXTURES / str(args.year)
+    weeks = sorted(int(p.stem.split('-')[1]) for p in source.glob('week-*.json') if p.stem.split('-')[1].isdigit())
+    with tempfile.TemporaryDirectory() as tmp:
+        for path in source.glob('week-*.json'):
+            if path.stem.split('-')[1].isdigit():
+                write_static_rankings(fast_json.loads(path.read_bytes()), args.year, int(path.stem.split('-')[1]), root=tmp)
+            else:
+                shutil.copy2(path, Path(tmp) / str(args.year) / path.name)
+
+        loose = timed(args.year, weeks, tmp, args.repeat)
+        bundle = write_season_bundle(args.year, root=tmp)
+        packed = timed(args.year, weeks, tmp, args.repeat)
+        assert bundle == bundle_path_for(args.year, root=tmp)
+        print(f'{len(weeks)} weeks, bundle {bundle.stat().st_size} B (with .gz siblings)')
+        for label, (cold_ms, warm_us, opened) in (('loose files', loose), ('bundle', packed)):
+            print(f'{label:<12} cold {cold_ms:7.2f} ms  warm {warm_us:7.1f} us/week  files opened {opened}')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
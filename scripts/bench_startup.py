@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Benchmark API startup: time from process spawn to first healthy response.
+
+Usage:
+  ./venv/bin/python scripts/bench_startup.py
+  ./venv/bin/python scripts/bench_startup.py --teams-latency-ms 3000 --runs 3
+
+Starts `app.py` in a subprocess against a local fake CFBD whose /teams call is
+slow, with an empty cache and game store, once with the lazy team registry
+(default) and once with TEAM_REGISTRY_EAGER=1. Reports time until `/` answers,
+until an archived static week (/rankings from STATIC_RANKINGS_DIR) answers, and
+until the registry reports ready in /cache/stats.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+class SlowTeams(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    latency_s = 2.0
+
+    def do_GET(self):  # noqa: N802 - http.server API
+        if self.path.startswith('/teams'):
+            time.sleep(SlowTeams.latency_s)
+            payload = [{'school': 'Georgia', 'conference': 'SEC', 'logos': ['g.png']}]
+        else:
+            payload = []
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def _get(url: str) -> Optional[bytes]:
+    try:
+        with urllib.request.urlopen(url, timeout=30) as resp:
+            return resp.read() if resp.status == 200 else None
+    except OSError:
+        return None
+
+
+def _wait_until(check: Callable[[], bool], start: float, deadline_s: float) -> Optional[float]:
+    while time.perf_counter() - start < deadline_s:
+        if check():
+            return time.perf_counter() - start
+        time.sleep(0.01)
+    return None
+
+
+def run_once(cfbd_url: str, eager: bool, week: int) -> dict:
+    port = _free_port()
+    base = f'http://127.0.0.1:{port}'
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {
+            **os.environ,
+            'PORT': str(port),
+            'CFBD_OFFLINE': '0',
+            'CFBD_API_KEY': os.environ.get('CFBD_API_KEY', 'bench-key'),
+            'CFBD_BASE_URL': cfbd_url,
+            'CACHE_DIR': tmp,
+            'GAME_STORE_PATH': f'{tmp}/games.sqlite3',
+            'CFBD_LEDGER_PATH': f'{tmp}/ledger.sqlite3',
+            'STATIC_RANKINGS_DIR': str(ROOT / 'frontend' / 'static' / 'rankings'),
+            'TEAM_REGISTRY_EAGER': '1' if eager else '0',
+            'FLASK_DEBUG': 'false',
+        }
+        start = time.perf_counter()
+        proc = subprocess.Popen(
+            [sys.executable, str(ROOT / 'app.py')],
+            cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        try:
+            healthy = _wait_until(lambda: _get(f'{base}/') is not None, start, 60)
+            static = _wait_until(
+                lambda: _get(f'{base}/rankings?year=2024&week={week}') is not None, start, 60
+            )
+
+            def registry_ready() -> bool:
+                body = _get(f'{base}/cache/stats')
+                return bool(body) and json.loads(body).get('team_registry_ready', True)
+
+            ready = _wait_until(registry_ready, start, 60)
+        finally:
+            proc.terminate()
+            proc.wait(timeout=10)
+    return {'healthy': healthy, 'static_week': static, 'registry_ready': ready}
+
+
+def _ms(value: Optional[float]) -> str:
+    return f'{value * 1000:8.1f} ms' if value is not None else '   timeout'
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark API time-to-first-healthy-response')
+    parser.add_argument('--teams-latency-ms', type=float, default=2000.0)
+    parser.add_argument('--week', type=int, default=5, help='Archived 2024 week to request')
+    parser.add_argument('--runs', type=int, default=1)
+    args = parser.parse_args()
+
+    SlowTeams.latency_s = args.teams_latency_ms / 1000.0
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SlowTeams)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    cfbd_url = f'http://127.0.0.1:{server.server_address[1]}'
+    print(f'Fake CFBD at {cfbd_url} /teams latency={args.teams_latency_ms:.0f}ms')
+
+    for eager in (True, False):
+        label = 'eager' if eager else 'lazy '
+        for _ in range(args.runs):
+            result = run_once(cfbd_url, eager, args.week)
+            print(
+                f"{label} healthy={_ms(result['healthy'])} "
+                f"static_week={_ms(result['static_week'])} "
+                f"registry_ready={_ms(result['registry_ready'])}"
+            )
+    server.shutdown()
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
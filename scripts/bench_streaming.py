@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Memory / time-to-first-byte benchmark for streamed /rankings responses.
+
+Usage:
+  ./venv/bin/python scripts/bench_streaming.py
+  ./venv/bin/python scripts/bench_streaming.py --clients 16 --copies 6
+
+Builds a heavy detail payload (the 2024 week-5 teams replicated --copies
+times, each with synthetic per-game wins/losses details, roughly an
+all-divisions detail view) and caches it as a live week. Then --clients
+threads request /rankings?detail=true at once and read the body in chunks,
+with RANKINGS_STREAM on and off:
+
+  payload  - no stored body: serialized from the cached payload
+  stored   - body already stored as a string in the cache
+
+Reports the tracemalloc peak above the baseline across all concurrent
+requests, mean time to first chunk and mean total time.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+_tmp = tempfile.TemporaryDirectory()
+os.environ['CACHE_DIR'] = _tmp.name
+os.environ['CFBD_OFFLINE'] = '1'
+os.environ.setdefault('CFBD_API_KEY', 'bench-key')
+os.environ['WARM_STATE_INTERVAL'] = '0'
+
+import app as app_module  # noqa: E402
+from cache import TTL_RANKINGS, get_cache  # noqa: E402
+from ranking_service import (  # noqa: E402
+    rankings_cache_key,
+    rankings_variant,
+    serialize_rankings,
+    store_rankings_body,
+    store_rankings_version,
+)
+
+LIVE_YEAR = 2099
+FIXTURE = ROOT / 'frontend' / 'static' / 'rankings' / '2024' / 'week-5.json'
+
+
+def heavy_payload(copies: int, week: int) -> dict:
+    slim = json.loads(FIXTURE.read_text())
+    teams = []
+    for copy in range(copies):
+        for team in slim['team_rankings']:
+            games = [
+                {
+                    'opponent': f'Opponent {g}', 'opponent_conference': 'FCS', 'week': g + 1,
+                    'score': f'{30 + g}-{10 + g}', 'opponent_rank': 40 + g, 'opponent_elo': 1400.123456 + g,
+                    'is_quality_win': g % 3 == 0, 'is_bad_loss': False, 'location': 'home', 'margin': 20,
+                }
+                for g in range(12)
+            ]
+            teams.append({**team, 'team_name': f"{team['team_name']} #{copy}", 'wins_details': games[:9],
+                          'losses_details': games[9:]})
+    return {**slim, 'detail': True, 'year': LIVE_YEAR, 'week': week, 'team_rankings': teams}
+
+
+def fetch(client, url: str) -> tuple:
+    start = time.perf_counter()
+    response = client.get(url, buffered=False)
+    first = None
+    size = 0
+    for chunk in response.response:
+        if first is None:
+            first = time.perf_counter() - start
+        size += len(chunk)
+    response.close()
+    return first, time.perf_counter() - start, size
+
+
+def run(url: str, clients: int, stream: bool) -> dict:
+    app_module.STREAM_RESPONSES = stream
+    local = threading.local()
+
+    def one(_):
+        if not hasattr(local, 'client'):
+            local.client = app_module.app.test_client()
+        return fetch(local.client, url)
+
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        results = list(pool.map(one, range(clients)))
+    peak = tracemalloc.get_traced_memory()[1] - base
+    return {
+        'peak_mb': peak / 1e6,
+        'ttfb_ms': sum(r[0] for r in results) / clients * 1000,
+        'total_ms': sum(r[1] for r in results) / clients * 1000,
+        'bytes': results[0][2],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark streamed /rankings responses')
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--copies', type=int, default=5)
+    args = parser.parse_args()
+
+    cache = get_cache()
+    urls = {}
+    for scenario, week in (('payload', 1), ('stored', 2)):
+        payload = heavy_payload(args.copies, week)
+        key = rankings_cache_key(LIVE_YEAR, week, {})
+        cache.set(key, payload, TTL_RANKINGS, prefix='rankings_computed')
+        store_rankings_version(key, payload)
+        if scenario == 'stored':
+            store_rankings_body(key, 'detail', serialize_rankings(rankings_variant(payload, 'detail')))
+        urls[scenario] = f'/rankings?year={LIVE_YEAR}&week={week}&detail=true'
+
+    tracemalloc.start()
+    teams = len(heavy_payload(args.copies, 1)['team_rankings'])
+    print(f'{teams} teams with game details, {args.clients} concurrent clients')
+    for scenario, url in urls.items():
+        for stream in (False, True):
+            run(url, 1, stream)  # warm
+            r = run(url, args.clients, stream)
+            print(
+                f"{scenario:<8} {'streamed' if stream else 'buffered':<9} body {r['bytes'] / 1e6:5.2f} MB  "
+                f"peak +{r['peak_mb']:7.2f} MB  first byte {r['ttfb_ms']:8.1f} ms  total {r['total_ms']:8.1f} ms"
+            )
+    tracemalloc.stop()
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Compare a season's transfer size as full week files vs base + week deltas.
+
+Usage:
+  ./venv/bin/python scripts/bench_week_deltas.py
+  ./venv/bin/python scripts/bench_week_deltas.py --year 2024
+
+Copies the slim frontend/static/rankings/{year}/week-N.json fixtures into a
+temporary static root, builds the delta bundle with write_season_deltas,
+checks every week rebuilds exactly, and reports raw and gzip bytes for all
+full files against base.json + every delta.
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import fast_json  # noqa: E402
+from static_rankings import encoded_path_for, read_week_from_deltas, write_season_deltas  # noqa: E402
+
+FIXTURES = ROOT / 'frontend' / 'static' / 'rankings'
+
+
+def sizes(paths) -> tuple:
+    raw = sum(p.stat().st_size for p in paths)
+    gz = sum(len(gzip.compress(p.read_bytes(), compresslevel=9, mtime=0)) for p in paths)
+    return raw, gz
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark week delta encoding')
+    parser.add_argument('--year', type=int, default=2024)
+    args = parser.parse_args()
+
+    full = sorted(
+        (p for p in (FIXTURES / str(args.year)).glob('week-*.json') if p.stem.split('-', 1)[1].isdigit()),
+        key=lambda p: int(p.stem.split('-', 1)[1]),
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        season = Path(tmp) / str(args.year)
+        season.mkdir()
+        for path in full:
+            shutil.copy2(path, season / path.name)
+        manifest_path = write_season_deltas(args.year, root=tmp)
+        manifest = fast_json.loads(manifest_path.read_bytes())
+        bundle = [manifest_path.parent / e['path'] for e in [manifest['base'], *manifest['deltas']]]
+
+        start = time.perf_counter()
+        for path in full:
+            week = int(path.stem.split('-', 1)[1])
+            (season / path.name).unlink()  # force the delta path
+            if read_week_from_deltas(args.year, week, root=tmp) != fast_json.loads(path.read_bytes()):
+                print(f'week {week} did not rebuild exactly', file=sys.stderr)
+                return 1
+        rebuild_ms = (time.perf_counter() - start) / len(full) * 1000
+
+        raw, gz = sizes(full)
+        b_raw, b_gz = sizes(bundle)
+        print(f'{len(full)} full files: {raw:>9} B raw {gz:>8} B gzip')
+        print(f'base + {len(bundle) - 1} deltas: {b_raw:>9} B raw {b_gz:>8} B gzip '
+              f'(-{100 * (1 - b_raw / raw):.1f}% raw, -{100 * (1 - b_gz / gz):.1f}% gzip)')
+        for entry in manifest['deltas']:
+            gz_size = encoded_path_for(manifest_path.parent / entry['path'], 'gzip').stat().st_size
+            print(f"  week {entry['week']:>2} delta {entry['bytes']:>7} B raw {gz_size:>7} B gzip")
+        print(f'rebuild from deltas: {rebuild_ms:.2f} ms/week (all weeks verified)')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+What-if latency: checkpointed replay vs a full re-solve.
+
+Usage:
+  ./venv/bin/python scripts/bench_whatif.py
+  ./venv/bin/python scripts/bench_whatif.py --teams 250 --weeks 12
+
+Builds a synthetic season (--teams teams in 10 conferences, one game per
+team per week through --weeks, seeded) and times:
+
+  full     - run_solver + finish_rankings on the edited game list (what a
+             hand-fed calculate_rankings_logic costs)
+  baseline - first what-if for a week: baseline solve with checkpoints
+  whatif   - a single-game scenario against the cached state: a new game
+             after the last week, and flipped results in the last, middle
+             and first week (the latter replays the whole season)
+
+Reports median milliseconds over --repeat runs.
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import statistics
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault('CFBD_API_KEY', 'bench-key')
+
+import whatif  # noqa: E402
+from ranking_service import finish_rankings, rankings_config, run_solver  # noqa: E402
+from whatif import ScenarioGame, run_whatif  # noqa: E402
+
+CONFERENCE_TYPES = ['Power 4'] * 4 + ['Group of 5'] * 5 + ['FCS']
+
+
+class SyntheticProcessor:
+    """The CFBDataProcessor surface what-if uses, over generated games."""
+
+    team_info_map: dict = {}
+
+    def __init__(self, teams: int, weeks: int, seed: int = 7):
+        rng = random.Random(seed)
+        names = [f'Team {i}' for i in range(teams)]
+        conference = {name: i % len(CONFERENCE_TYPES) for i, name in enumerate(names)}
+        strength = {name: rng.gauss(0, 10) for name in names}
+        self.games = []
+        for week in range(1, weeks + 1):
+            rng.shuffle(names)
+            for home, away in zip(names[::2], names[1::2]):
+                margin = strength[home] - strength[away] + rng.gauss(3, 14)
+                score = 24 + int(abs(margin)) // 2
+                self.games.append({
+                    'week': week, 'season_type': 'regular', 'notes': None,
+                    'home_team_name': home, 'away_team_name': away,
+                    'home_score': score + int(abs(margin)) if margin > 0 else score,
+                    'away_score': score if margin > 0 else score + int(abs(margin)) + 1,
+                    'home_conference': f'Conf {conference[home]}', 'away_conference': f'Conf {conference[away]}',
+                    'home_conference_type': CONFERENCE_TYPES[conference[home]],
+                    'away_conference_type': CONFERENCE_TYPES[conference[away]],
+                })
+
+    def get_games_for_season(self, year, through_week=None):
+        return [g for g in self.games if through_week is None or g['week'] <= through_week]
+
+    def organize_games_by_week(self, games):
+        by_week = defaultdict(list)
+        for game in games:
+            by_week[game['week']].append(game)
+        return dict(by_week)
+
+
+def timed(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def flip(processor, week: int) -> ScenarioGame:
+    game = next(g for g in processor.games if g['week'] == week)
+    home_won = game['home_score'] > game['away_score']
+    winner, loser = (game['away_team_name'], game['home_team_name']) if home_won else (
+        game['home_team_name'], game['away_team_name'])
+    return ScenarioGame(winner, loser, week=week)
+
+
+def unplayed(processor) -> ScenarioGame:
+    played = {frozenset((g['home_team_name'], g['away_team_name'])) for g in processor.games}
+    opponent = next(i for i in range(1, len(played)) if frozenset(('Team 0', f'Team {i}')) not in played)
+    return ScenarioGame(f'Team {opponent}', 'Team 0')
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark what-if re-solves')
+    parser.add_argument('--teams', type=int, default=250)
+    parser.add_argument('--weeks', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=7)
+    args = parser.parse_args()
+
+    processor = SyntheticProcessor(args.teams, args.weeks)
+    year, week = 2024, args.weeks
+    whatif.compute_priors = lambda *a: {}
+
+    def full():
+        games = processor.get_games_for_season(year, through_week=week)
+        run = run_solver(processor.organize_games_by_week(games), rankings_config({}, week), {})
+        finish_rankings(run.ranker, processor, year, week, {})
+
+    def baseline():
+        whatif._states.clear()
+        whatif.get_whatif_state(processor, year, week, {})
+
+    print(f'{len(processor.games)} games, {args.teams} teams, weeks 1-{args.weeks}')
+    print(f"{'full re-solve':<25} {timed(full, args.repeat):7.1f} ms")
+    print(f"{'baseline + checkpoints':<25} {timed(baseline, args.repeat):7.1f} ms")
+    scenarios = [
+        ('new game next week', unplayed(processor)),
+        (f'flip week {week}', flip(processor, week)),
+        (f'flip week {(week + 1) // 2}', flip(processor, (week + 1) // 2)),
+        ('flip week 1', flip(processor, 1)),
+    ]
+    for label, scenario in scenarios:
+        ms = timed(lambda: run_whatif(processor, year, week, {}, [scenario]), args.repeat)
+        print(f"{'whatif ' + label:<25} {ms:7.1f} ms")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
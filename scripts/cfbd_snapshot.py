@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Export / import columnar season snapshots (offline-safe by default).
+
+Usage:
+  CFBD_OFFLINE=1 ./venv/bin/python scripts/cfbd_snapshot.py export --year 2024 --out snapshots/
+  ./venv/bin/python scripts/cfbd_snapshot.py import snapshots/2024.cfbsnap
+  ./venv/bin/python scripts/cfbd_snapshot.py info snapshots/2024.cfbsnap
+
+export packs a season's games (regular + postseason) and the team registry
+from the local game store (fetching from CFBD only when online and missing).
+import upserts a snapshot's games and teams into the local game store.
+Run the app or debug scripts from snapshots with CFBD_SNAPSHOT_DIR=snapshots/.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from dotenv import load_dotenv
+
+load_dotenv(ROOT / '.env')
+
+from season_snapshot import SeasonSnapshot, snapshot_path, write_snapshot  # noqa: E402
+
+
+def export(year: int, out: Path) -> Path:
+    from api_integration import CFBDApiClient
+
+    client = CFBDApiClient(api_key=os.getenv('CFBD_API_KEY'))
+    games = []
+    for season_type in ('regular', 'postseason'):
+        for game in client.get_games(year, season_type=season_type):
+            games.append({**game, 'season_type': game.get('season_type') or season_type})
+    teams = client.get_teams_with_logos()
+    if not games:
+        raise RuntimeError(f'No games for {year} in the local store (or CFBD) to export')
+    path = write_snapshot(snapshot_path(year, out), year, games, teams)
+    print(f'Wrote {path} ({len(games)} games, {len(teams)} teams, {path.stat().st_size} bytes)')
+    return path
+
+
+def import_snapshot(path: Path) -> None:
+    from game_store import get_game_store
+
+    snap = SeasonSnapshot(path)
+    store = get_game_store()
+    for season_type in ('regular', 'postseason'):
+        games = snap.games(season_type=season_type)
+        if games:
+            store.upsert_games(snap.year, None, season_type, games)
+    store.upsert_teams(snap.teams)
+    print(f'Imported {snap.rows} games and {len(snap.teams)} teams for {snap.year} into {store.path}')
+
+
+def info(path: Path) -> None:
+    start = time.perf_counter()
+    snap = SeasonSnapshot(path)
+    opened = time.perf_counter()
+    games = snap.games(season_type=None)
+    done = time.perf_counter()
+    print(
+        f'{path}: year={snap.year} games={snap.rows} teams={len(snap.teams)} '
+        f'weeks={snap.available_weeks()} strings={len(snap.strings)}\n'
+        f'open+mmap {(opened - start) * 1000:.2f} ms, '
+        f'materialize {len(games)} games {(done - opened) * 1000:.2f} ms'
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Columnar CFBD season snapshots')
+    sub = parser.add_subparsers(dest='command', required=True)
+    p_export = sub.add_parser('export', help='Write {year}.cfbsnap')
+    p_export.add_argument('--year', type=int, required=True)
+    p_export.add_argument('--out', type=Path, default=ROOT / 'snapshots')
+    p_import = sub.add_parser('import', help='Load a snapshot into the game store')
+    p_import.add_argument('path', type=Path)
+    p_info = sub.add_parser('info', help='Summarize a snapshot and time loading it')
+    p_info.add_argument('path', type=Path)
+    args = parser.parse_args()
+
+    if args.command == 'export':
+        export(args.year, args.out)
+    elif args.command == 'import':
+        import_snapshot(args.path)
+    else:
+        info(args.path)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -17,7 +17,6 @@ otherwise falls back to stub templates.
 from __future__ import annotations
 
 import argparse
-import json
 import os
 import sys
 from pathlib import Path
@@ -30,6 +29,7 @@ from dotenv import load_dotenv
 
 load_dotenv(ROOT / '.env')
 
+import fast_json  # noqa: E402
 from narrative_facts import extract_week_facts, stub_week_story, stub_why_blurbs  # noqa: E402
 from spend_guards import resolve_ai_mode  # noqa: E402
 from static_rankings import (  # noqa: E402
@@ -82,10 +82,10 @@ def _live_story_or_stub(facts: Dict[str, Any]) -> Dict[str, Any]:
             'Write a short college football week-story JSON with keys '
             '"headline" (string) and "paragraphs" (array of 2-4 short strings). '
             'Use ONLY these facts; do not invent games:\n'
-            + json.dumps(facts, separators=(',', ':'))
+            + fast_json.dumps(facts)
         )
         raw = _call_minimax(prompt)
-        data = json.loads(raw) if isinstance(raw, str) else raw
+        data = fast_json.loads(raw) if isinstance(raw, str) else raw
         if isinstance(data, dict) and data.get('headline'):
             return {
                 'headline': data['headline'],
@@ -105,6 +105,8 @@ def precompute_week(year: int, week: int, mode: str) -> None:
             f'No static rankings for {year} week {week} under '
             f'{FRONTEND_ROOT} or {DEFAULT_ROOT}'
         )
+    # Static reads are shared with the in-process index; copy before filling meta
+    current = dict(current)
     # Ensure meta fields present for facts snapshot
     current.setdefault('year', year)
     current.setdefault('week', week)
@@ -113,6 +115,7 @@ def precompute_week(year: int, week: int, mode: str) -> None:
     if week > 1:
         previous = _load_week(year, week - 1)
         if previous is not None:
+            previous = dict(previous)
             previous.setdefault('year', year)
             previous.setdefault('week', week - 1)
 
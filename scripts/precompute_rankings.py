@@ -7,7 +7,12 @@ Usage:
   ./venv/bin/python scripts/precompute_rankings.py --year 2024 --through-week 15
   ./venv/bin/python scripts/precompute_rankings.py --current   # current season, weeks 1..current-1
 
-Also copies slim JSON into frontend/static/rankings/ for Cloudflare Pages static serving.
+Also copies slim JSON (and the columnar list format) into frontend/static/rankings/
+for Cloudflare Pages static serving, writes per-team detail shards for the API
+({year}/week-{n}/teams/, served by /rankings/team/<name>), then rebuilds each
+touched season's delta bundle ({year}/delta/: base snapshot, per-week patches,
+manifest) and its single-file {year}.bundle for the API. Each week is also
+recorded in the rankings history store behind the trajectory endpoints.
 """
 from __future__ import annotations
 
@@ -25,13 +30,25 @@ from dotenv import load_dotenv
 
 load_dotenv(ROOT / '.env')
 
+import fast_json
+from cfbd_scheduler import PRIORITY_PRECOMPUTE, cfbd_priority
 from data_processor import CFBDataProcessor
 from ranking_service import (
     get_or_calculate_rankings,
+    payload_digest,
+    record_rankings_history,
     slim_rankings_for_list,
     is_archived_week,
 )
-from static_rankings import write_static_rankings, DEFAULT_ROOT
+from static_rankings import (
+    DEFAULT_ROOT,
+    encoded_path_for,
+    write_season_bundle,
+    write_season_deltas,
+    write_static_columnar,
+    write_static_rankings,
+    write_team_shards,
+)
 
 
 def current_season_week(now: datetime | None = None) -> tuple[int, int]:
@@ -45,14 +62,27 @@ def current_season_week(now: datetime | None = None) -> tuple[int, int]:
     return now.year, min(week, 16)
 
 
-def copy_to_frontend(year: int, week: int, source: Path) -> Path | None:
+def copy_to_frontend(source: Path) -> Path:
     dest_root = ROOT / 'frontend' / 'static' / 'rankings'
-    dest = dest_root / str(year) / f'week-{week}.json'
+    dest = dest_root / source.relative_to(Path(DEFAULT_ROOT))
     dest.parent.mkdir(parents=True, exist_ok=True)
     shutil.copy2(source, dest)
+    # Precompressed siblings after the JSON so they are never older than it
+    for encoding in ('gzip', 'br'):
+        sibling = encoded_path_for(source, encoding)
+        if sibling.exists():
+            shutil.copy2(sibling, encoded_path_for(dest, encoding))
     return dest
 
 
+def copy_delta_bundle(manifest_path: Path) -> None:
+    manifest = fast_json.loads(manifest_path.read_bytes())
+    for entry in [manifest['base'], *manifest['deltas']]:
+        copy_to_frontend(manifest_path.parent / entry['path'])
+    # Manifest last so the frontend never sees entries for missing files
+    copy_to_frontend(manifest_path)
+
+
 def precompute(year: int, week: int, processor: CFBDataProcessor) -> Path:
     class Args(dict):
         def get(self, key, default=None):
@@ -63,9 +93,15 @@ def precompute(year: int, week: int, processor: CFBDataProcessor) -> Path:
     )
     if not data:
         raise RuntimeError(f'No rankings data for {year} week {week}')
+    # Cache hits skip the compute path's history write; the store ignores repeats
+    record_rankings_history(year, week, payload_digest(data), data)
     slim = slim_rankings_for_list(data)
     path = write_static_rankings(slim, year, week)
-    fe = copy_to_frontend(year, week, path)
+    fe = copy_to_frontend(path)
+    copy_to_frontend(write_static_columnar(slim, year, week))
+    shard_index = write_team_shards(data, year, week)
+    if shard_index is not None:
+        print(f'Wrote {len(fast_json.loads(shard_index.read_bytes())["teams"])} team shards in {shard_index.parent}')
     print(f'Wrote {path}' + (f' and {fe}' if fe else ''))
     return path
 
@@ -82,7 +118,6 @@ def main() -> int:
         print('CFBD_API_KEY required', file=sys.stderr)
         return 1
 
-    processor = CFBDataProcessor(api_key=os.getenv('CFBD_API_KEY'))
     jobs: list[tuple[int, int]] = []
 
     if args.current:
@@ -97,9 +132,21 @@ def main() -> int:
     else:
         parser.error('Provide --year/--week, --year/--through-week, or --current')
 
-    for year, week in jobs:
-        print(f'Precomputing {year} week {week}...')
-        precompute(year, week, processor)
+    # Backfills run at the lowest CFBD priority so they never starve live traffic
+    with cfbd_priority(PRIORITY_PRECOMPUTE):
+        processor = CFBDataProcessor(api_key=os.getenv('CFBD_API_KEY'))
+        for year, week in jobs:
+            print(f'Precomputing {year} week {week}...')
+            precompute(year, week, processor)
+
+        for year in sorted({year for year, _ in jobs}):
+            manifest = write_season_deltas(year)
+            if manifest is not None:
+                copy_delta_bundle(manifest)
+                print(f'Wrote delta bundle {manifest.parent}')
+            bundle = write_season_bundle(year)
+            if bundle is not None:
+                print(f'Wrote season bundle {bundle}')
 
     print(f'Done. Static root: {DEFAULT_ROOT}')
     return 0
@@ -0,0 +1,74 @@
+"""
+Single-file season bundle: every static file of an archived season in one file.
+
+Layout:
+
+    MAGIC                      b'CFBSEASON1\n'
+    index length               uint32, little-endian
+    index JSON                 {"format": "season-bundle", "version": 1, "year": 2024,
+                                "members": {"week-5.json": {"offset": 0, "length": 134281,
+                                                            "sha256": "..."}, ...}}
+    member bytes               concatenated; offsets are relative to the end of the index
+
+Members are stored byte-for-byte (week-N.json and its .gz/.br siblings,
+week-N.columnar.json, .story.json, .why.json), so a reader can memory-map
+the bundle and serve any member as a slice without parsing or reopening.
+static_rankings.write_season_bundle builds it; StaticFileIndex reads it.
+"""
+from __future__ import annotations
+
+import hashlib
+import struct
+from typing import Any, Dict, Optional
+
+import fast_json
+
+BUNDLE_FORMAT = 'season-bundle'
+BUNDLE_VERSION = 1
+MAGIC = b'CFBSEASON1\n'
+_LENGTH = struct.Struct('<I')
+
+
+def pack_bundle(year: int, members: Dict[str, bytes]) -> bytes:
+    """Bundle bytes for `members` (name -> bytes), stored in the given order."""
+    entries: Dict[str, Dict[str, Any]] = {}
+    offset = 0
+    for name, data in members.items():
+        entries[name] = {
+            'offset': offset,
+            'length': len(data),
+            'sha256': hashlib.sha256(data).hexdigest(),
+        }
+        offset += len(data)
+    index = fast_json.dumps_bytes({
+        'format': BUNDLE_FORMAT,
+        'version': BUNDLE_VERSION,
+        'year': year,
+        'members': entries,
+    })
+    return b''.join([MAGIC, _LENGTH.pack(len(index)), index, *members.values()])
+
+
+def read_bundle_index(buf) -> Dict[str, Any]:
+    """Parse the index of a bundle (bytes or mmap); adds `data_start`. ValueError if malformed."""
+    header = len(MAGIC) + _LENGTH.size
+    if len(buf) < header or buf[:len(MAGIC)] != MAGIC:
+        raise ValueError('Not a season bundle')
+    (length,) = _LENGTH.unpack(buf[len(MAGIC):header])
+    try:
+        index = fast_json.loads(buf[header:header + length])
+    except (fast_json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise ValueError(f'Corrupt season bundle index: {e}') from e
+    if index.get('format') != BUNDLE_FORMAT:
+        raise ValueError('Not a season bundle')
+    index['data_start'] = header + length
+    return index
+
+
+def member_slice(index: Dict[str, Any], name: str) -> Optional[slice]:
+    """Byte range of a member within the bundle, or None."""
+    member = index['members'].get(name)
+    if member is None:
+        return None
+    start = index['data_start'] + member['offset']
+    return slice(start, start + member['length'])
@@ -0,0 +1,224 @@
+"""
+Columnar season snapshots for offline loading (CFBD_OFFLINE, debug scripts, CI).
+
+One file per season (`{year}.cfbsnap`) holds every regular and postseason game
+plus the team registry. Layout:
+
+    b'CFBSNAP1' | uint32 header length | JSON header | 8-byte aligned columns
+
+Numeric columns are raw little-endian arrays; string columns are int32 indexes
+into a shared string table (-1 = None). The whole file is memory-mapped and
+columns are zero-copy views, so a season loads in milliseconds.
+
+SnapshotApiClient serves CFBDataProcessor straight from a directory of these
+files (also picked up automatically via CFBD_SNAPSHOT_DIR).
+"""
+from __future__ import annotations
+
+import json
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+MAGIC = b'CFBSNAP1'
+FORMAT_VERSION = 1
+_ALIGN = 8
+
+# (game key, dtype, null sentinel) for numeric columns
+_INT_COLUMNS = (
+    ('id', '<i8', -1),
+    ('week', '<i2', -1),
+    ('year', '<i2', -1),
+    ('home_score', '<i2', -1),
+    ('away_score', '<i2', -1),
+)
+_STRING_COLUMNS = (
+    'season_type',
+    'home_team_name',
+    'away_team_name',
+    'home_conference',
+    'away_conference',
+    'venue',
+    'date',
+)
+
+
+def snapshot_path(year: int, root: Union[str, Path]) -> Path:
+    return Path(root) / f'{year}.cfbsnap'
+
+
+def _pad(buf: bytearray) -> None:
+    buf.extend(b'\0' * (-len(buf) % _ALIGN))
+
+
+def write_snapshot(
+    path: Union[str, Path],
+    year: int,
+    games: List[Dict[str, Any]],
+    teams: Dict[str, Dict[str, Any]],
+) -> Path:
+    """Pack transformed games (regular + postseason) and the team registry into one file."""
+    strings: Dict[str, int] = {}
+
+    def intern(value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        if value not in strings:
+            strings[value] = len(strings)
+        return strings[value]
+
+    columns: Dict[str, np.ndarray] = {}
+    for key, dtype, null in _INT_COLUMNS:
+        columns[key] = np.array(
+            [null if g.get(key) is None else g[key] for g in games], dtype=dtype
+        )
+    for key in _STRING_COLUMNS:
+        columns[key] = np.array([intern(g.get(key)) for g in games], dtype='<i4')
+
+    encoded = [s.encode('utf-8') for s in strings]
+    string_offsets = np.zeros(len(encoded) + 1, dtype='<i8')
+    if encoded:
+        string_offsets[1:] = np.cumsum([len(b) for b in encoded])
+    columns['_string_offsets'] = string_offsets
+    columns['_string_data'] = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+
+    body = bytearray()
+    index: Dict[str, Dict[str, Any]] = {}
+    for name, array in columns.items():
+        _pad(body)
+        index[name] = {'dtype': array.dtype.str, 'offset': len(body), 'length': int(array.shape[0])}
+        body.extend(array.tobytes())
+
+    header = json.dumps({
+        'format': FORMAT_VERSION,
+        'year': year,
+        'rows': len(games),
+        'columns': index,
+        'teams': teams,
+    }, separators=(',', ':')).encode('utf-8')
+    prefix = bytearray(MAGIC + struct.pack('<I', len(header)) + header)
+    _pad(prefix)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp, 'wb') as f:
+        f.write(prefix)
+        f.write(body)
+    os.replace(tmp, path)
+    return path
+
+
+class SeasonSnapshot:
+    """Memory-mapped view over one .cfbsnap file."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        raw = np.memmap(self.path, dtype=np.uint8, mode='r')
+        if bytes(raw[:len(MAGIC)]) != MAGIC:
+            raise ValueError(f'{self.path} is not a season snapshot')
+        (header_len,) = struct.unpack('<I', bytes(raw[8:12]))
+        header = json.loads(bytes(raw[12:12 + header_len]))
+        if header.get('format') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported snapshot format {header.get('format')}")
+        base = 12 + header_len + (-(12 + header_len) % _ALIGN)
+
+        self.year: int = header['year']
+        self.rows: int = header['rows']
+        self.teams: Dict[str, Dict[str, Any]] = header['teams']
+        self.columns: Dict[str, np.ndarray] = {}
+        for name, meta in header['columns'].items():
+            dtype = np.dtype(meta['dtype'])
+            start = base + meta['offset']
+            end = start + meta['length'] * dtype.itemsize
+            self.columns[name] = raw[start:end].view(dtype)
+
+        offsets = self.columns.pop('_string_offsets')
+        data = bytes(self.columns.pop('_string_data'))
+        self.strings: List[str] = [
+            data[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(len(offsets) - 1)
+        ]
+        self._string_ids = {s: i for i, s in enumerate(self.strings)}
+
+    def _mask(self, week: Optional[int], season_type: Optional[str], through_week: Optional[int]) -> np.ndarray:
+        mask = np.ones(self.rows, dtype=bool)
+        if season_type is not None:
+            mask &= self.columns['season_type'] == self._string_ids.get(season_type, -2)
+        if week is not None:
+            mask &= self.columns['week'] == week
+        elif through_week is not None:
+            mask &= (self.columns['week'] >= 0) & (self.columns['week'] <= through_week)
+        return mask
+
+    def games(
+        self,
+        week: Optional[int] = None,
+        season_type: Optional[str] = 'regular',
+        through_week: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Materialize matching rows as transformed-game dicts (same shape as CFBDApiClient)."""
+        rows = np.flatnonzero(self._mask(week, season_type, through_week))
+        ints = {key: (self.columns[key][rows].tolist(), null) for key, _, null in _INT_COLUMNS}
+        strs = {key: self.columns[key][rows].tolist() for key in _STRING_COLUMNS}
+        out = []
+        for i in range(len(rows)):
+            game: Dict[str, Any] = {}
+            for key, (values, null) in ints.items():
+                game[key] = None if values[i] == null else values[i]
+            for key, values in strs.items():
+                game[key] = self.strings[values[i]] if values[i] >= 0 else None
+            game['is_interconference'] = game['home_conference'] != game['away_conference']
+            out.append(game)
+        return out
+
+    def available_weeks(self, season_type: str = 'regular') -> List[int]:
+        weeks = self.columns['week'][self._mask(None, season_type, None)]
+        return sorted(int(w) for w in np.unique(weeks) if w >= 0)
+
+
+class SnapshotApiClient:
+    """Read-only CFBDApiClient stand-in backed by a directory of season snapshots."""
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+        self._snapshots: Dict[int, Optional[SeasonSnapshot]] = {}
+        self._lock = threading.Lock()
+
+    def snapshot(self, year: int) -> Optional[SeasonSnapshot]:
+        with self._lock:
+            if year not in self._snapshots:
+                path = snapshot_path(year, self.root)
+                self._snapshots[year] = SeasonSnapshot(path) if path.exists() else None
+            return self._snapshots[year]
+
+    def _latest(self) -> Optional[SeasonSnapshot]:
+        years = sorted(int(p.stem) for p in self.root.glob('*.cfbsnap') if p.stem.isdigit())
+        return self.snapshot(years[-1]) if years else None
+
+    def get_games(self, year: int, week: Optional[int] = None, season_type: str = 'regular') -> List[Dict]:
+        snap = self.snapshot(year)
+        if snap is None:
+            print(f"SNAPSHOT MISS: no {year}.cfbsnap in {self.root}")
+            return []
+        # Same shape as CFBDApiClient: season_type stays a filter, not a field the ranker scores on
+        return [
+            {key: value for key, value in game.items() if key != 'season_type'}
+            for game in snap.games(week=week, season_type=season_type)
+        ]
+
+    def get_teams_with_logos(self) -> Dict[str, Dict[str, Any]]:
+        snap = self._latest()
+        return dict(snap.teams) if snap else {}
+
+    def get_team_info(self) -> Dict[str, str]:
+        return {school: info.get('conference') for school, info in self.get_teams_with_logos().items()}
+
+    def get_betting_lines(self, year: int, week: Optional[int] = None) -> List[Dict]:
+        return []
+
+    def get_rankings(self, year: int, week: Optional[int] = None) -> List[Dict]:
+        return []
@@ -4,6 +4,8 @@ from __future__ import annotations
 from datetime import date
 from typing import Any, Dict, Optional
 
+from team_lookup import normalize_team_name
+
 BLURB_MAX_CHARS = 280
 
 
@@ -268,5 +270,5 @@ def blurb_cache_key(
 ) -> str:
     period = period or blurb_cache_period()
     week_part = str(week) if week is not None else 'final'
-    safe = team_name.strip().lower().replace(' ', '_')
+    safe = normalize_team_name(team_name).replace(' ', '_')
     return f'{kind}_blurb:{year}:{week_part}:{safe}:{period}'
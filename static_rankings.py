@@ -4,13 +4,43 @@ Static rankings storage for archived weeks (hybrid architecture).
 Precompute writes JSON under STATIC_RANKINGS_DIR (default: static_rankings/).
 Flask serves these for archived weeks; frontend can also fetch from
 /static-rankings/ when files are copied into frontend/static/rankings/.
+
+Reads go through an in-process LRU (STATIC_CACHE_ENTRIES, default 96) of
+memory-mapped files revalidated by mtime and size, so an archived week costs
+a stat plus a dict lookup; raw bytes come back as memoryviews into the
+mapping, so hashing, ETag checks and 304s never copy a file (only a sent
+response body is copied, once, since WSGI wants bytes). Writers
+replace files atomically so live mappings never see a truncated file.
+
+write_static_rankings also emits precompressed week-{n}.json.gz (and
+.json.br when the optional brotli package is installed) siblings; the API
+serves whichever the client accepts with a strong ETag from the content hash.
+write_static_columnar emits the opt-in week-{n}.columnar.json list format.
+write_team_shards stores per-team breakdowns (team_breakdown) under
+{year}/week-{n}/teams/ with a name index, served as-is by the team endpoint.
+write_season_deltas stores a season as {year}/delta/base.json plus per-week
+patches (week_deltas) and a manifest; read_static_rankings rebuilds a week
+from them when its full file is missing.
+
+write_season_bundle packs a season's week files into one {year}.bundle
+(season_bundle). Reads prefer the bundle: it is mapped once and members are
+served as slices, so a whole season costs one open file; loose files remain
+the fallback (and the precompute working set).
 """
 from __future__ import annotations
 
-import json
+import gzip
+import hashlib
+import mmap
 import os
+import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import fast_json
+from team_lookup import normalize_team_name, team_index
 
 DEFAULT_ROOT = os.environ.get(
     'STATIC_RANKINGS_DIR',
@@ -27,32 +57,514 @@ def static_path_for(
     return base / str(year) / f"week-{week}.json"
 
 
-def write_static_rankings(
-    payload: Dict[str, Any],
+def columnar_path_for(
     year: int,
     week: int,
     root: Optional[Union[str, Path]] = None,
 ) -> Path:
-    path = static_path_for(year, week, root=root)
+    base = Path(root) if root is not None else Path(DEFAULT_ROOT)
+    return base / str(year) / f"week-{week}.columnar.json"
+
+
+def bundle_path_for(
+    year: int,
+    root: Optional[Union[str, Path]] = None,
+) -> Path:
+    base = Path(root) if root is not None else Path(DEFAULT_ROOT)
+    return base / f"{year}.bundle"
+
+
+def delta_dir_for(
+    year: int,
+    root: Optional[Union[str, Path]] = None,
+) -> Path:
+    base = Path(root) if root is not None else Path(DEFAULT_ROOT)
+    return base / str(year) / "delta"
+
+
+def manifest_path_for(root: Optional[Union[str, Path]] = None) -> Path:
+    base = Path(root) if root is not None else Path(DEFAULT_ROOT)
+    return base / "manifest.json"
+
+
+def read_manifest(root: Optional[Union[str, Path]] = None) -> Optional[Dict[str, Any]]:
+    """Load manifest.json ({"years": {year: [weeks]}}), revalidated by mtime like any static file."""
+    return _read_json(manifest_path_for(root))
+
+
+class _StaticEntry:
+    __slots__ = ('mtime_ns', 'size', 'ino', 'raw', 'parsed', 'digest', 'members')
+
+    def __init__(self, st: os.stat_result, raw: Union[mmap.mmap, bytes]):
+        self.mtime_ns = st.st_mtime_ns
+        self.size = st.st_size
+        self.ino = st.st_ino
+        self.raw = raw
+        self.parsed: Optional[Any] = None
+        self.digest: Optional[str] = None
+        self.members: Dict[str, Any] = {}  # parsed season bundle members
+
+
+class StaticFileIndex:
+    """Bounded LRU of mmap'd JSON files, revalidated by (mtime_ns, size, inode) on each read."""
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max_entries or int(os.environ.get('STATIC_CACHE_ENTRIES', '96'))
+        self._entries: 'OrderedDict[str, _StaticEntry]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.loads = 0
+
+    def _entry(self, path: Path) -> Optional[_StaticEntry]:
+        key = str(path)
+        try:
+            st = os.stat(key)
+        except OSError:
+            with self._lock:
+                self._entries.pop(key, None)
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry.mtime_ns, entry.size, entry.ino) == (
+                st.st_mtime_ns, st.st_size, st.st_ino
+            ):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+        try:
+            with open(key, 'rb') as f:
+                raw = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if st.st_size else b''
+        except (OSError, ValueError):
+            return None
+        entry = _StaticEntry(st, raw)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self.loads += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def read_bytes(self, path: Path) -> Optional[memoryview]:
+        """Zero-copy view of the file (valid after eviction or replacement: it pins the mapping)."""
+        entry = self._entry(path)
+        return memoryview(entry.raw) if entry is not None else None
+
+    def read_with_digest(self, path: Path) -> Optional[Tuple[memoryview, str, int]]:
+        """(view, sha256 hex, mtime_ns); the hash is computed once per file version."""
+        entry = self._entry(path)
+        if entry is None:
+            return None
+        data = memoryview(entry.raw)
+        if entry.digest is None:
+            entry.digest = hashlib.sha256(data).hexdigest()
+        return data, entry.digest, entry.mtime_ns
+
+    def read_json(self, path: Path) -> Optional[Any]:
+        """Parsed payload (shared; treat as read-only), parsed once per file version."""
+        entry = self._entry(path)
+        if entry is None:
+            return None
+        if entry.parsed is None:
+            try:
+                # The parser wants bytes; parsed once per file version, so the copy is too
+                entry.parsed = fast_json.loads(entry.raw[:])
+            except (fast_json.JSONDecodeError, UnicodeDecodeError):
+                return None
+        return entry.parsed
+
+    def _bundle(self, path: Path) -> Optional[Tuple[_StaticEntry, Dict[str, Any]]]:
+        entry = self._entry(path)
+        if entry is None:
+            return None
+        if entry.parsed is None:
+            from season_bundle import read_bundle_index
+            try:
+                entry.parsed = read_bundle_index(entry.raw)
+            except ValueError:
+                return None
+        return entry, entry.parsed
+
+    def bundle_members(self, path: Path) -> List[str]:
+        bundle = self._bundle(path)
+        return list(bundle[1]['members']) if bundle is not None else []
+
+    def read_bundle_member(self, path: Path, name: str) -> Optional[Tuple[memoryview, str, int]]:
+        """(view, sha256 hex, bundle mtime_ns) of a season bundle member, sliced from the mapping."""
+        from season_bundle import member_slice
+
+        bundle = self._bundle(path)
+        if bundle is None:
+            return None
+        entry, index = bundle
+        span = member_slice(index, name)
+        if span is None:
+            return None
+        return memoryview(entry.raw)[span], index['members'][name]['sha256'], entry.mtime_ns
+
+    def read_bundle_json(self, path: Path, name: str) -> Optional[Any]:
+        """Parsed bundle member (shared; treat as read-only), parsed once per bundle version."""
+        bundle = self._bundle(path)
+        if bundle is None:
+            return None
+        entry = bundle[0]
+        if name not in entry.members:
+            member = self.read_bundle_member(path, name)
+            if member is None:
+                return None
+            try:
+                entry.members[name] = fast_json.loads(member[0])
+            except (fast_json.JSONDecodeError, UnicodeDecodeError):
+                return None
+        return entry.members[name]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': sum(e.size for e in self._entries.values()),
+                'hits': self.hits,
+                'loads': self.loads,
+            }
+
+
+_index = StaticFileIndex()
+
+
+def get_static_index() -> StaticFileIndex:
+    return _index
+
+
+def _write_bytes_atomic(path: Path, data: bytes) -> Path:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(payload, f, separators=(',', ':'))
+    tmp = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return path
+
+
+def _brotli():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+# Content-Encoding -> sibling suffix, in server preference order
+ENCODED_SUFFIXES = (('br', '.br'), ('gzip', '.gz'))
+
+
+def encoded_path_for(path: Path, encoding: str) -> Path:
+    return path.with_name(path.name + dict(ENCODED_SUFFIXES)[encoding])
+
+
+def _write_with_siblings(path: Path, data: bytes) -> Path:
+    """Write JSON bytes plus precompressed .gz/.br siblings (written after, so never older)."""
+    _write_bytes_atomic(path, data)
+    _write_bytes_atomic(encoded_path_for(path, 'gzip'), gzip.compress(data, compresslevel=9, mtime=0))
+    brotli = _brotli()
+    br_path = encoded_path_for(path, 'br')
+    if brotli is not None:
+        _write_bytes_atomic(br_path, brotli.compress(data, quality=11))
+    elif br_path.exists():
+        # Don't leave a sibling from an older payload behind
+        br_path.unlink()
     return path
 
 
+def write_static_rankings(
+    payload: Dict[str, Any],
+    year: int,
+    week: int,
+    root: Optional[Union[str, Path]] = None,
+) -> Path:
+    """Write week-{n}.json plus precompressed siblings."""
+    return _write_with_siblings(static_path_for(year, week, root=root), fast_json.dumps_bytes(payload))
+
+
+def write_static_columnar(
+    payload: Dict[str, Any],
+    year: int,
+    week: int,
+    root: Optional[Union[str, Path]] = None,
+) -> Path:
+    """Write week-{n}.columnar.json (default precision) from a slim payload, plus siblings."""
+    from columnar_rankings import encode_columnar
+
+    data = fast_json.dumps_bytes(encode_columnar(payload))
+    return _write_with_siblings(columnar_path_for(year, week, root=root), data)
+
+
+def _current_bundle(year: int, path: Path, root: Optional[Union[str, Path]] = None) -> Optional[Path]:
+    """The year's bundle, unless the loose file was rewritten after it was packed.
+
+    Week, story and why files are rewritten in place (store_computed_rankings,
+    precompute_narratives) without repacking, so a newer loose file wins.
+    """
+    bundle = bundle_path_for(year, root)
+    try:
+        packed_at = os.stat(bundle).st_mtime_ns
+    except OSError:
+        return None
+    try:
+        return bundle if os.stat(path).st_mtime_ns <= packed_at else None
+    except OSError:
+        return bundle
+
+
+def _read_season_json(year: int, path: Path, root: Optional[Union[str, Path]] = None) -> Optional[Any]:
+    """A season file from the year's bundle when it holds a current copy, else the loose file."""
+    bundle = _current_bundle(year, path, root)
+    payload = _index.read_bundle_json(bundle, path.name) if bundle is not None else None
+    return payload if payload is not None else _read_json(path)
+
+
+def _read_season_bytes(
+    year: int,
+    path: Path,
+    root: Optional[Union[str, Path]] = None,
+) -> Optional[Tuple[memoryview, str, int]]:
+    bundle = _current_bundle(year, path, root)
+    member = _index.read_bundle_member(bundle, path.name) if bundle is not None else None
+    return member if member is not None else _index.read_with_digest(path)
+
+
 def read_static_rankings(
     year: int,
     week: int,
     root: Optional[Union[str, Path]] = None,
 ) -> Optional[Dict[str, Any]]:
-    path = static_path_for(year, week, root=root)
-    if not path.exists():
+    payload = _read_season_json(year, static_path_for(year, week, root=root), root)
+    if payload is None:
+        payload = read_week_from_deltas(year, week, root=root)
+    return payload
+
+
+def team_shard_dir_for(
+    year: int,
+    week: int,
+    root: Optional[Union[str, Path]] = None,
+) -> Path:
+    base = Path(root) if root is not None else Path(DEFAULT_ROOT)
+    return base / str(year) / f"week-{week}" / "teams"
+
+
+def team_shard_slug(team_name: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '-', team_name.lower()).strip('-') or 'team'
+
+
+def write_team_shards(
+    payload: Dict[str, Any],
+    year: int,
+    week: int,
+    root: Optional[Union[str, Path]] = None,
+) -> Optional[Path]:
+    """Write one breakdown per team from a full (detail) payload, then index.json
+    ({"teams": {lowercase name: {"name", "rank", "file"}}, "aliases": {lookup key:
+    lowercase name}}); None without details."""
+    from team_breakdown import build_team_breakdown
+
+    teams = payload.get('team_rankings') or []
+    if not teams or any('wins_details' not in team for team in teams):
+        return None  # slim payloads have no game details to shard
+    out = team_shard_dir_for(year, week, root)
+    index: Dict[str, Dict[str, Any]] = {}
+    used = set()
+    for i, team in enumerate(teams):
+        slug = team_shard_slug(team['team_name'])
+        if slug in used:
+            slug = f'{slug}-{i + 1}'
+        used.add(slug)
+        _write_with_siblings(out / f'{slug}.json', fast_json.dumps_bytes(build_team_breakdown(teams, i)))
+        index[team['team_name'].lower()] = {'name': team['team_name'], 'rank': i + 1, 'file': f'{slug}.json'}
+    aliases = {
+        key: teams[i]['team_name'].lower()
+        for key, i in team_index(teams).positions.items()
+        if key not in index
+    }
+    index_doc = {'year': year, 'week': week, 'teams': index, 'aliases': aliases}
+    # Index last: it only points at shards that already exist
+    return _write_bytes_atomic(out / 'index.json', fast_json.dumps_bytes(index_doc))
+
+
+def read_team_shard_body(
+    year: int,
+    week: int,
+    team_name: str,
+    accept_encodings: Sequence[str] = (),
+    root: Optional[Union[str, Path]] = None,
+) -> Optional[StaticBody]:
+    """Servable bytes of a team's precomputed breakdown (by name, case-insensitive, or alias)."""
+    out = team_shard_dir_for(year, week, root)
+    index = _read_json(out / 'index.json') or {}
+    teams = index.get('teams', {})
+    entry = teams.get(team_name.lower())
+    if entry is None:
+        entry = teams.get(index.get('aliases', {}).get(normalize_team_name(team_name)))
+    if entry is None:
+        return None
+    return _static_body(out / entry['file'], accept_encodings)
+
+
+def _slim_weeks(year: int, root: Optional[Union[str, Path]] = None) -> Dict[int, Dict[str, Any]]:
+    base = Path(root) if root is not None else Path(DEFAULT_ROOT)
+    weeks = {}
+    for path in (base / str(year)).glob('week-*.json'):
+        week = path.stem.split('-', 1)[1]
+        if not week.isdigit():
+            continue  # story/why/columnar files
+        payload = _read_json(path)
+        if isinstance(payload, dict) and payload.get('detail') is False:
+            weeks[int(week)] = payload
+    return weeks
+
+
+def write_season_deltas(
+    year: int,
+    root: Optional[Union[str, Path]] = None,
+) -> Optional[Path]:
+    """Write delta/base.json, delta/week-{n}.json patches and delta/manifest.json from a
+    season's slim week files (plus siblings); returns the manifest path, None without weeks."""
+    from week_deltas import DELTA_FORMAT, DELTA_VERSION, build_season_deltas
+
+    weeks = _slim_weeks(year, root)
+    if not weeks:
+        return None
+    base, deltas = build_season_deltas(weeks)
+    out = delta_dir_for(year, root)
+    files = [('base.json', base.get('week'), None, base)] + [
+        (f'week-{week}.json', week, delta['from_week'], delta) for week, delta in deltas.items()
+    ]
+    entries = []
+    for name, week, from_week, payload in files:
+        data = fast_json.dumps_bytes(payload)
+        _write_with_siblings(out / name, data)
+        entry = {'week': week, 'path': name, 'bytes': len(data), 'etag': hashlib.sha256(data).hexdigest()[:32]}
+        if from_week is not None:
+            entry['from_week'] = from_week
+        entries.append(entry)
+    manifest = {
+        'format': DELTA_FORMAT,
+        'version': DELTA_VERSION,
+        'year': year,
+        'weeks': sorted(weeks),
+        'base': entries[0],
+        'deltas': entries[1:],
+    }
+    # Manifest last: readers only follow it to files that already exist
+    return _write_bytes_atomic(out / 'manifest.json', fast_json.dumps_bytes(manifest, indent=2) + b'\n')
+
+
+def _week_number(name: str) -> int:
+    stem = name.split('.', 1)[0]  # week-5.story.json -> week-5
+    return int(stem.split('-', 1)[1]) if stem.split('-', 1)[1].isdigit() else 0
+
+
+def write_season_bundle(
+    year: int,
+    root: Optional[Union[str, Path]] = None,
+) -> Optional[Path]:
+    """Pack the season's week files (slim, columnar, story, why and their compressed
+    siblings) into {year}.bundle, replaced atomically; None when there are none."""
+    from season_bundle import pack_bundle
+
+    base = Path(root) if root is not None else Path(DEFAULT_ROOT)
+    paths = sorted(
+        (p for p in (base / str(year)).glob('week-*') if p.is_file() and not p.name.endswith('.tmp')),
+        key=lambda p: (_week_number(p.name), p.name),
+    )
+    if not paths:
+        return None
+    members = {p.name: p.read_bytes() for p in paths}
+    return _write_bytes_atomic(bundle_path_for(year, root), pack_bundle(year, members))
+
+
+def read_week_from_deltas(
+    year: int,
+    week: int,
+    root: Optional[Union[str, Path]] = None,
+) -> Optional[Dict[str, Any]]:
+    """Rebuild a slim week from the season's base snapshot and delta chain, if present."""
+    from week_deltas import reconstruct_week
+
+    out = delta_dir_for(year, root)
+    manifest = _read_json(out / 'manifest.json')
+    if not manifest or week not in manifest.get('weeks', ()):
+        return None
+    base = _read_json(out / manifest['base']['path'])
+    deltas = {}
+    for entry in manifest.get('deltas', ()):
+        if entry['week'] <= week:
+            deltas[entry['week']] = _read_json(out / entry['path'])
+    if base is None or any(delta is None for delta in deltas.values()):
         return None
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
+        return reconstruct_week(base, deltas, week)
+    except ValueError:
+        return None
+
+
+def read_static_digest(
+    year: int,
+    week: int,
+    root: Optional[Union[str, Path]] = None,
+) -> Optional[str]:
+    """sha256 of the stored week-{n}.json (bundle member or loose file)."""
+    found = _read_season_bytes(year, static_path_for(year, week, root=root), root)
+    return found[1] if found is not None else None
+
+
+class StaticBody(NamedTuple):
+    data: memoryview  # into the file mapping; bytes() it where bytes are required
+    encoding: Optional[str]  # Content-Encoding, None for identity
+    etag: str  # strong, per representation
+
+
+def read_static_rankings_body(
+    year: int,
+    week: int,
+    accept_encodings: Sequence[str] = (),
+    root: Optional[Union[str, Path]] = None,
+    columnar: bool = False,
+) -> Optional[StaticBody]:
+    """Servable bytes for a slim (or columnar) week file, precompressed when accepted."""
+    if columnar:
+        path = columnar_path_for(year, week, root=root)
+        payload = _read_season_json(year, path, root)
+        if not isinstance(payload, dict) or payload.get('format') != 'columnar':
+            return None
+    else:
+        path = static_path_for(year, week, root=root)
+        payload = _read_season_json(year, path, root)
+        if not isinstance(payload, dict) or payload.get('detail') is not False:
+            return None
+    return _static_body(path, accept_encodings, read=lambda p: _read_season_bytes(year, p, root))
+
+
+def _static_body(
+    path: Path,
+    accept_encodings: Sequence[str] = (),
+    read=_index.read_with_digest,
+) -> Optional[StaticBody]:
+    identity = read(path)
+    if identity is None:
         return None
+    data, digest, mtime_ns = identity
+    tag = digest[:32]
+    for encoding, suffix in ENCODED_SUFFIXES:
+        if encoding not in accept_encodings:
+            continue
+        encoded = read(encoded_path_for(path, encoding))
+        # A sibling older than the JSON was left by a previous payload
+        if encoded is not None and encoded[2] >= mtime_ns:
+            return StaticBody(encoded[0], encoding, f'{tag}-{suffix[1:]}')
+    return StaticBody(data, None, tag)
 
 
 def story_path_for(
@@ -74,13 +586,7 @@ def why_path_for(
 
 
 def _read_json(path: Path) -> Optional[Dict[str, Any]]:
-    if not path.exists():
-        return None
-    try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
-        return None
+    return _index.read_json(path)
 
 
 def read_week_story(
@@ -89,7 +595,7 @@ def read_week_story(
     root: Optional[Union[str, Path]] = None,
 ) -> Optional[Dict[str, Any]]:
     """Load precomputed week-{n}.story.json if present."""
-    return _read_json(story_path_for(year, week, root=root))
+    return _read_season_json(year, story_path_for(year, week, root=root), root)
 
 
 def read_why_blurbs(
@@ -98,7 +604,7 @@ def read_why_blurbs(
     root: Optional[Union[str, Path]] = None,
 ) -> Optional[Dict[str, Any]]:
     """Load precomputed week-{n}.why.json if present."""
-    return _read_json(why_path_for(year, week, root=root))
+    return _read_season_json(year, why_path_for(year, week, root=root), root)
 
 
 def write_week_story(
@@ -108,11 +614,7 @@ def write_week_story(
     root: Optional[Union[str, Path]] = None,
 ) -> Path:
     path = story_path_for(year, week, root=root)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(payload, f, indent=2)
-        f.write('\n')
-    return path
+    return _write_bytes_atomic(path, fast_json.dumps_bytes(payload, indent=2) + b'\n')
 
 
 def write_why_blurbs(
@@ -122,8 +624,38 @@ def write_why_blurbs(
     root: Optional[Union[str, Path]] = None,
 ) -> Path:
     path = why_path_for(year, week, root=root)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(payload, f, indent=2)
-        f.write('\n')
-    return path
+    return _write_bytes_atomic(path, fast_json.dumps_bytes(payload, indent=2) + b'\n')
+
+
+def latest_season(root: Optional[Union[str, Path]] = None) -> Optional[int]:
+    manifest = read_manifest(root)
+    years = [int(y) for y in (manifest or {}).get('years', {}) if str(y).isdigit()]
+    if not years:
+        base = Path(root) if root is not None else Path(DEFAULT_ROOT)
+        years = [int(p.name) for p in base.glob('*') if p.is_dir() and p.name.isdigit()]
+        years += [int(p.stem) for p in base.glob('*.bundle') if p.stem.isdigit()]
+    return max(years) if years else None
+
+
+def preload_season(
+    year: Optional[int] = None,
+    root: Optional[Union[str, Path]] = None,
+) -> List[Path]:
+    """Parse every week/story/why file of a season (default: latest) into the index,
+    from its bundle when present (paths are reported as {year}.bundle/{member})."""
+    year = year if year is not None else latest_season(root)
+    if year is None:
+        return []
+    base = Path(root) if root is not None else Path(DEFAULT_ROOT)
+    bundle = bundle_path_for(year, root)
+    loaded = []
+    for name in _index.bundle_members(bundle):
+        if not name.endswith('.json') or _current_bundle(year, base / str(year) / name, root) is None:
+            continue
+        if _index.read_bundle_json(bundle, name) is not None:
+            loaded.append(bundle / name)
+    bundled = {path.name for path in loaded}
+    for path in sorted((base / str(year)).glob('week-*.json')):
+        if path.name not in bundled and _index.read_json(path) is not None:
+            loaded.append(path)
+    return loaded
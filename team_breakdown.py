@@ -0,0 +1,160 @@
+"""
+Per-team ranking breakdown (the /rankings/team/<name> payload).
+
+Pure: builds the breakdown from a full rankings payload's team list (rank
+order, with wins/losses details). The API builds it on request; precompute
+writes one per team as static detail shards for archived weeks.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from path_to_climb import compute_path_to_climb
+from team_lookup import team_index
+
+
+def find_team(team_rankings: List[Dict[str, Any]], team_name: str) -> Optional[int]:
+    """Index of a team by name or alias (see team_lookup), or None. No fuzzy fallback:
+    a typo must not silently answer for a different team."""
+    return team_index(team_rankings).find(team_name)
+
+
+def suggest_teams(team_rankings: List[Dict[str, Any]], team_name: str, limit: int = 3) -> List[str]:
+    """Names of the closest fuzzy matches, for not-found responses."""
+    return [team_rankings[i]['team_name'] for i in team_index(team_rankings).suggest(team_name, limit)]
+
+
+def _build_comparison(target, other, target_rank, other_rank):
+    diff_final = target['final_ranking_score'] - other['final_ranking_score']
+    diff_tq = target['team_quality_score'] - other['team_quality_score']
+    diff_rec = target['record_score'] - other['record_score']
+    diff_cq = target['conference_quality_score'] - other['conference_quality_score']
+    diff_sos = target['sos'] - other['sos']
+    diff_sov = target['sov'] - other['sov']
+    factors = []
+    tq_contrib = diff_tq * 0.65
+    if abs(tq_contrib) > 5:
+        factors.append({
+            'factor': 'Team Quality (Elo)',
+            'advantage': 'target' if tq_contrib > 0 else 'other',
+            'diff': abs(diff_tq),
+            'contribution': abs(tq_contrib),
+            'explanation': (
+                f"{'Higher' if diff_tq > 0 else 'Lower'} Elo rating "
+                f"({target['team_quality_score']:.0f} vs {other['team_quality_score']:.0f})"
+            ),
+        })
+    rec_contrib = diff_rec * 0.27
+    if abs(rec_contrib) > 5:
+        factors.append({
+            'factor': 'Record Score (Resume)',
+            'advantage': 'target' if rec_contrib > 0 else 'other',
+            'diff': abs(diff_rec),
+            'contribution': abs(rec_contrib),
+            'explanation': (
+                f"{'Stronger' if diff_rec > 0 else 'Weaker'} resume "
+                f"({target['record_score']:.0f} vs {other['record_score']:.0f})"
+            ),
+        })
+    cq_contrib = diff_cq * 0.08
+    if abs(cq_contrib) > 2:
+        factors.append({
+            'factor': 'Conference Quality',
+            'advantage': 'target' if cq_contrib > 0 else 'other',
+            'diff': abs(diff_cq),
+            'contribution': abs(cq_contrib),
+            'explanation': (
+                f"{'Stronger' if diff_cq > 0 else 'Weaker'} conference "
+                f"({target['conference']} vs {other['conference']})"
+            ),
+        })
+    if abs(diff_sos) > 20:
+        factors.append({
+            'factor': 'Strength of Schedule',
+            'advantage': 'target' if diff_sos > 0 else 'other',
+            'diff': abs(diff_sos),
+            'contribution': 0,
+            'explanation': (
+                f"{'Tougher' if diff_sos > 0 else 'Easier'} schedule "
+                f"(avg opp: {target['sos']:.0f} vs {other['sos']:.0f})"
+            ),
+        })
+    if abs(diff_sov) > 20:
+        factors.append({
+            'factor': 'Strength of Victory',
+            'advantage': 'target' if diff_sov > 0 else 'other',
+            'diff': abs(diff_sov),
+            'contribution': 0,
+            'explanation': (
+                f"{'Better' if diff_sov > 0 else 'Weaker'} quality wins "
+                f"(avg win opp: {target['sov']:.0f} vs {other['sov']:.0f})"
+            ),
+        })
+    factors.sort(key=lambda x: x['contribution'], reverse=True)
+    return {
+        'other_team': other['team_name'],
+        'other_rank': other_rank,
+        'other_conference': other['conference'],
+        'other_record': f"{other['records']['total_wins']}-{other['records']['total_losses']}",
+        'score_diff': diff_final,
+        'factors': factors,
+    }
+
+
+def build_team_breakdown(team_rankings: List[Dict[str, Any]], team_index: int) -> Dict[str, Any]:
+    """Breakdown for team_rankings[team_index]: scores, game details, neighbors, path to climb."""
+    team_data = team_rankings[team_index]
+    comparisons_ahead = []
+    for i in range(max(0, team_index - 3), team_index):
+        comp = _build_comparison(team_data, team_rankings[i], team_index + 1, i + 1)
+        comp['direction'] = 'ahead'
+        comparisons_ahead.append(comp)
+    comparisons_behind = []
+    for i in range(team_index + 1, min(len(team_rankings), team_index + 4)):
+        comp = _build_comparison(team_data, team_rankings[i], team_index + 1, i + 1)
+        comp['direction'] = 'behind'
+        comparisons_behind.append(comp)
+
+    return {
+        'team': {
+            'rank': team_index + 1,
+            'name': team_data['team_name'],
+            'conference': team_data['conference'],
+            'record': f"{team_data['records']['total_wins']}-{team_data['records']['total_losses']}",
+            'conf_record': f"{team_data['records']['conf_wins']}-{team_data['records']['conf_losses']}",
+            'final_score': team_data['final_ranking_score'],
+            'team_quality': team_data['team_quality_score'],
+            'record_score': team_data['record_score'],
+            'conference_quality': team_data['conference_quality_score'],
+            'sos': team_data['sos'],
+            'sov': team_data['sov'],
+            'power_record': f"{team_data['records']['power_wins']}-{team_data['records']['power_losses']}",
+            'g5_record': f"{team_data['records']['group_five_wins']}-{team_data['records']['group_five_losses']}",
+            'logo': team_data.get('logo'),
+            'color': team_data.get('color'),
+        },
+        'formula_breakdown': {
+            'tq_contribution': team_data['team_quality_score'] * 0.65,
+            'rec_contribution': team_data['record_score'] * 0.27,
+            'cq_contribution': team_data['conference_quality_score'] * 0.08,
+            'total': team_data['final_ranking_score'],
+        },
+        'wins_details': team_data.get('wins_details') or [],
+        'losses_details': team_data.get('losses_details') or [],
+        'quality_wins': team_data.get('quality_wins'),
+        'quality_losses': team_data.get('quality_losses'),
+        'bad_losses': team_data.get('bad_losses'),
+        'top_10_wins': team_data.get('top_10_wins'),
+        'top_25_wins': team_data.get('top_25_wins'),
+        'comparisons_ahead': comparisons_ahead,
+        'comparisons_behind': comparisons_behind,
+        'path_to_climb': compute_path_to_climb(
+            team_data,
+            team_rankings[team_index - 1] if team_index > 0 else None,
+        ),
+    }
+
+
+def build_team_breakdowns(team_rankings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Breakdown of every team, in rank order (what the API caches per payload)."""
+    return [build_team_breakdown(team_rankings, i) for i in range(len(team_rankings))]
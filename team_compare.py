@@ -0,0 +1,72 @@
+"""
+All-pairs team comparison (the /rankings/compare payload).
+
+    compare_teams(team_rankings, [0, 1, 2])   # rows of team_rankings, any order
+
+Factor differences for every pair come from one broadcast over the
+component vectors: with V the (n, 5) matrix of team quality, record score,
+conference quality, SoS and SoV, `V[:, None, :] - V[None, :, :]` is every
+row-minus-column difference at once. The first three are weighted into
+their contributions to the final score (same weights as the team breakdown);
+SoS and SoV stay raw, as in the breakdown's comparisons.
+
+Each matrix entry [i][j] is team i minus team j. `deciding_factor[i][j]` is
+the contribution that most favors whichever of the two is ahead (None on the
+diagonal). numpy is imported here only; app.py loads this module lazily.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+MAX_COMPARE_TEAMS = 50
+COMPARE_PRECISION = 2
+# (factor, team row field, weight in final score; None = reported raw)
+FACTORS = (
+    ('team_quality', 'team_quality_score', 0.65),
+    ('record', 'record_score', 0.27),
+    ('conference_quality', 'conference_quality_score', 0.08),
+    ('sos', 'sos', None),
+    ('sov', 'sov', None),
+)
+
+
+def _column(teams: Sequence[Dict[str, Any]], field: str) -> np.ndarray:
+    return np.array([float(team.get(field) or 0) for team in teams], dtype=np.float64)
+
+
+def compare_teams(team_rankings: List[Dict[str, Any]], rows: Sequence[int]) -> Dict[str, Any]:
+    """Pairwise factor differences for team_rankings[rows] (rows in the order given)."""
+    teams = [team_rankings[i] for i in rows]
+    values = np.stack([_column(teams, field) for _, field, _ in FACTORS], axis=1)
+    weights = np.array([1.0 if w is None else w for _, _, w in FACTORS])
+    diffs = (values[:, None, :] - values[None, :, :]) * weights
+    scores = _column(teams, 'final_ranking_score')
+    score_diff = scores[:, None] - scores[None, :]
+
+    weighted = [k for k, (_, _, w) in enumerate(FACTORS) if w is not None]
+    # Signed toward the leader of each pair, so argmax is the factor most in its favor
+    leaning = diffs[:, :, weighted] * np.where(score_diff >= 0, 1.0, -1.0)[:, :, None]
+    deciding = np.array([FACTORS[k][0] for k in weighted], dtype=object)[leaning.argmax(axis=2)]
+    np.fill_diagonal(deciding, None)
+
+    matrices = {'score_diff': score_diff}
+    matrices.update((name, diffs[:, :, k]) for k, (name, _, _) in enumerate(FACTORS))
+    return {
+        'teams': [
+            {
+                'team_name': team['team_name'],
+                'rank': i + 1,
+                'conference': team.get('conference'),
+                'final_ranking_score': team.get('final_ranking_score'),
+            }
+            for i, team in zip(rows, teams)
+        ],
+        'factors': {name: {'field': field, 'weight': weight} for name, field, weight in FACTORS},
+        'matrices': {
+            name: np.round(matrix, COMPARE_PRECISION).tolist()
+            for name, matrix in matrices.items()
+        },
+        'deciding_factor': deciding.tolist(),
+    }
@@ -0,0 +1,181 @@
+"""
+Team name lookup for rankings payloads: exact, alias, fuzzy and prefix.
+
+    index = team_index(payload['team_rankings'])
+    index.find('Ohio St.')      # -> row of "Ohio State"
+    index.find('Miami (FL)')    # -> row of "Miami"
+    index.suggest('Gorgia')     # -> [row of "Georgia"] (candidates for a not-found reply)
+    index.complete('geo')       # -> rows of Georgia, Georgia Tech, ... in rank order
+
+Names are normalized (case-folded, accents and punctuation dropped), and
+each team is also reachable by its "St" short form and the common aliases
+in ALIASES. The index for a team list is built once and kept in a small LRU
+keyed by the list itself (cached payloads are shared objects), so a lookup
+is a dict hit instead of a scan that lower-cases every name.
+"""
+from __future__ import annotations
+
+import difflib
+import os
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+TEAM_INDEX_ENTRIES = int(os.environ.get('TEAM_INDEX_ENTRIES', '64'))
+FUZZY_CUTOFF = 0.8
+AUTOCOMPLETE_LIMIT = 10
+
+# Normalized alias -> team name as it appears in rankings payloads
+ALIASES = {
+    'miami fl': 'Miami',
+    'miami florida': 'Miami',
+    'miami ohio': 'Miami (OH)',
+    'mississippi': 'Ole Miss',
+    'southern california': 'USC',
+    'louisiana state': 'LSU',
+    'brigham young': 'BYU',
+    'central florida': 'UCF',
+    'southern methodist': 'SMU',
+    'texas christian': 'TCU',
+    'texas am': 'Texas A&M',
+    'tamu': 'Texas A&M',
+    'connecticut': 'UConn',
+    'umass': 'Massachusetts',
+    'pitt': 'Pittsburgh',
+    'cal': 'California',
+    'unc': 'North Carolina',
+    'north carolina state': 'NC State',
+    'appalachian state': 'App State',
+    'fiu': 'Florida International',
+    'fau': 'Florida Atlantic',
+    'usf': 'South Florida',
+    'southern mississippi': 'Southern Miss',
+    'louisiana lafayette': 'Louisiana',
+    'ul lafayette': 'Louisiana',
+    'louisiana monroe': 'UL Monroe',
+    'ulm': 'UL Monroe',
+    'wku': 'Western Kentucky',
+    'mtsu': 'Middle Tennessee',
+    'middle tennessee state': 'Middle Tennessee',
+    'niu': 'Northern Illinois',
+    'ecu': 'East Carolina',
+    'sam houston state': 'Sam Houston',
+    'nevada las vegas': 'UNLV',
+    'texas el paso': 'UTEP',
+    'texas san antonio': 'UTSA',
+    'alabama birmingham': 'UAB',
+}
+
+_DROP = re.compile(r"[.'’&]")
+_SPACE = re.compile(r'[^a-z0-9]+')
+
+
+class TeamNotFoundError(LookupError):
+    """No exact name or alias match; `suggestions` holds the closest fuzzy candidates."""
+
+    def __init__(self, name: str, suggestions: List[str]):
+        self.name = name
+        self.suggestions = suggestions
+        hint = f" (did you mean {', '.join(suggestions)}?)" if suggestions else ''
+        super().__init__(f"Team '{name}' not found{hint}")
+
+
+def normalize_team_name(name: str) -> str:
+    """Lookup key: case-folded, accents and punctuation dropped, single spaces."""
+    decomposed = unicodedata.normalize('NFKD', str(name))
+    plain = ''.join(ch for ch in decomposed if not unicodedata.combining(ch)).casefold()
+    return _SPACE.sub(' ', _DROP.sub('', plain)).strip()
+
+
+def canonical_team_key(name: str) -> str:
+    """normalize_team_name, with ALIASES and the "St" short form mapped to the full name's key."""
+    key = normalize_team_name(name)
+    if key in ALIASES:
+        return normalize_team_name(ALIASES[key])
+    if key.endswith(' st'):
+        return key[:-len('st')] + 'state'
+    return key
+
+
+def _name_keys(name: str) -> List[str]:
+    key = normalize_team_name(name)
+    keys = [key]
+    if key.endswith(' state'):
+        keys.append(key[:-len('state')] + 'st')
+    return keys
+
+
+class TeamIndex:
+    """Row positions of a team list by normalized name and alias, plus a prefix trie."""
+
+    def __init__(self, teams: List[Dict[str, Any]]):
+        self.teams = teams
+        self.size = len(teams)
+        self.positions: Dict[str, int] = {}
+        for i, team in enumerate(teams):
+            for key in _name_keys(team.get('team_name') or ''):
+                self.positions.setdefault(key, i)
+        for alias, name in ALIASES.items():
+            i = self.positions.get(normalize_team_name(name))
+            if i is not None:
+                self.positions.setdefault(alias, i)
+        # Trie over every key and every word start within it; each node lists
+        # the rows below it in rank order, so completion is a walk down the prefix
+        self.trie: Dict[str, Any] = {'rows': []}
+        for key, i in sorted(self.positions.items(), key=lambda item: item[1]):
+            words = key.split(' ')
+            for w in range(len(words)):
+                self._insert(' '.join(words[w:]), i)
+
+    def _insert(self, key: str, row: int) -> None:
+        node = self.trie
+        for ch in key:
+            node = node.setdefault(ch, {'rows': []})
+            # Keys are inserted in row order, so a row is only ever last
+            if not node['rows'] or node['rows'][-1] != row:
+                node['rows'].append(row)
+
+    def find(self, name: str) -> Optional[int]:
+        """Row of a team by name or alias (exact after normalization), or None."""
+        return self.positions.get(normalize_team_name(name))
+
+    def suggest(self, name: str, limit: int = 3) -> List[int]:
+        """Rows whose names are close to `name`, best first."""
+        matches = difflib.get_close_matches(
+            normalize_team_name(name), self.positions, n=limit * 2, cutoff=FUZZY_CUTOFF,
+        )
+        return list(dict.fromkeys(self.positions[m] for m in matches))[:limit]
+
+    def complete(self, prefix: str, limit: int = AUTOCOMPLETE_LIMIT) -> List[int]:
+        """Rows with a name, alias or word in one starting with `prefix`, in rank order."""
+        node = self.trie
+        for ch in normalize_team_name(prefix):
+            node = node.get(ch)
+            if node is None:
+                return []
+        return node['rows'][:limit]
+
+
+_indexes: 'OrderedDict[int, TeamIndex]' = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def team_index(teams: List[Dict[str, Any]]) -> TeamIndex:
+    """Index for a team list (built once per list object, LRU of TEAM_INDEX_ENTRIES).
+
+    Entries hold their list, so an id() key can't be reused while cached.
+    """
+    key = id(teams)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is not None and index.teams is teams and index.size == len(teams):
+            _indexes.move_to_end(key)
+            return index
+    index = TeamIndex(teams)
+    with _indexes_lock:
+        _indexes[key] = index
+        while len(_indexes) > TEAM_INDEX_ENTRIES:
+            _indexes.popitem(last=False)
+    return index
@@ -9,6 +9,7 @@ os.environ.setdefault('CACHE_DIR', '/tmp/cfb-test-cache')
 os.environ.setdefault('CFBD_OFFLINE', '1')
 os.environ.setdefault('AI_MODE', 'stub')
 os.environ.setdefault('FLASK_ENV', 'development')
+os.environ.setdefault('WARM_STATE_INTERVAL', '0')
 
 
 @pytest.fixture
@@ -98,3 +98,18 @@ def test_agent_climb_stub_is_plain_english(client, monkeypatch, mock_rankings):
     assert 'TQ' not in data['blurb']
     assert 'Δ' not in data['blurb']
     assert 'contrib' not in data['blurb'].lower()
+
+
+def test_agent_typo_is_not_answered_for_another_team(client, monkeypatch, mock_rankings):
+    monkeypatch.setenv('AI_MODE', 'stub')
+    from cache import get_cache
+    from shareable_blurb import blurb_cache_key, blurb_cache_period
+
+    cache = get_cache()
+    cache.invalidate(cache._generate_key('share_blurb', blurb_cache_key('Oregn', 2024, 10, blurb_cache_period())))
+    with patch('agent_service.get_or_calculate_rankings', return_value=mock_rankings):
+        explain = client.post('/agent/explain', json={'team_name': 'Oregn', 'year': 2024, 'week': 10})
+        blurb = client.post('/agent/blurb', json={'team_name': 'Oregn', 'year': 2024, 'week': 10})
+    for response in (explain, blurb):
+        assert response.status_code == 404
+        assert response.get_json()['suggestions'] == ['Oregon']
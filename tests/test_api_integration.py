@@ -0,0 +1,131 @@
+"""Tests for the pooled CFBD client and concurrent week fetching."""
+import tempfile
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from api_integration import CFBDApiClient, cfbd_fetch_concurrency
+from cache import Cache, FileCacheBackend
+from cfbd_scheduler import CallLedger, CFBDScheduler, reset_scheduler
+from game_store import GameStore
+from spend_guards import get_cfbd_call_count, reset_cfbd_call_count
+
+
+def _raw_game(week):
+    return {
+        'week': week,
+        'season': 2024,
+        'homeTeam': f'Home{week}',
+        'awayTeam': f'Away{week}',
+        'homePoints': 21,
+        'awayPoints': 14,
+        'homeConference': 'SEC',
+        'awayConference': 'ACC',
+    }
+
+
+def _fake_response(payload):
+    response = MagicMock()
+    response.status_code = 200
+    response.headers = {'X-CallLimit-Remaining': '9999'}
+    response.json.return_value = payload
+    response.raise_for_status.return_value = None
+    return response
+
+
+@pytest.fixture
+def live_client(monkeypatch):
+    monkeypatch.setenv('CFBD_OFFLINE', '0')
+    reset_cfbd_call_count()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        reset_scheduler(CFBDScheduler(ledger=CallLedger(f'{tmpdir}/ledger.sqlite3')))
+        client = CFBDApiClient(api_key='test', game_store=GameStore(f'{tmpdir}/games.sqlite3'))
+        client._cache = Cache(backend=FileCacheBackend(cache_dir=tmpdir))
+        yield client
+        reset_scheduler()
+    reset_cfbd_call_count()
+
+
+def test_fetch_concurrency_env(monkeypatch):
+    monkeypatch.setenv('CFBD_FETCH_CONCURRENCY', '8')
+    assert cfbd_fetch_concurrency() == 8
+    monkeypatch.setenv('CFBD_FETCH_CONCURRENCY', '0')
+    assert cfbd_fetch_concurrency() == 1
+    monkeypatch.setenv('CFBD_FETCH_CONCURRENCY', 'junk')
+    assert cfbd_fetch_concurrency() == 4
+
+
+def test_make_request_uses_pooled_session(live_client):
+    assert live_client._session.headers['Authorization'] == 'Bearer test'
+    with patch.object(live_client._session, 'get', return_value=_fake_response([])) as mock_get:
+        live_client._make_request('/games', {'year': 2024})
+        live_client._make_request('/games', {'year': 2023})
+    assert mock_get.call_count == 2
+    assert get_cfbd_call_count() == 2
+
+
+def test_make_request_ledgers_priority_and_remaining(live_client):
+    from cfbd_scheduler import PRIORITY_AGENT, cfbd_priority, get_scheduler
+
+    with patch.object(live_client._session, 'get', return_value=_fake_response([])):
+        with cfbd_priority(PRIORITY_AGENT):
+            live_client._make_request('/games', {'year': 2024})
+    status = get_scheduler().status()
+    assert status['calls_today'] == {PRIORITY_AGENT: 1}
+    assert status['quota_remaining'] == 9999
+
+
+def test_failed_request_is_still_ledgered(live_client):
+    import requests
+    from cfbd_scheduler import PRIORITY_INTERACTIVE, get_scheduler
+
+    with patch.object(live_client._session, 'get', side_effect=requests.exceptions.Timeout('slow')):
+        assert live_client._make_request('/games', {'year': 2024}) == []
+    assert get_scheduler().status()['calls_today'] == {PRIORITY_INTERACTIVE: 1}
+
+
+def test_concurrent_week_fetch_keeps_order_and_exact_budget(live_client, monkeypatch):
+    from data_processor import CFBDataProcessor
+
+    monkeypatch.setenv('CFBD_MAX_CALLS', '5')
+    monkeypatch.setenv('CFBD_FETCH_CONCURRENCY', '4')
+    in_flight = []
+    peak = [0]
+    lock = threading.Lock()
+
+    def fake_get(url, params=None, timeout=None):
+        with lock:
+            in_flight.append(1)
+            peak[0] = max(peak[0], len(in_flight))
+        try:
+            return _fake_response([_raw_game(params['week'])])
+        finally:
+            with lock:
+                in_flight.pop()
+
+    with patch.object(CFBDataProcessor, '_initialize_conference_map'):
+        processor = CFBDataProcessor(api_client=live_client)
+    with patch.object(live_client._session, 'get', side_effect=fake_get) as mock_get:
+        per_week = processor._fetch_weeks(2024, list(range(1, 9)))
+
+    # Budget of 5: exactly five live calls, the rest refused without a request
+    assert mock_get.call_count == 5
+    assert get_cfbd_call_count() == 5
+    assert peak[0] <= 4
+    fetched = [games[0]['week'] for games in per_week if games]
+    assert fetched == sorted(fetched)
+    assert len(fetched) == 5
+
+
+def test_week_fetch_serial_when_concurrency_one(monkeypatch):
+    from data_processor import CFBDataProcessor
+
+    monkeypatch.setenv('CFBD_FETCH_CONCURRENCY', '1')
+    client = MagicMock()
+    client.get_teams_with_logos.return_value = {}
+    seen = []
+    client.get_games.side_effect = lambda year, week=None, season_type='regular': seen.append(week) or []
+    processor = CFBDataProcessor(api_client=client)
+    processor.get_games_for_season(2024, through_week=4)
+    assert seen == [1, 2, 3, 4]
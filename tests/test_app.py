@@ -1,4 +1,5 @@
 """Tests for Flask API routes."""
+import json
 import os
 from unittest.mock import patch
 
@@ -161,6 +162,224 @@ def test_team_breakdown_path_to_climb_vs_team_above(client):
         assert path['summary']
 
 
+def test_team_breakdown_served_from_precomputed_shard(client):
+    import tempfile
+    from static_rankings import read_team_shard_body, write_team_shards
+
+    def team(name, score):
+        return {
+            'team_name': name, 'conference': 'Big Ten', 'final_ranking_score': score,
+            'team_quality_score': score * 10, 'record_score': score, 'conference_quality_score': 90,
+            'sos': 0.6, 'sov': 0.6,
+            'records': {
+                'total_wins': 8, 'total_losses': 1, 'conf_wins': 5, 'conf_losses': 1,
+                'power_wins': 6, 'power_losses': 1, 'group_five_wins': 2, 'group_five_losses': 0,
+            },
+            'wins_details': [{'opponent': 'Purdue'}],
+            'losses_details': [],
+        }
+
+    full = {'year': 2024, 'week': 10, 'team_rankings': [team('Oregon', 100), team('Ohio State', 95)]}
+    with patch('app.get_or_calculate_rankings', return_value=full):
+        computed = client.get('/rankings/team/Ohio%20State?year=2024&week=10').get_json()
+    with tempfile.TemporaryDirectory() as tmp:
+        write_team_shards(full, 2024, 10, root=tmp)
+
+        def shard(year, week, team_name, accept_encodings=()):
+            return read_team_shard_body(year, week, team_name, accept_encodings, root=tmp)
+
+        with patch('static_rankings.read_team_shard_body', side_effect=shard), \
+                patch('app.get_or_calculate_rankings') as mock_calc:
+            response = client.get('/rankings/team/ohio%20state?year=2024&week=10')
+            cached = client.get(
+                '/rankings/team/Ohio%20State?year=2024&week=10',
+                headers={'If-None-Match': response.headers['ETag']},
+            )
+            alias = client.get('/rankings/team/Ohio%20St.?year=2024&week=10')
+    mock_calc.assert_not_called()
+    assert response.status_code == 200
+    assert response.get_json() == computed
+    assert alias.get_json() == computed
+    assert computed['path_to_climb']['team_above'] == 'Oregon'
+    assert 'immutable' in response.headers['Cache-Control']
+    assert cached.status_code == 304
+
+
+def test_team_breakdown_served_from_breakdowns_stored_with_payload(client):
+    def team(name, score):
+        return {
+            'team_name': name, 'conference': 'SEC', 'final_ranking_score': score,
+            'team_quality_score': score * 10, 'record_score': score, 'conference_quality_score': 90,
+            'sos': 0.6, 'sov': 0.6,
+            'records': {
+                'total_wins': 8, 'total_losses': 1, 'conf_wins': 5, 'conf_losses': 1,
+                'power_wins': 6, 'power_losses': 1, 'group_five_wins': 2, 'group_five_losses': 0,
+            },
+            'wins_details': [{'opponent': 'Auburn'}],
+            'losses_details': [],
+        }
+
+    full = {'year': 2031, 'week': 4, 'team_rankings': [team('Texas', 100), team('Texas A&M', 90)]}
+    with patch('ranking_service.calculate_rankings_logic', return_value=full):
+        first = client.get('/rankings/team/Texas%20A%26M?year=2031&week=4')
+    with patch('app.get_or_calculate_rankings') as mock_calc:
+        stored = client.get('/rankings/team/texas%20am?year=2031&week=4')
+    mock_calc.assert_not_called()
+    assert first.status_code == 200
+    assert stored.get_json() == first.get_json()
+    assert stored.get_json()['comparisons_ahead'][0]['other_team'] == 'Texas'
+
+
+def test_rankings_compare_all_pairs_in_one_call(client):
+    mock_data = {
+        'year': 2024,
+        'week': 10,
+        'team_rankings': [
+            {'team_name': name, 'conference': 'SEC', 'final_ranking_score': score, 'team_quality_score': score,
+             'record_score': score, 'conference_quality_score': 50, 'sos': 1400, 'sov': 1400}
+            for name, score in [('Oregon', 100), ('Ohio State', 90), ('Miami', 80), ('Georgia', 70)]
+        ],
+    }
+    with patch('app.get_or_calculate_rankings', return_value=mock_data):
+        named = client.get('/rankings/compare?teams=Miami (FL),Ohio St.&year=2024&week=10')
+        top = client.get('/rankings/compare?top=3&year=2024&week=10').get_json()
+        missing = client.get('/rankings/compare?teams=Oregon,Nowhere U&year=2024&week=10')
+        both = client.get('/rankings/compare?teams=Oregon,Miami&top=3&year=2024&week=10')
+        typo = client.get('/rankings/compare?teams=Oregn,Miami&year=2024&week=10')
+        team_typo = client.get('/rankings/team/Gorgia?year=2024&week=10')
+    assert named.status_code == 200
+    data = named.get_json()
+    assert [(t['team_name'], t['rank']) for t in data['teams']] == [('Miami', 3), ('Ohio State', 2)]
+    assert data['matrices']['score_diff'] == [[0.0, -10.0], [10.0, 0.0]]
+    assert 'ETag' in named.headers
+    assert len(top['matrices']['team_quality']) == 3
+    assert top['deciding_factor'][0][1] == 'team_quality'
+    assert missing.status_code == 404
+    assert 'Nowhere U' in missing.get_json()['error']
+    assert both.status_code == 400
+    # Typos are not answered with a different team; candidates come back instead
+    assert typo.status_code == 404
+    assert typo.get_json()['suggestions'] == {'Oregn': ['Oregon']}
+    assert team_typo.status_code == 404
+    assert team_typo.get_json()['suggestions'] == ['Georgia']
+
+
+def test_rankings_whatif_takes_scenario_from_body(client):
+    from team_lookup import TeamNotFoundError
+
+    diff = {'year': 2024, 'week': 10, 'games': [], 'replayed_from_week': 11, 'teams': [], 'movers': []}
+    with patch('app.run_whatif', return_value=diff) as mock_whatif:
+        response = client.post('/rankings/whatif?year=2024&week=10&prior_strength=0.2', json={
+            'games': [{'winner': 'Texas', 'loser': 'Georgia', 'week': 11}], 'limit': 10,
+        })
+        no_body = client.post('/rankings/whatif?year=2024&week=10')
+        bad_game = client.post('/rankings/whatif?year=2024', json={'games': [{'winner': 'Texas'}]})
+        mock_whatif.side_effect = TeamNotFoundError('Texs', ['Texas'])
+        unknown = client.post('/rankings/whatif?year=2024', json={'games': [{'winner': 'Texs', 'loser': 'Georgia'}]})
+        mock_whatif.side_effect, mock_whatif.return_value = None, None
+        no_data = client.post('/rankings/whatif?year=1800', json={'games': [{'winner': 'A', 'loser': 'B'}]})
+    assert response.status_code == 200
+    assert response.get_json() == diff
+    _, year, week, args, scenario, limit = mock_whatif.call_args_list[0].args
+    assert (year, week, args['prior_strength'], limit) == (2024, 10, '0.2', 10)
+    assert [(g.winner, g.loser, g.week) for g in scenario] == [('Texas', 'Georgia', 11)]
+    assert no_body.status_code == 400
+    assert bad_game.status_code == 400
+    assert unknown.status_code == 404
+    assert unknown.get_json()['suggestions'] == ['Texas']
+    assert no_data.status_code == 404
+
+
+def test_rankings_batch_streams_ndjson_per_item(client):
+    def batch(processor, items, variant):
+        for item in items:
+            if item.week == 2:
+                yield item, 'error', None
+                continue
+            body = None if item.week == 3 else json.dumps({'week': item.week, 'variant': variant})
+            yield item, 'cache', body
+
+    with patch('app.iter_rankings_batch', side_effect=batch) as mock_batch:
+        response = client.post('/rankings/batch', json={
+            'years': [2024], 'weeks': '1-3', 'configs': [{'prior_strength': 0.5}], 'detail': True,
+        })
+        lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        by_query = client.get('/rankings/batch?years=2023,2024&weeks=5&record_weight=0.3')
+        query_lines = [json.loads(line) for line in by_query.get_data(as_text=True).splitlines()]
+        bad = client.get('/rankings/batch?weeks=1')
+        too_many = client.get('/rankings/batch?years=2000-2024&weeks=1-15')
+    assert response.mimetype == 'application/x-ndjson'
+    assert [line['week'] for line in lines] == [1, 2, 3]
+    assert lines[0] == {
+        'year': 2024, 'week': 1, 'config': {'prior_strength': '0.5'}, 'source': 'cache',
+        'rankings': {'week': 1, 'variant': 'detail'},
+    }
+    # A failed item names its year, week and config and the stream carries on
+    assert lines[1]['source'] == 'error' and 'internal error' in lines[1]['error']
+    assert (lines[1]['year'], lines[1]['config']) == (2024, {'prior_strength': '0.5'})
+    assert 'error' in lines[2]
+    items = mock_batch.call_args_list[1].args[1]
+    assert [(i.year, i.week, i.args) for i in items] == [
+        (2023, 5, {'record_weight': '0.3'}), (2024, 5, {'record_weight': '0.3'}),
+    ]
+    assert [(line['year'], line['config'], line['rankings']) for line in query_lines] == [
+        (2023, {'record_weight': '0.3'}, {'week': 5, 'variant': 'list'}),
+        (2024, {'record_weight': '0.3'}, {'week': 5, 'variant': 'list'}),
+    ]
+    assert bad.status_code == 400
+    assert too_many.status_code == 400
+
+
+def test_team_and_conference_history_come_from_the_history_store(client):
+    import tempfile
+    from rankings_history import RankingsHistory
+
+    with tempfile.TemporaryDirectory() as tmp:
+        history = RankingsHistory(f'{tmp}/history.sqlite3')
+        for week, order in ((1, ['Miami', 'Georgia']), (2, ['Georgia', 'Miami'])):
+            history.record_week(2024, week, f'd{week}', {
+                'team_rankings': [
+                    {'team_name': name, 'conference': 'ACC', 'final_ranking_score': 90 - i,
+                     'records': {'total_wins': week, 'total_losses': 0}}
+                    for i, name in enumerate(order)
+                ],
+                'conference_rankings': [{'conference_name': 'ACC', 'conference_type': 'Power 4'}],
+            })
+        with patch('app.get_rankings_history', return_value=history), \
+                patch('app.get_or_calculate_rankings') as mock_calc:
+            team = client.get('/rankings/team/Miami%20(FL)/history?year=2024')
+            conference = client.get('/rankings/conference/acc/history?year=2024')
+            missing = client.get('/rankings/team/Miami/history?year=2023')
+    mock_calc.assert_not_called()
+    assert team.status_code == 200
+    data = team.get_json()
+    assert data['team'] == 'Miami'
+    assert [(w['week'], w['rank'], w['record']) for w in data['weeks']] == [(1, 1, '1-0'), (2, 2, '2-0')]
+    assert [w['rank'] for w in conference.get_json()['weeks']] == [1, 1]
+    assert missing.status_code == 404
+
+
+def test_team_autocomplete_lists_prefix_matches_in_rank_order(client):
+    mock_data = {
+        'year': 2024,
+        'week': 10,
+        'team_rankings': [
+            {'team_name': name, 'conference': conf, 'logo': None}
+            for name, conf in [('Georgia Tech', 'ACC'), ('Oregon', 'Big Ten'), ('Georgia', 'SEC'), ('Texas Tech', 'Big 12')]
+        ],
+    }
+    with patch('app.get_or_calculate_rankings', return_value=mock_data):
+        response = client.get('/rankings/teams/autocomplete?q=Geo&year=2024&week=10')
+        tech = client.get('/rankings/teams/autocomplete?q=tech&limit=1&year=2024&week=10').get_json()
+        missing = client.get('/rankings/teams/autocomplete?q=%20&year=2024&week=10')
+    assert response.status_code == 200
+    data = response.get_json()
+    assert [(t['team_name'], t['rank']) for t in data['teams']] == [('Georgia Tech', 1), ('Georgia', 3)]
+    assert 'ETag' in response.headers
+    assert [t['team_name'] for t in tech['teams']] == ['Georgia Tech']
+    assert missing.status_code == 400
+
+
 def test_agent_health(client):
     response = client.get('/agent/health')
     assert response.status_code == 200
@@ -171,3 +390,210 @@ def test_agent_health(client):
 def test_cache_clear_requires_secret(client):
     response = client.post('/cache/clear')
     assert response.status_code == 403
+
+
+def test_registry_unavailable_returns_503(client):
+    from data_processor import TeamRegistryUnavailable
+
+    with patch('app.get_or_calculate_rankings', side_effect=TeamRegistryUnavailable('warming')):
+        response = client.get('/rankings?year=2024&week=5')
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '5'
+    stats = client.get('/cache/stats').get_json()
+    assert 'team_registry_ready' in stats
+
+
+def test_rankings_serves_static_bytes_for_archived_weeks(client):
+    import gzip
+    import tempfile
+    from cache import Cache, FileCacheBackend
+    from static_rankings import read_static_rankings_body, write_static_rankings
+
+    payload = {'year': 2024, 'week': 5, 'detail': False, 'team_rankings': []}
+    with tempfile.TemporaryDirectory() as tmp:
+        write_static_rankings(payload, 2024, 5, root=tmp)
+
+        def body(year, week, accept_encodings=(), columnar=False):
+            return read_static_rankings_body(year, week, accept_encodings, root=tmp, columnar=columnar)
+
+        with patch('static_rankings.read_static_rankings_body', side_effect=body), \
+                patch('app.get_or_calculate_rankings') as mock_calc, \
+                patch('ranking_service.get_cache', return_value=Cache(backend=FileCacheBackend(cache_dir=tmp))):
+            plain = client.get('/rankings?year=2024&week=5')
+            zipped = client.get('/rankings?year=2024&week=5', headers={'Accept-Encoding': 'gzip'})
+            cached = client.get(
+                '/rankings?year=2024&week=5',
+                headers={'Accept-Encoding': 'gzip', 'If-None-Match': zipped.headers['ETag']},
+            )
+            mock_calc.assert_not_called()
+            # Other configs of the same archived week are computed, never the default static body
+            mock_calc.return_value = {'year': 2024, 'week': 5, 'team_rankings': []}
+            custom = client.get('/rankings?year=2024&week=5&team_quality_weight=0.9')
+            every_division = client.get('/rankings?year=2024&week=5&all_divisions=true')
+    assert plain.status_code == 200
+    assert plain.get_json() == payload
+    assert 'immutable' in plain.headers['Cache-Control']
+    assert mock_calc.call_count == 2
+    for response in (custom, every_division):
+        assert response.status_code == 200
+        assert 'immutable' not in response.headers['Cache-Control']
+    assert zipped.headers['Content-Encoding'] == 'gzip'
+    assert json.loads(gzip.decompress(zipped.data)) == payload
+    assert zipped.headers['ETag'] != plain.headers['ETag']
+    assert 'Accept-Encoding' in zipped.headers['Vary']
+    assert cached.status_code == 304
+    assert cached.data == b''
+
+
+def test_dynamic_rankings_answer_if_none_match_without_payload(client):
+    from ranking_service import RankingsVersion
+
+    mock_data = {
+        'team_rankings': [{
+            'team_name': 'Georgia',
+            'conference': 'SEC',
+            'conference_type': 'Power 4',
+            'final_ranking_score': 100,
+            'team_quality_score': 1500,
+            'record_score': 100,
+            'conference_quality_score': 50,
+            'sos': 1400,
+            'sov': 1450,
+            'records': {
+                'total_wins': 3, 'total_losses': 0,
+                'conf_wins': 1, 'conf_losses': 0,
+                'power_wins': 2, 'power_losses': 0,
+                'group_five_wins': 1, 'group_five_losses': 0,
+            },
+            'wins_details': [],
+            'losses_details': [],
+        }],
+        'conference_rankings': [],
+        'year': 2030,
+        'week': 3,
+    }
+    version = RankingsVersion('a' * 32, 600)
+    with patch('app.get_rankings_version', return_value=version), \
+            patch('app.get_rankings_body', return_value=None), \
+            patch('app.store_rankings_body'), \
+            patch('app.get_or_calculate_rankings', return_value=mock_data) as mock_calc:
+        first = client.get('/rankings?year=2030&week=3&detail=true')
+        etag = first.headers['ETag']
+        again = client.get('/rankings?year=2030&week=3&detail=true', headers={'If-None-Match': etag})
+        slim = client.get('/rankings?year=2030&week=3', headers={'If-None-Match': etag})
+        team = client.get('/rankings/team/Georgia?year=2030&week=3')
+        team_again = client.get(
+            '/rankings/team/georgia?year=2030&week=3',
+            headers={'If-None-Match': team.headers['ETag']},
+        )
+    assert first.status_code == 200
+    assert first.headers['Cache-Control'] == 'public, max-age=600'
+    assert again.status_code == 304
+    assert again.headers['ETag'] == etag
+    # List and detail views are different representations
+    assert slim.status_code == 200
+    assert team.status_code == 200
+    assert team_again.status_code == 304
+    assert mock_calc.call_count == 3
+
+
+def test_warm_rankings_request_serves_stored_body(client):
+    from ranking_service import RankingsVersion
+
+    body = '{"year":2030,"week":4,"detail":false,"team_rankings":[]}'
+    with patch('app.get_rankings_version', return_value=RankingsVersion('b' * 32, 300)), \
+            patch('app.get_rankings_body', return_value=body), \
+            patch('app.get_or_calculate_rankings') as mock_calc:
+        response = client.get('/rankings?year=2030&week=4')
+    mock_calc.assert_not_called()
+    assert response.status_code == 200
+    assert response.data == body.encode()
+    assert response.mimetype == 'application/json'
+    assert response.headers['ETag']
+
+
+def test_rankings_columnar_format(client):
+    from columnar_rankings import decode_columnar
+
+    mock_data = {
+        'team_rankings': [
+            {'team_name': 'Georgia', 'conference': 'SEC', 'final_ranking_score': 91.23456, 'wins_details': []},
+            {'team_name': 'Texas', 'conference': 'SEC', 'final_ranking_score': 90.5, 'wins_details': []},
+        ],
+        'conference_rankings': [],
+        'year': 2030,
+        'week': 6,
+    }
+    with patch('app.get_rankings_version', return_value=None), \
+            patch('app.store_rankings_body'), \
+            patch('app.store_rankings_version') as mock_version, \
+            patch('app.get_or_calculate_rankings', return_value=mock_data):
+        from ranking_service import RankingsVersion
+        mock_version.return_value = RankingsVersion('c' * 32, 60)
+        response = client.get('/rankings?year=2030&week=6&format=columnar&precision=2')
+        bad = client.get('/rankings?year=2030&week=6&format=columnar&detail=true')
+    doc = response.get_json()
+    assert doc['format'] == 'columnar'
+    assert doc['team_rankings']['columns']['final_ranking_score'] == [91.23, 90.5]
+    teams = decode_columnar(doc)['team_rankings']
+    assert [t['team_name'] for t in teams] == ['Georgia', 'Texas']
+    assert 'wins_details' not in teams[0]
+    assert bad.status_code == 400
+
+
+def test_rankings_query_filters_before_serialization(client):
+    from ranking_service import RankingsVersion
+
+    mock_data = {
+        'team_rankings': [
+            {'team_name': 'Georgia', 'conference': 'SEC', 'final_ranking_score': 91.0, 'wins_details': []},
+            {'team_name': 'Oregon', 'conference': 'Big Ten', 'final_ranking_score': 90.0, 'wins_details': []},
+            {'team_name': 'Texas', 'conference': 'SEC', 'final_ranking_score': 89.0, 'wins_details': []},
+        ],
+        'conference_rankings': [],
+        'year': 2030,
+        'week': 7,
+    }
+    with patch('app.get_rankings_version', return_value=RankingsVersion('d' * 32, 60)), \
+            patch('app.get_rankings_body', return_value=None) as mock_body, \
+            patch('app.store_rankings_body') as mock_store, \
+            patch('app.get_or_calculate_rankings', return_value=mock_data):
+        response = client.get('/rankings?year=2030&week=7&conference=sec&limit=1&offset=1&fields=final_ranking_score')
+        cached = client.get(
+            '/rankings?year=2030&week=7&conference=sec&limit=1&offset=1&fields=final_ranking_score',
+            headers={'If-None-Match': response.headers['ETag']},
+        )
+        full = client.get('/rankings?year=2030&week=7', headers={'If-None-Match': response.headers['ETag']})
+        bad = client.get('/rankings?year=2030&week=7&limit=x')
+    data = response.get_json()
+    assert data['team_rankings'] == [{'rank': 3, 'team_name': 'Texas', 'final_ranking_score': 89.0}]
+    assert data['query'] == {'total': 2, 'offset': 1, 'limit': 1}
+    assert cached.status_code == 304
+    assert full.status_code == 200
+    assert mock_body.call_count == 1  # only the unfiltered request looks for a stored body
+    mock_store.assert_called_once()
+    assert bad.status_code == 400
+
+
+def test_detail_rankings_stream_one_team_at_a_time(client):
+    from ranking_service import RankingsVersion
+
+    mock_data = {
+        'team_rankings': [{'team_name': f'T{i}', 'wins_details': [{'opponent': 'X'}]} for i in range(300)],
+        'conference_rankings': [],
+        'year': 2030,
+        'week': 8,
+        'rankings': {},
+    }
+    with patch('app.get_rankings_version', return_value=RankingsVersion('e' * 32, 60)), \
+            patch('app.get_rankings_body', return_value=None), \
+            patch('app.store_rankings_body') as mock_store, \
+            patch('app.get_or_calculate_rankings', return_value=mock_data):
+        streamed = client.get('/rankings?year=2030&week=8&detail=true')
+        slim = client.get('/rankings?year=2030&week=8')
+    assert 'Content-Length' not in streamed.headers  # chunked
+    assert streamed.headers['ETag']
+    data = json.loads(streamed.data)
+    assert len(data['team_rankings']) == 300 and 'rankings' not in data
+    assert slim.headers['Content-Length'] == str(len(slim.data))
+    mock_store.assert_called_once()  # only the slim body is backfilled
@@ -0,0 +1,106 @@
+"""Tests for the budget-aware CFBD request scheduler."""
+import os
+import tempfile
+import threading
+import time
+
+import pytest
+
+from cfbd_scheduler import (
+    PRIORITY_AGENT,
+    PRIORITY_INTERACTIVE,
+    PRIORITY_PRECOMPUTE,
+    CallLedger,
+    CFBDQuotaReservedError,
+    CFBDScheduler,
+    cfbd_priority,
+    current_priority,
+)
+from spend_guards import CFBDOfflineError
+
+
+@pytest.fixture
+def ledger():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield CallLedger(os.path.join(tmpdir, 'ledger.sqlite3'))
+
+
+def test_priority_context_defaults_to_interactive():
+    assert current_priority() == PRIORITY_INTERACTIVE
+    with cfbd_priority(PRIORITY_PRECOMPUTE):
+        assert current_priority() == PRIORITY_PRECOMPUTE
+    assert current_priority() == PRIORITY_INTERACTIVE
+    with pytest.raises(ValueError):
+        with cfbd_priority('bulk'):
+            pass
+
+
+def test_token_bucket_limits_burst(ledger):
+    scheduler = CFBDScheduler(rate_per_sec=1.0, burst=2, ledger=ledger)
+    scheduler.acquire(PRIORITY_INTERACTIVE)
+    scheduler.acquire(PRIORITY_INTERACTIVE)
+    with pytest.raises(CFBDQuotaReservedError):
+        scheduler.acquire(PRIORITY_INTERACTIVE, timeout=0.05)
+
+
+def test_higher_priority_waiter_served_first(ledger):
+    scheduler = CFBDScheduler(rate_per_sec=20.0, burst=1, ledger=ledger)
+    scheduler.acquire(PRIORITY_INTERACTIVE)  # drain the bucket
+    order = []
+
+    def worker(priority):
+        scheduler.acquire(priority)
+        order.append(priority)
+
+    low = threading.Thread(target=worker, args=(PRIORITY_PRECOMPUTE,))
+    low.start()
+    time.sleep(0.005)
+    high = threading.Thread(target=worker, args=(PRIORITY_INTERACTIVE,))
+    high.start()
+    low.join(2)
+    high.join(2)
+    assert order == [PRIORITY_INTERACTIVE, PRIORITY_PRECOMPUTE]
+
+
+def test_low_quota_reserves_for_interactive(ledger, monkeypatch):
+    monkeypatch.setenv('CFBD_PRECOMPUTE_FLOOR', '500')
+    monkeypatch.setenv('CFBD_AGENT_FLOOR', '100')
+    scheduler = CFBDScheduler(rate_per_sec=100.0, burst=10, ledger=ledger)
+    scheduler.record_call(PRIORITY_INTERACTIVE, '300')
+    with pytest.raises(CFBDOfflineError):
+        scheduler.acquire(PRIORITY_PRECOMPUTE)
+    assert scheduler.acquire(PRIORITY_AGENT) == PRIORITY_AGENT
+    scheduler.record_call(PRIORITY_AGENT, '50')
+    with pytest.raises(CFBDQuotaReservedError):
+        scheduler.acquire(PRIORITY_AGENT)
+    assert scheduler.acquire(PRIORITY_INTERACTIVE) == PRIORITY_INTERACTIVE
+
+
+def test_rate_slows_as_quota_shrinks(ledger, monkeypatch):
+    monkeypatch.setenv('CFBD_SLOWDOWN_AT', '1000')
+    scheduler = CFBDScheduler(rate_per_sec=10.0, burst=5, ledger=ledger)
+    assert scheduler.effective_rate() == 10.0
+    scheduler.record_call(PRIORITY_INTERACTIVE, '500')
+    assert scheduler.effective_rate() == pytest.approx(5.0)
+    scheduler.record_call(PRIORITY_INTERACTIVE, '1')
+    assert scheduler.effective_rate() == pytest.approx(1.0)
+
+
+def test_ledger_shared_across_schedulers(ledger, monkeypatch):
+    monkeypatch.setenv('CFBD_DAILY_MAX_CALLS', '4')
+    first = CFBDScheduler(rate_per_sec=100.0, burst=10, ledger=ledger)
+    first.record_call(PRIORITY_PRECOMPUTE, '4000')
+    first.record_call(PRIORITY_PRECOMPUTE)
+
+    # A second worker sees the same day ledger and last remaining quota
+    second = CFBDScheduler(rate_per_sec=100.0, burst=10, ledger=CallLedger(ledger.path))
+    assert second.status()['calls_today'] == {PRIORITY_PRECOMPUTE: 2}
+    assert second.status()['quota_remaining'] == 4000
+    # Precompute share (50% of 4) used up; interactive still admitted
+    with pytest.raises(CFBDQuotaReservedError):
+        second.acquire(PRIORITY_PRECOMPUTE)
+    second.acquire(PRIORITY_INTERACTIVE)
+    second.record_call(PRIORITY_INTERACTIVE)
+    second.record_call(PRIORITY_INTERACTIVE)
+    with pytest.raises(CFBDQuotaReservedError):
+        second.acquire(PRIORITY_INTERACTIVE)
@@ -0,0 +1,70 @@
+"""Tests for the columnar rankings wire format."""
+import json
+import math
+from pathlib import Path
+
+from columnar_rankings import decode_columnar, encode_columnar, is_columnar
+
+FIXTURE = Path(__file__).parent / 'fixtures' / 'sample_rankings_slim.json'
+WEEK_FILE = Path(__file__).resolve().parents[1] / 'frontend' / 'static' / 'rankings' / '2024' / 'week-5.json'
+
+
+def _assert_close(decoded, original, precision):
+    if isinstance(original, dict):
+        assert decoded.keys() == original.keys()
+        for key in original:
+            _assert_close(decoded[key], original[key], precision)
+    elif isinstance(original, list):
+        assert len(decoded) == len(original)
+        for d, o in zip(decoded, original):
+            _assert_close(d, o, precision)
+    elif isinstance(original, float):
+        assert math.isclose(decoded, original, abs_tol=10 ** -precision)
+    else:
+        assert decoded == original
+
+
+def test_roundtrip_fixture():
+    payload = json.loads(FIXTURE.read_text())
+    doc = encode_columnar(payload, precision=2)
+    assert is_columnar(doc)
+    assert doc['team_rankings']['length'] == len(payload['team_rankings'])
+    _assert_close(decode_columnar(json.loads(json.dumps(doc))), payload, 2)
+
+
+def test_real_week_dictionary_encodes_conferences_and_shrinks():
+    payload = json.loads(WEEK_FILE.read_text())
+    doc = encode_columnar(payload)
+    conference = doc['team_rankings']['columns']['conference']
+    assert set(conference) == {'dict', 'codes'}
+    assert 'SEC' in conference['dict']
+    assert 'records.power_wins' in doc['team_rankings']['columns']
+    assert isinstance(doc['team_rankings']['columns']['team_name'], list)
+    assert len(json.dumps(doc, separators=(',', ':'))) < len(WEEK_FILE.read_bytes()) / 2
+    _assert_close(decode_columnar(doc), payload, 3)
+
+
+def test_missing_fields_decode_as_null():
+    doc = encode_columnar({'team_rankings': [{'a': 1, 'b': 'x'}, {'a': 2.5}], 'conference_rankings': []})
+    assert decode_columnar(doc)['team_rankings'] == [{'a': 1, 'b': 'x'}, {'a': 2.5, 'b': None}]
+
+
+def test_null_nested_field_decodes_as_empty_record():
+    rows = [
+        {'team_name': 'A', 'records': {'total_wins': 3, 'total_losses': 1}},
+        {'team_name': 'B', 'records': None},
+        {'team_name': 'C', 'records': {}},
+    ]
+    doc = encode_columnar({'team_rankings': rows, 'conference_rankings': []})
+    assert set(doc['team_rankings']['columns']) == {'team_name', 'records.total_wins', 'records.total_losses'}
+    assert decode_columnar(json.loads(json.dumps(doc)))['team_rankings'] == [
+        rows[0],
+        {'team_name': 'B', 'records': {'total_wins': None, 'total_losses': None}},
+        {'team_name': 'C', 'records': {'total_wins': None, 'total_losses': None}},
+    ]
+    # Older documents that still carry the null parent column decode too
+    doc['team_rankings']['columns'] = {'records.total_wins': [3, None], 'records': [None, None]}
+    doc['team_rankings']['length'] = 2
+    assert [row['records'] for row in decode_columnar(doc)['team_rankings']] == [
+        {'total_wins': 3}, {'total_wins': None},
+    ]
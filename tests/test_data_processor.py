@@ -46,3 +46,34 @@ def test_get_available_weeks(mock_client):
     processor = CFBDataProcessor(api_client=mock_client)
     weeks = processor.get_available_weeks(2024)
     assert weeks == [1, 2]
+
+
+def test_lazy_registry_warms_in_background(mock_client):
+    import threading
+
+    release = threading.Event()
+    teams = mock_client.get_teams_with_logos.return_value
+    mock_client.get_teams_with_logos.side_effect = lambda: release.wait(5) and teams
+    processor = CFBDataProcessor(api_client=mock_client, lazy_registry=True)
+    assert not processor.registry_ready
+    processor.warm_registry_async()
+    assert not processor.wait_for_registry(timeout=0.01)
+    release.set()
+    assert processor.wait_for_registry(timeout=5)
+    assert processor.team_conference_map == {'TeamA': 'SEC', 'TeamB': 'ACC'}
+    assert mock_client.get_teams_with_logos.call_count == 1
+
+
+def test_registry_timeout_raises(mock_client, monkeypatch):
+    import threading
+    from data_processor import TeamRegistryUnavailable
+
+    release = threading.Event()
+    mock_client.get_teams_with_logos.side_effect = lambda: release.wait(5) and {}
+    monkeypatch.setenv('TEAM_REGISTRY_TIMEOUT', '0.01')
+    processor = CFBDataProcessor(api_client=mock_client, lazy_registry=True)
+    try:
+        with pytest.raises(TeamRegistryUnavailable):
+            processor.get_team_logo('TeamA')
+    finally:
+        release.set()
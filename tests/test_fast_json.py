@@ -0,0 +1,57 @@
+"""Tests for the fast JSON layer and Flask provider."""
+import importlib
+import json
+from datetime import date
+
+import numpy as np
+import pytest
+
+import fast_json
+
+PAYLOAD = {
+    'team_rankings': [{'team_name': 'Hawaiʻi', 'score': np.float64(91.25), 'rank': np.int64(3)}],
+    'elos': np.array([1500.5, 1400.0]),
+    'generated': date(2024, 12, 1),
+    'weeks': {1: 'x'},
+}
+EXPECTED = {
+    'team_rankings': [{'team_name': 'Hawaiʻi', 'score': 91.25, 'rank': 3}],
+    'elos': [1500.5, 1400.0],
+    'generated': '2024-12-01',
+    'weeks': {'1': 'x'},
+}
+
+
+@pytest.fixture(params=['orjson', 'json'])
+def backend(request, monkeypatch):
+    if request.param == 'orjson':
+        pytest.importorskip('orjson')
+    monkeypatch.setenv('FAST_JSON', '1' if request.param == 'orjson' else '0')
+    module = importlib.reload(fast_json)
+    assert module.BACKEND == request.param
+    yield module
+    monkeypatch.undo()
+    importlib.reload(fast_json)
+
+
+def test_backends_agree_on_numpy_and_dates(backend):
+    text = backend.dumps(PAYLOAD)
+    assert json.loads(text) == EXPECTED
+    assert 'Hawaiʻi' in text  # UTF-8, not \\u escapes
+    assert backend.loads(backend.dumps_bytes(PAYLOAD)) == EXPECTED
+    assert backend.loads(memoryview(b'{"a":1}')) == {'a': 1}
+    assert backend.dumps({'b': 1, 'a': 2}, sort_keys=True) == '{"a":2,"b":1}'
+
+
+def test_unknown_types_raise(backend):
+    with pytest.raises(TypeError):
+        backend.dumps({'x': object()})
+
+
+def test_flask_provider_serializes_numpy(client):
+    from app import app
+
+    with app.app_context():
+        response = app.json.response({'score': np.float32(1.5), 'rank': np.int32(2)})
+    assert json.loads(response.data) == {'rank': 2, 'score': 1.5}
+    assert response.mimetype == 'application/json'
@@ -0,0 +1,234 @@
+"""Tests for the SQLite game store and its use by the CFBD client."""
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+from game_store import GameStore
+
+
+def _game(game_id, week, home='Georgia', away='Texas', home_score=21):
+    return {
+        'id': game_id,
+        'week': week,
+        'year': 2023,
+        'season_type': 'regular',
+        'home_team_name': home,
+        'away_team_name': away,
+        'home_score': home_score,
+        'away_score': 14,
+        'home_conference': 'SEC',
+        'away_conference': 'Big 12',
+        'date': f'2023-09-{week:02d}T19:00:00.000Z',
+    }
+
+
+@pytest.fixture
+def store():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield GameStore(f'{tmpdir}/games.sqlite3')
+
+
+@pytest.fixture
+def api_client(store):
+    """Client over the test store, with its own cache so write-through never leaks between tests."""
+    from api_integration import CFBDApiClient
+    from cache import Cache, FileCacheBackend
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        client = CFBDApiClient(api_key='test', game_store=store)
+        client._cache = Cache(backend=FileCacheBackend(cache_dir=tmpdir))
+        yield client
+
+
+def test_upsert_only_writes_new_or_changed(store):
+    games = [_game(1, 1), _game(2, 1, home='Alabama')]
+    assert store.upsert_games(2023, 1, 'regular', games) == 2
+    assert store.week_fetch(2023, 1)['version'] == 1
+
+    # Identical refresh: nothing rewritten, version unchanged
+    assert store.upsert_games(2023, 1, 'regular', games) == 0
+    assert store.week_fetch(2023, 1)['version'] == 1
+
+    # Score correction bumps the week version
+    assert store.upsert_games(2023, 1, 'regular', [_game(1, 1, home_score=24), games[1]]) == 1
+    assert store.week_fetch(2023, 1)['version'] == 2
+    assert store.week_fetch(2023, 1)['game_count'] == 2
+    assert store.get_games(2023, week=1)[0]['home_score'] == 24
+
+
+def test_indexed_queries(store):
+    store.upsert_games(2023, None, 'regular', [_game(1, 1), _game(2, 2), _game(3, 3, home='Alabama')])
+    assert [g['id'] for g in store.get_games(2023, through_week=2)] == [1, 2]
+    assert store.available_weeks(2023) == [1, 2, 3]
+    assert [g['id'] for g in store.get_team_games('Alabama', 2023)] == [3]
+    # Season fetch marks the season; changed weeks get a version without a fetch time
+    assert store.is_fresh(2023, None)
+    assert store.week_versions(2023) == {1: 1, 2: 1, 3: 1}
+    assert not store.is_fresh(2023, 2)
+
+
+def test_current_season_weeks_expire(store):
+    with patch('game_store.is_historical_season', return_value=False):
+        store.upsert_games(2030, 1, 'regular', [_game(9, 1)])
+    with patch('game_store.is_historical_season', return_value=True):
+        store.upsert_games(2030, 2, 'regular', [_game(10, 2)])
+    with patch('game_store.TTL_GAMES_CURRENT', -1):
+        # Fetched in-season (maybe partial): still expires once the season is historical
+        with patch('game_store.is_historical_season', return_value=True):
+            assert not store.is_fresh(2030, 1)
+            assert store.fresh_weeks(2030) == {2: 1}
+        # Fetched after the season ended: never expires
+        assert store.is_fresh(2030, 2)
+
+
+def test_store_without_final_column_is_migrated():
+    import sqlite3
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = f'{tmpdir}/games.sqlite3'
+        with sqlite3.connect(path) as conn:
+            conn.execute(
+                'CREATE TABLE week_fetches (season INTEGER NOT NULL, season_type TEXT NOT NULL, '
+                'week INTEGER NOT NULL, version INTEGER NOT NULL DEFAULT 0, '
+                'game_count INTEGER NOT NULL DEFAULT 0, fetched_at REAL NOT NULL, '
+                'PRIMARY KEY (season, season_type, week))'
+            )
+            conn.execute("INSERT INTO week_fetches VALUES (2023, 'regular', 1, 1, 1, 1.0)")
+        store = GameStore(path)
+        assert store.week_fetch(2023, 1)['final'] is False
+        assert not store.is_fresh(2023, 1)
+        store.upsert_games(2023, 1, 'regular', [_game(1, 1)])
+        assert store.is_fresh(2023, 1)
+
+
+def test_client_serves_seen_weeks_without_network(store, api_client, monkeypatch):
+    monkeypatch.setenv('CFBD_OFFLINE', '0')
+    raw = [{
+        'id': 7, 'week': 4, 'season': 2023, 'seasonType': 'regular',
+        'homeTeam': 'Georgia', 'awayTeam': 'Auburn', 'homePoints': 27, 'awayPoints': 20,
+        'homeConference': 'SEC', 'awayConference': 'SEC', 'startDate': '2023-09-30',
+    }]
+    with patch.object(api_client, '_make_request', return_value=raw) as mock_request:
+        first = api_client.get_games(2023, week=4)
+        second = api_client.get_games(2023, week=4)
+    assert mock_request.call_count == 1
+    assert first == second
+    assert first[0]['id'] == 7
+    # The ranker reads season_type to score postseason games; transformed games never carry it
+    assert 'season_type' not in first[0]
+
+
+def test_client_writes_through_to_shared_cache(store, monkeypatch):
+    from api_integration import CFBDApiClient
+    from cache import Cache, FileCacheBackend
+
+    monkeypatch.setenv('CFBD_OFFLINE', '0')
+    raw = [{
+        'id': 8, 'week': 5, 'season': 2023, 'homeTeam': 'Georgia', 'awayTeam': 'Kentucky',
+        'homePoints': 51, 'awayPoints': 13, 'homeConference': 'SEC', 'awayConference': 'SEC',
+    }]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = Cache(backend=FileCacheBackend(cache_dir=tmpdir))
+        client = CFBDApiClient(api_key='test', game_store=store)
+        client._cache = cache
+        with patch.object(client, '_make_request', side_effect=[raw, [{'school': 'Georgia', 'id': 61}]]):
+            games = client.get_games(2023, week=5)
+            teams = client.get_teams_with_logos()
+        # A restarted container: empty local store, same shared cache
+        restarted = CFBDApiClient(api_key='test', game_store=GameStore(f'{tmpdir}/fresh.sqlite3'))
+        restarted._cache = cache
+        with patch.object(restarted, '_make_request') as mock_request:
+            assert restarted.get_games(2023, week=5) == games
+            assert restarted.get_teams_with_logos() == teams
+        mock_request.assert_not_called()
+
+
+def test_processor_weeks_from_store(store, api_client):
+    from data_processor import CFBDataProcessor
+
+    store.upsert_games(2023, None, 'regular', [_game(1, 1), _game(2, 5)])
+    with patch.object(CFBDataProcessor, '_initialize_conference_map'):
+        processor = CFBDataProcessor(api_client=api_client)
+    with patch.object(api_client, '_make_request') as mock_request:
+        assert processor.get_available_weeks(2023) == [1, 5]
+    mock_request.assert_not_called()
+
+
+def test_refetched_week_drops_games_cfbd_no_longer_returns(store):
+    store.upsert_games(2023, 1, 'regular', [_game(1, 1), _game(2, 1, home='Alabama'), _game(3, 2)])
+    before = store.week_fetch(2023, 1)['version']
+    # Game 2 was cancelled (or moved): the week's refetch no longer has it
+    assert store.upsert_games(2023, 1, 'regular', [_game(1, 1)]) == 1
+    assert [g['id'] for g in store.get_games(2023)] == [1, 3]
+    assert store.week_fetch(2023, 1)['version'] == before + 1
+    assert store.week_fetch(2023, 1)['game_count'] == 1
+    # A season refetch replaces the whole season
+    store.upsert_games(2023, None, 'regular', [_game(3, 2)])
+    assert [g['id'] for g in store.get_games(2023)] == [3]
+
+
+def test_season_fetch_covers_week_slices(store):
+    store.upsert_games(2023, None, 'regular', [_game(1, 1), _game(2, 2)])
+    assert store.covers(2023, 2)
+    assert store.covers(2023, 9)  # weeks without games are answered as empty
+    assert store.plan_weeks(2023, [1, 2, 3])['source'] == 'store'
+
+
+def test_complete_weeks_assemble_season(store):
+    store.upsert_games(2023, 1, 'regular', [_game(1, 1)])
+    store.upsert_games(2023, 2, 'regular', [_game(2, 2)])
+    assert not store.covers(2023, None)
+    # An empty week after the last played week proves the season is complete
+    store.upsert_games(2023, 3, 'regular', [])
+    assert store.covers(2023, None)
+    assert [g['id'] for g in store.get_games(2023)] == [1, 2]
+
+
+def test_in_season_empty_next_week_is_not_season_end(store):
+    with patch('game_store.is_historical_season', return_value=False):
+        store.upsert_games(2030, 1, 'regular', [_game(1, 1)])
+        store.upsert_games(2030, 2, 'regular', [_game(2, 2)])
+        # Week 3 not played yet: its unscored games were filtered out
+        store.upsert_games(2030, 3, 'regular', [])
+        assert store.covers(2030, 3)
+        assert not store.covers(2030, None)
+    # Still not complete once the season is over: those fetches were in-season
+    with patch('game_store.is_historical_season', return_value=True):
+        assert not store.covers(2030, None)
+
+
+def test_plan_weeks_picks_fewest_calls(store):
+    store.upsert_games(2023, 1, 'regular', [_game(1, 1)])
+    store.upsert_games(2023, 2, 'regular', [_game(2, 2)])
+    one_missing = store.plan_weeks(2023, [1, 2, 3])
+    assert one_missing == {'source': 'weeks', 'fetch_weeks': [3], 'calls': 1, 'naive_calls': 1}
+    # A couple of stale weeks are cheaper one by one than a whole-season payload
+    two_missing = store.plan_weeks(2023, [1, 2, 3, 4])
+    assert two_missing == {'source': 'weeks', 'fetch_weeks': [3, 4], 'calls': 2, 'naive_calls': 2}
+    many_missing = store.plan_weeks(2023, list(range(1, 11)))
+    assert many_missing['source'] == 'season'
+    assert many_missing['calls'] == 1
+    assert many_missing['naive_calls'] == 8
+
+
+def test_processor_uses_one_season_call_for_cold_range(store, api_client, monkeypatch):
+    from data_processor import CFBDataProcessor
+
+    monkeypatch.setenv('CFBD_OFFLINE', '0')
+    season = [
+        {
+            'id': w, 'week': w, 'season': 2023, 'seasonType': 'regular',
+            'homeTeam': f'H{w}', 'awayTeam': f'A{w}', 'homePoints': 10, 'awayPoints': 7,
+        }
+        for w in range(1, 13)
+    ]
+    with patch.object(CFBDataProcessor, '_initialize_conference_map'):
+        processor = CFBDataProcessor(api_client=api_client)
+    with patch.object(api_client, '_make_request', return_value=season) as mock_request:
+        games = processor.get_games_for_season(2023, through_week=10)
+        again = processor.get_games_for_season(2023, through_week=6)
+    assert mock_request.call_count == 1
+    assert 'week' not in mock_request.call_args.args[1]
+    assert [g['week'] for g in games] == list(range(1, 11))
+    assert len(again) == 6
@@ -0,0 +1,36 @@
+"""Startup regression: `import app` stays light (python -X importtime)."""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Modules only needed by CLI/visualization/R2 paths; must load lazily
+HEAVY_MODULES = ('numpy', 'matplotlib', 'pandas', 'seaborn', 'tabulate', 'boto3')
+
+
+def _import_times() -> dict:
+    env = {**os.environ, 'CFBD_OFFLINE': '1', 'TEAM_REGISTRY_EAGER': '0'}
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import app'],
+        cwd=ROOT, env=env, capture_output=True, text=True, timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line.split('|')
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_import_app_skips_heavy_modules_and_fits_budget():
+    times = _import_times()
+    loaded = sorted(m for m in HEAVY_MODULES if m in times)
+    assert not loaded, f'import app pulled in heavy modules: {loaded}'
+    budget_ms = float(os.environ.get('APP_IMPORT_BUDGET_MS', '1500'))
+    app_ms = times['app'] / 1000.0
+    assert app_ms < budget_ms, f'import app took {app_ms:.0f} ms (budget {budget_ms:.0f} ms)'
@@ -83,3 +83,187 @@ def test_is_archived_week():
     assert is_archived_week(2025, 2, now=datetime(2025, 10, 1), current_week=6) is True
     # Current week is live
     assert is_archived_week(2025, 6, now=datetime(2025, 10, 1), current_week=6) is False
+
+
+def test_rankings_version_tracks_cached_payload():
+    import tempfile
+    from cache import Cache, FileCacheBackend
+    from ranking_service import get_rankings_version, rankings_cache_key, store_rankings_version
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = Cache(backend=FileCacheBackend(cache_dir=tmp))
+        with patch('ranking_service.get_cache', return_value=cache):
+            args = {'base_factor': '41'}
+            assert get_rankings_version(2030, 3, args) is None
+            key = rankings_cache_key(2030, 3, args)
+            stored = store_rankings_version(key, {'team_rankings': [1]}, ttl=120)
+            version = get_rankings_version(2030, 3, args)
+            assert version.digest == stored.digest
+            assert 0 < version.max_age <= 120
+            changed = store_rankings_version(key, {'team_rankings': [2]}, ttl=120)
+            assert changed.digest != stored.digest
+
+
+def test_computed_rankings_store_serialized_variants():
+    import json
+    import tempfile
+    from cache import Cache, FileCacheBackend
+    from ranking_service import get_or_calculate_rankings, get_rankings_body
+
+    data = {
+        'team_rankings': [{'team_name': 'A', 'wins_details': [{'opponent': 'B'}], 'losses_details': []}],
+        'conference_rankings': [],
+        'rankings': {'A': {}},
+        'year': 2030,
+        'week': 2,
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = Cache(backend=FileCacheBackend(cache_dir=tmp))
+        with patch('ranking_service.get_cache', return_value=cache), \
+                patch('ranking_service.calculate_rankings_logic', return_value=data):
+            get_or_calculate_rankings(MagicMock(), 2030, 2, {})
+            slim = json.loads(get_rankings_body(2030, 2, {}, 'list'))
+            detail = json.loads(get_rankings_body(2030, 2, {}, 'detail'))
+    assert slim['detail'] is False
+    assert 'wins_details' not in slim['team_rankings'][0]
+    assert 'rankings' not in detail
+    assert detail['team_rankings'][0]['wins_details'] == [{'opponent': 'B'}]
+
+
+def test_stream_rankings_matches_serialized_body():
+    import json
+    from ranking_service import serialize_rankings, stream_body, stream_rankings
+
+    payload = {
+        'year': 2024,
+        'week': 5,
+        'team_rankings': [{'team_name': f'T{i}', 'wins_details': [{'opponent': 'X' * 50}] * 20} for i in range(40)],
+        'conference_rankings': [{'conference_name': 'SEC'}],
+    }
+    with patch('ranking_service.STREAM_CHUNK_BYTES', 4096):
+        chunks = list(stream_rankings(payload))
+        body = serialize_rankings(payload)
+        body_chunks = list(stream_body(body))
+    assert len(chunks) > 5
+    assert json.loads(b''.join(chunks)) == payload
+    assert b''.join(body_chunks) == body.encode()
+    assert json.loads(b''.join(stream_rankings({'team_rankings': []}))) == {'team_rankings': []}
+    # Same bytes as the serialized body (one strong ETag covers both paths)
+    middle = {'year': 2024, 'team_rankings': payload['team_rankings'][:3], 'week': 5, 'algo': 'v5.1'}
+    for data in (payload, middle, {'team_rankings': [], 'week': 1}, {'year': 2024}):
+        assert b''.join(stream_rankings(data)) == serialize_rankings(data).encode()
+
+
+def test_rankings_batch_serves_hits_then_shares_one_game_fetch():
+    import json
+    import tempfile
+    from cache import Cache, FileCacheBackend
+    from ranking_service import BatchItem, iter_rankings_batch, rankings_cache_key, store_computed_rankings
+
+    games = [{'week': w, 'id': w} for w in range(1, 6)]
+
+    def calculate(processor, year, week, args, games=None):
+        return {'team_rankings': [{'team_name': 'A', 'games_seen': len(games)}], 'year': year, 'week': week}
+
+    processor = MagicMock()
+    processor.get_games_for_season.return_value = games
+    items = [BatchItem(2031, 5, {}), BatchItem(2031, 2, {}), BatchItem(2031, 1, {'prior_strength': '0.5'})]
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = Cache(backend=FileCacheBackend(cache_dir=tmp))
+        with patch('ranking_service.get_cache', return_value=cache), \
+                patch('rankings_history.get_rankings_history') as mock_history, \
+                patch('ranking_service.calculate_rankings_logic', side_effect=calculate):
+            store_computed_rankings(
+                rankings_cache_key(2031, 5, {}), 2031, 5, {'team_rankings': [], 'year': 2031, 'week': 5},
+            )
+            results = [(item, source, json.loads(body)) for item, source, body in
+                       iter_rankings_batch(processor, items)]
+    processor.get_games_for_season.assert_called_once_with(2031, through_week=2)
+    assert [(item.week, source) for item, source, _ in results] == [(5, 'cache'), (1, 'computed'), (2, 'computed')]
+    assert [body['team_rankings'][0]['games_seen'] for _, _, body in results[1:]] == [1, 2]
+    # Only default-config weeks go to the rankings history
+    assert [c.args[:2] for c in mock_history.return_value.record_week.call_args_list] == [(2031, 5), (2031, 2)]
+
+
+def test_rankings_batch_isolates_failures_and_keeps_static_to_default_config():
+    import tempfile
+    from cache import Cache, FileCacheBackend
+    from ranking_service import BatchItem, iter_rankings_batch
+
+    def static(year, week, accept_encodings=(), columnar=False):
+        return None if week == 2 else MagicMock(data=b'{"static":true}', encoding=None)
+
+    def calculate(processor, year, week, args, prefer_static=True):
+        if week == 2:
+            raise RuntimeError('solver blew up')
+        return {'team_rankings': [], 'year': year, 'week': week}
+
+    items = [BatchItem(2019, 1, {'prior_strength': '0.5'}), BatchItem(2018, 2, {}), BatchItem(2019, 3, {})]
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = Cache(backend=FileCacheBackend(cache_dir=tmp))
+        with patch('ranking_service.get_cache', return_value=cache), \
+                patch('static_rankings.read_static_rankings_body', side_effect=static) as mock_static, \
+                patch('ranking_service.get_or_calculate_rankings', side_effect=calculate):
+            results = [(item.week, source) for item, source, _ in iter_rankings_batch(MagicMock(), items)]
+    # The archived custom-config week is computed, not served the default static file
+    assert [c.args[:2] for c in mock_static.call_args_list] == [(2018, 2), (2019, 3)]
+    # A failing item is reported on its own and the rest of the batch still resolves
+    assert results == [(3, 'static'), (1, 'computed'), (2, 'error')]
+
+
+def test_static_files_only_answer_default_config_requests():
+    import tempfile
+    from cache import Cache, FileCacheBackend
+    from ranking_service import get_or_calculate_rankings, get_rankings_version, get_static_rankings_body
+
+    computed = {'team_rankings': [], 'year': 2019, 'week': 3}
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = Cache(backend=FileCacheBackend(cache_dir=tmp))
+        with patch('ranking_service.get_cache', return_value=cache), \
+                patch('ranking_service.record_rankings_history'), \
+                patch('ranking_service.calculate_rankings_logic', return_value=computed), \
+                patch('static_rankings.read_static_rankings', return_value={'static': True}) as mock_read, \
+                patch('static_rankings.read_static_digest', return_value='d' * 64) as mock_digest, \
+                patch('static_rankings.read_static_rankings_body') as mock_body:
+            for args in ({'team_quality_weight': '0.9'}, {'all_divisions': 'true'}):
+                assert get_static_rankings_body(2019, 3, args) is None
+                assert get_rankings_version(2019, 3, args) is None
+                assert get_or_calculate_rankings(MagicMock(), 2019, 3, args) == computed
+            mock_read.assert_not_called()
+            mock_digest.assert_not_called()
+            mock_body.assert_not_called()
+            assert get_or_calculate_rankings(MagicMock(), 2019, 3, {}) == {'static': True}
+            assert get_rankings_version(2019, 3, {}).digest == 'd' * 32
+
+
+def test_custom_config_skips_static_files_shards_and_breakdowns():
+    import tempfile
+    from cache import Cache, FileCacheBackend
+    from ranking_service import get_team_shard_body, rankings_cache_key, store_computed_rankings
+
+    data = {'team_rankings': [{'team_name': 'A'}], 'conference_rankings': [], 'year': 2019, 'week': 3}
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = Cache(backend=FileCacheBackend(cache_dir=tmp))
+        with patch('ranking_service.get_cache', return_value=cache), \
+                patch('ranking_service.record_rankings_history') as mock_history, \
+                patch('static_rankings.write_static_rankings') as mock_write, \
+                patch('static_rankings.write_static_columnar'), \
+                patch('static_rankings.write_team_shards') as mock_shards, \
+                patch('static_rankings.read_team_shard_body', return_value=b'shard') as mock_read, \
+                patch('ranking_service.store_team_breakdowns') as mock_breakdowns:
+            custom = {'prior_strength': '0.5'}
+            store_computed_rankings(rankings_cache_key(2019, 3, custom), 2019, 3, data, custom)
+            store_computed_rankings(rankings_cache_key(2019, 3, {'all_divisions': 'true'}), 2019, 3, data,
+                                    {'all_divisions': 'true'})
+            mock_breakdowns.assert_not_called()
+            mock_write.assert_not_called()
+            mock_shards.assert_not_called()
+            mock_history.assert_not_called()
+            assert get_team_shard_body(2019, 3, 'A', custom) is None
+            assert get_team_shard_body(2019, 3, 'A', {'all_divisions': 'true'}) is None
+            mock_read.assert_not_called()
+            store_computed_rankings(rankings_cache_key(2019, 3, {}), 2019, 3, data, {})
+            mock_write.assert_called_once()
+            mock_shards.assert_called_once()
+            mock_breakdowns.assert_called_once()
+            assert get_team_shard_body(2019, 3, 'A', {}) == b'shard'
@@ -0,0 +1,88 @@
+"""Tests for the append-only rankings history store."""
+import tempfile
+
+import pytest
+
+from rankings_history import RankingsHistory
+
+
+def _week(week, order, scores=None):
+    scores = scores or {}
+    return {
+        'year': 2024,
+        'week': week,
+        'team_rankings': [
+            {'team_name': name, 'conference': 'Big Ten', 'final_ranking_score': scores.get(name, 100 - i),
+             'records': {'total_wins': week, 'total_losses': 0}}
+            for i, name in enumerate(order)
+        ],
+        'conference_rankings': [
+            {'conference_name': 'Big Ten', 'conference_type': 'Power 4', 'average_team_quality': 1600 + week,
+             'number_of_teams': 18},
+            {'conference_name': 'SEC', 'conference_type': 'Power 4', 'average_team_quality': 1590,
+             'number_of_teams': 16},
+        ],
+    }
+
+
+@pytest.fixture
+def history():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield RankingsHistory(f'{tmpdir}/history.sqlite3')
+
+
+def test_team_trajectory_is_one_row_per_week_by_name_or_alias(history):
+    assert history.record_week(2024, 1, 'd1', _week(1, ['Oregon', 'Ohio State', 'Penn State']))
+    assert history.record_week(2024, 2, 'd2', _week(2, ['Ohio State', 'Oregon', 'Penn State']))
+    assert not history.record_week(2024, 2, 'd2', _week(2, ['Ohio State', 'Oregon', 'Penn State']))
+
+    weeks = history.team_history('Ohio St.', 2024)
+    assert [(w['week'], w['rank'], w['wins']) for w in weeks] == [(1, 2, 1), (2, 1, 2)]
+    assert weeks[0]['team_name'] == 'Ohio State'
+    assert history.team_history('ohio state', 2023) == []
+    assert history.recorded_weeks(2024) == [1, 2]
+
+
+def test_recomputed_week_appends_and_latest_snapshot_wins(history):
+    history.record_week(2024, 3, 'old', _week(3, ['Oregon', 'Ohio State']))
+    history.record_week(2024, 3, 'new', _week(3, ['Ohio State', 'Oregon'], {'Ohio State': 120}))
+
+    [week] = history.team_history('Ohio State', 2024)
+    assert (week['rank'], week['final_ranking_score']) == (1, 120)
+
+
+def test_earlier_payload_coming_back_is_latest_again(history):
+    history.record_week(2024, 3, 'a', _week(3, ['Oregon', 'Ohio State']))
+    history.record_week(2024, 3, 'b', _week(3, ['Ohio State', 'Oregon']))
+    assert history.record_week(2024, 3, 'a', _week(3, ['Oregon', 'Ohio State']))
+    assert not history.record_week(2024, 3, 'a', _week(3, ['Oregon', 'Ohio State']))
+
+    [week] = history.team_history('Oregon', 2024)
+    assert week['rank'] == 1
+    assert [w['rank'] for w in history.conference_history('Big Ten', 2024)] == [1]
+
+
+def test_history_without_seq_column_is_migrated():
+    import sqlite3
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = f'{tmpdir}/history.sqlite3'
+        with sqlite3.connect(path) as conn:
+            conn.execute(
+                'CREATE TABLE snapshots (id INTEGER PRIMARY KEY AUTOINCREMENT, season INTEGER NOT NULL, '
+                'week INTEGER NOT NULL, digest TEXT NOT NULL, recorded_at REAL NOT NULL, '
+                'UNIQUE (season, week, digest))'
+            )
+        history = RankingsHistory(path)
+        history.record_week(2024, 1, 'old', _week(1, ['Oregon', 'Ohio State']))
+        history.record_week(2024, 1, 'new', _week(1, ['Ohio State', 'Oregon']))
+        assert history.team_history('Ohio State', 2024)[0]['rank'] == 1
+
+
+def test_conference_trajectory(history):
+    history.record_week(2024, 1, 'd1', _week(1, ['Oregon']))
+    history.record_week(2024, 2, 'd2', _week(2, ['Oregon']))
+
+    weeks = history.conference_history('big ten', 2024)
+    assert [(w['week'], w['rank'], w['average_team_quality']) for w in weeks] == [(1, 1, 1601), (2, 1, 1602)]
+    assert weeks[0]['conference_name'] == 'Big Ten'
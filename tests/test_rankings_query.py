@@ -0,0 +1,56 @@
+"""Tests for /rankings field projection, paging and conference filters."""
+import pytest
+
+from rankings_query import apply_rankings_query, parse_rankings_query, query_index
+
+PAYLOAD = {
+    'year': 2024,
+    'week': 5,
+    'detail': False,
+    'team_rankings': [
+        {'team_name': 'Texas', 'conference': 'SEC', 'conference_type': 'Power 4', 'final_ranking_score': 9.0},
+        {'team_name': 'Oregon', 'conference': 'Big Ten', 'conference_type': 'Power 4', 'final_ranking_score': 8.0},
+        {'team_name': 'Boise State', 'conference': 'Mountain West', 'conference_type': 'Group of 5',
+         'final_ranking_score': 7.0},
+        {'team_name': 'Georgia', 'conference': 'SEC', 'conference_type': 'Power 4', 'final_ranking_score': 6.0},
+    ],
+    'conference_rankings': [
+        {'conference_name': 'SEC', 'conference_type': 'Power 4'},
+        {'conference_name': 'Mountain West', 'conference_type': 'Group of 5'},
+    ],
+}
+
+
+def test_parse_returns_none_without_query_params():
+    assert parse_rankings_query({'year': '2024', 'detail': 'true'}) is None
+    query = parse_rankings_query({'limit': '25', 'fields': 'team_name, logo,logo', 'conference': 'SEC,Big Ten'})
+    assert query.fields == ('team_name', 'logo')
+    assert query.conference == ('sec', 'big ten')
+    assert query.key == 'fields=team_name,logo&limit=25&conference=sec,big ten'
+    with pytest.raises(ValueError):
+        parse_rankings_query({'limit': 'ten'})
+    with pytest.raises(ValueError):
+        parse_rankings_query({'offset': '-1'})
+
+
+def test_top_n_projection_keeps_overall_rank():
+    query = parse_rankings_query({'limit': '2', 'offset': '1', 'fields': 'final_ranking_score,nope'})
+    result = apply_rankings_query(PAYLOAD, query, 'v1')
+    assert result['team_rankings'] == [
+        {'rank': 2, 'team_name': 'Oregon', 'final_ranking_score': 8.0},
+        {'rank': 3, 'team_name': 'Boise State', 'final_ranking_score': 7.0},
+    ]
+    assert result['query'] == {'total': 4, 'offset': 1, 'limit': 2}
+    assert 'conference_rankings' not in result
+    with_table = apply_rankings_query(PAYLOAD, parse_rankings_query({'fields': 'conference_rankings'}), 'v1')
+    assert with_table['conference_rankings'] == PAYLOAD['conference_rankings']
+    assert with_table['team_rankings'][0] == {'rank': 1, 'team_name': 'Texas'}
+    assert 'query' not in PAYLOAD and len(PAYLOAD['team_rankings'][0]) == 4
+
+
+def test_conference_filters_use_cached_index():
+    query = parse_rankings_query({'conference': 'sec,mountain west', 'conference_type': 'POWER 4'})
+    result = apply_rankings_query(PAYLOAD, query, 'v2')
+    assert [(t['rank'], t['team_name']) for t in result['team_rankings']] == [(1, 'Texas'), (4, 'Georgia')]
+    assert [c['conference_name'] for c in result['conference_rankings']] == ['SEC']
+    assert query_index('v2', PAYLOAD['team_rankings']) is query_index('v2', PAYLOAD['team_rankings'])
@@ -0,0 +1,95 @@
+"""Tests for single-file season bundles."""
+import gzip
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from season_bundle import member_slice, pack_bundle, read_bundle_index
+
+
+def test_pack_and_slice_members():
+    members = {'week-1.json': b'{"week":1}', 'week-1.json.gz': b'\x1f\x8b', 'week-2.json': b''}
+    data = pack_bundle(2024, members)
+    index = read_bundle_index(data)
+    assert index['year'] == 2024
+    assert list(index['members']) == list(members)
+    for name, raw in members.items():
+        assert data[member_slice(index, name)] == raw
+    assert member_slice(index, 'week-3.json') is None
+    with pytest.raises(ValueError):
+        read_bundle_index(b'not a bundle')
+    with pytest.raises(ValueError):
+        read_bundle_index(data[:len(data) // 4])
+
+
+def test_static_reads_prefer_bundle_and_survive_loose_files_removed():
+    from static_rankings import (
+        bundle_path_for,
+        preload_season,
+        read_static_digest,
+        read_static_rankings,
+        read_static_rankings_body,
+        read_week_story,
+        write_season_bundle,
+        write_static_rankings,
+        write_week_story,
+    )
+
+    payloads = {w: {'year': 2024, 'week': w, 'detail': False, 'team_rankings': [{'team_name': 'A'}] * 20}
+                for w in (1, 2)}
+    with tempfile.TemporaryDirectory() as tmp:
+        for week, payload in payloads.items():
+            write_static_rankings(payload, 2024, week, root=tmp)
+        write_week_story({'headline': 'x'}, 2024, 2, root=tmp)
+        loose_etag = read_static_rankings_body(2024, 2, root=tmp).etag
+        assert write_season_bundle(2024, root=tmp) == bundle_path_for(2024, root=tmp)
+        shutil.rmtree(Path(tmp) / '2024')
+
+        assert read_static_rankings(2024, 1, root=tmp) == payloads[1]
+        assert read_week_story(2024, 2, root=tmp) == {'headline': 'x'}
+        plain = read_static_rankings_body(2024, 2, root=tmp)
+        assert plain.etag == loose_etag == read_static_digest(2024, 2, root=tmp)[:32]
+        zipped = read_static_rankings_body(2024, 2, ['gzip'], root=tmp)
+        assert zipped.encoding == 'gzip'
+        assert json.loads(gzip.decompress(zipped.data)) == payloads[2]
+        assert read_static_rankings(2024, 3, root=tmp) is None
+        loaded = preload_season(root=tmp)
+        assert sorted(p.name for p in loaded) == ['week-1.json', 'week-2.json', 'week-2.story.json']
+
+
+def test_loose_files_rewritten_after_packing_win_over_bundle():
+    from static_rankings import (
+        bundle_path_for,
+        preload_season,
+        read_static_rankings,
+        read_static_rankings_body,
+        read_week_story,
+        story_path_for,
+        static_path_for,
+        write_season_bundle,
+        write_static_rankings,
+        write_week_story,
+    )
+
+    old = {'year': 2024, 'week': 5, 'detail': False, 'team_rankings': [{'team_name': 'A'}]}
+    new = {**old, 'team_rankings': [{'team_name': 'B'}]}
+    with tempfile.TemporaryDirectory() as tmp:
+        write_static_rankings(old, 2024, 5, root=tmp)
+        write_week_story({'headline': 'old'}, 2024, 5, root=tmp)
+        write_season_bundle(2024, root=tmp)
+        packed_at = os.stat(bundle_path_for(2024, root=tmp)).st_mtime
+        write_static_rankings(new, 2024, 5, root=tmp)
+        write_week_story({'headline': 'new'}, 2024, 5, root=tmp)
+        for path in Path(tmp, '2024').glob('week-5*'):
+            os.utime(path, (packed_at + 1, packed_at + 1))
+
+        assert read_static_rankings(2024, 5, root=tmp) == new
+        assert json.loads(bytes(read_static_rankings_body(2024, 5, root=tmp).data)) == new
+        assert read_week_story(2024, 5, root=tmp) == {'headline': 'new'}
+        loaded = preload_season(root=tmp)
+        assert static_path_for(2024, 5, root=tmp) in loaded
+        assert story_path_for(2024, 5, root=tmp) in loaded
@@ -0,0 +1,82 @@
+"""Tests for columnar season snapshots and snapshot-backed processing."""
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from season_snapshot import SeasonSnapshot, SnapshotApiClient, snapshot_path, write_snapshot
+
+
+def _game(game_id, week, season_type='regular', home='Georgia', away='Texas', venue='Sanford Stadium'):
+    return {
+        'id': game_id,
+        'week': week,
+        'year': 2024,
+        'season_type': season_type,
+        'home_team_name': home,
+        'away_team_name': away,
+        'home_score': 30,
+        'away_score': 15,
+        'home_conference': 'SEC',
+        'away_conference': 'SEC',
+        'is_interconference': False,
+        'venue': venue,
+        'date': f'2024-09-{week:02d}T23:30:00.000Z',
+    }
+
+
+TEAMS = {
+    'Georgia': {'conference': 'SEC', 'logos': ['g.png'], 'color': '#ba0c2f'},
+    'Texas': {'conference': 'SEC', 'logos': ['t.png'], 'color': '#bf5700'},
+}
+
+
+@pytest.fixture
+def snapshot_dir():
+    games = [
+        _game(1, 1),
+        _game(2, 2, home='Texas', away='Georgia', venue=None),
+        _game(3, 3),
+        _game(4, 1, season_type='postseason'),
+    ]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        write_snapshot(snapshot_path(2024, tmpdir), 2024, games, TEAMS)
+        yield Path(tmpdir)
+
+
+def test_roundtrip_preserves_games(snapshot_dir):
+    snap = SeasonSnapshot(snapshot_path(2024, snapshot_dir))
+    assert snap.rows == 4
+    regular = snap.games()
+    assert [g['id'] for g in regular] == [1, 2, 3]
+    assert regular[0] == _game(1, 1)
+    assert regular[1]['venue'] is None
+    assert [g['id'] for g in snap.games(season_type='postseason')] == [4]
+    assert [g['id'] for g in snap.games(through_week=2)] == [1, 2]
+    assert snap.available_weeks() == [1, 2, 3]
+    assert snap.teams == TEAMS
+
+
+def test_rejects_non_snapshot_file():
+    with tempfile.NamedTemporaryFile(suffix='.cfbsnap') as f:
+        f.write(b'not a snapshot file')
+        f.flush()
+        with pytest.raises(ValueError):
+            SeasonSnapshot(f.name)
+
+
+def test_processor_runs_from_snapshot_dir(snapshot_dir, monkeypatch):
+    from data_processor import CFBDataProcessor
+
+    monkeypatch.setenv('CFBD_SNAPSHOT_DIR', str(snapshot_dir))
+    processor = CFBDataProcessor()
+    assert isinstance(processor.api_client, SnapshotApiClient)
+    assert processor.get_team_logo('Georgia') == 'g.png'
+
+    games = processor.get_games_for_season(2024, through_week=2)
+    assert [g['id'] for g in games] == [1, 2]
+    assert games[0]['home_conference_type'] == 'Power 4'
+    assert 'season_type' not in games[0]
+    # Full season includes postseason
+    assert len(processor.get_games_for_season(2024)) == 4
+    assert processor.api_client.get_games(1999) == []
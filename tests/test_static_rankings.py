@@ -32,3 +32,103 @@ def test_read_static_missing_returns_none():
 
     with tempfile.TemporaryDirectory() as tmp:
         assert read_static_rankings(1999, 1, root=tmp) is None
+
+
+def test_static_index_caches_and_revalidates():
+    from static_rankings import StaticFileIndex, static_path_for, write_static_rankings
+
+    index = StaticFileIndex(max_entries=2)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_static_rankings({'week': 1, 'detail': False}, 2024, 1, root=tmp)
+        first = index.read_json(path)
+        assert index.read_json(path) is first
+        assert index.stats()['loads'] == 1
+
+        write_static_rankings({'week': 1, 'detail': False, 'algo': 'v9'}, 2024, 1, root=tmp)
+        assert index.read_json(path)['algo'] == 'v9'
+        assert index.read_bytes(path) == path.read_bytes()
+
+        for week in (2, 3):
+            index.read_json(write_static_rankings({'week': week}, 2024, week, root=tmp))
+        assert index.stats()['entries'] == 2
+        os.remove(static_path_for(2024, 3, root=tmp))
+        assert index.read_json(static_path_for(2024, 3, root=tmp)) is None
+
+
+def test_body_only_for_slim_payloads():
+    from static_rankings import read_static_rankings_body, write_static_rankings
+
+    with tempfile.TemporaryDirectory() as tmp:
+        write_static_rankings({'week': 4, 'detail': False, 'team_rankings': []}, 2024, 4, root=tmp)
+        write_static_rankings({'week': 5, 'team_rankings': [{'wins_details': []}]}, 2024, 5, root=tmp)
+        body = read_static_rankings_body(2024, 4, root=tmp)
+        # A view into the mapped file, not a copy
+        assert isinstance(body.data, memoryview)
+        assert json.loads(bytes(body.data))['week'] == 4
+        assert body.encoding is None
+        assert read_static_rankings_body(2024, 5, root=tmp) is None
+
+
+def test_precompressed_siblings_and_stable_etag():
+    import gzip
+    from static_rankings import read_static_rankings_body, static_path_for, write_static_rankings
+
+    payload = {'week': 6, 'detail': False, 'team_rankings': [{'team_name': 'A'}] * 50}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_static_rankings(payload, 2024, 6, root=tmp)
+        gz = Path(f'{path}.gz')
+        assert gz.exists() and gz.stat().st_size < path.stat().st_size
+        body = read_static_rankings_body(2024, 6, ['br', 'gzip'], root=tmp)
+        assert body.encoding == 'gzip'
+        assert json.loads(gzip.decompress(body.data)) == payload
+        identity = read_static_rankings_body(2024, 6, root=tmp)
+        assert body.etag.startswith(identity.etag)
+
+        # Rewritten JSON without fresh siblings falls back to identity bytes
+        later = path.stat().st_mtime_ns + 10**9
+        os.utime(static_path_for(2024, 6, root=tmp), ns=(later, later))
+        assert read_static_rankings_body(2024, 6, ['gzip'], root=tmp).encoding is None
+
+
+def test_team_shards_and_name_index():
+    from static_rankings import read_team_shard_body, team_shard_dir_for, write_team_shards
+
+    def team(name, score):
+        return {
+            'team_name': name, 'conference': 'SEC', 'final_ranking_score': score,
+            'team_quality_score': score, 'record_score': score, 'conference_quality_score': score,
+            'sos': score, 'sov': score,
+            'records': {
+                'total_wins': 1, 'total_losses': 0, 'conf_wins': 0, 'conf_losses': 0,
+                'power_wins': 1, 'power_losses': 0, 'group_five_wins': 0, 'group_five_losses': 0,
+            },
+            'wins_details': [{'opponent': 'X'}],
+            'losses_details': [],
+        }
+
+    full = {'year': 2024, 'week': 8, 'team_rankings': [team('Texas A&M', 90.0), team("Hawai'i", 80.0)]}
+    with tempfile.TemporaryDirectory() as tmp:
+        index_path = write_team_shards(full, 2024, 8, root=tmp)
+        assert index_path.parent == team_shard_dir_for(2024, 8, root=tmp)
+        index = json.loads(index_path.read_text())['teams']
+        assert index["hawai'i"] == {'name': "Hawai'i", 'rank': 2, 'file': 'hawai-i.json'}
+        body = read_team_shard_body(2024, 8, "HAWAI'I", root=tmp)
+        shard = json.loads(bytes(body.data))
+        assert shard['team']['rank'] == 2
+        assert shard['wins_details'] == [{'opponent': 'X'}]
+        assert shard['comparisons_ahead'][0]['other_team'] == 'Texas A&M'
+        assert shard['path_to_climb']['team_above'] == 'Texas A&M'
+        assert read_team_shard_body(2024, 8, 'Nobody', root=tmp) is None
+        assert write_team_shards({'team_rankings': [{'team_name': 'A'}]}, 2024, 9, root=tmp) is None
+
+
+def test_preload_latest_season():
+    from static_rankings import get_static_index, preload_season, write_static_rankings, write_week_story
+
+    with tempfile.TemporaryDirectory() as tmp:
+        write_static_rankings({'week': 1}, 2023, 1, root=tmp)
+        write_static_rankings({'week': 1}, 2024, 1, root=tmp)
+        write_week_story({'headline': 'x'}, 2024, 1, root=tmp)
+        loaded = preload_season(root=tmp)
+        assert [p.name for p in loaded] == ['week-1.json', 'week-1.story.json']
+        assert get_static_index().read_json(Path(tmp) / '2024' / 'week-1.json') == {'week': 1}
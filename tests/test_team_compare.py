@@ -0,0 +1,47 @@
+"""Tests for the vectorized all-pairs team comparison."""
+import pytest
+
+from team_breakdown import _build_comparison
+from team_compare import compare_teams
+
+
+def _team(name, final, tq, rec, cq, sos, sov):
+    return {
+        'team_name': name, 'conference': 'SEC', 'final_ranking_score': final,
+        'team_quality_score': tq, 'record_score': rec, 'conference_quality_score': cq,
+        'sos': sos, 'sov': sov,
+        'records': {'total_wins': 9, 'total_losses': 1},
+    }
+
+
+TEAMS = [
+    _team('Georgia', 1900.0, 1800.0, 2300.0, 1500.0, 1450.0, 1400.0),
+    _team('Texas', 1850.0, 1850.0, 2100.0, 1500.0, 1400.0, 1420.0),
+    _team('Boise State', 1700.0, 1650.0, 2150.0, 1200.0, 1300.0, 1350.0),
+]
+
+
+def test_pair_matrices_match_single_pair_comparison():
+    result = compare_teams(TEAMS, [0, 1, 2])
+    matrices = result['matrices']
+    for i in range(3):
+        for j in range(3):
+            if i == j:
+                continue
+            single = _build_comparison(TEAMS[i], TEAMS[j], i + 1, j + 1)
+            assert matrices['score_diff'][i][j] == pytest.approx(single['score_diff'], abs=0.01)
+            by_factor = {f['factor']: f for f in single['factors']}
+            if 'Record Score (Resume)' in by_factor:
+                assert abs(matrices['record'][i][j]) == pytest.approx(
+                    by_factor['Record Score (Resume)']['contribution'], abs=0.01)
+    assert matrices['team_quality'][0][1] == pytest.approx(-32.5)
+    assert matrices['sos'][1][2] == 100.0
+    assert [t['rank'] for t in result['teams']] == [1, 2, 3]
+
+
+def test_deciding_factor_favors_the_team_ahead():
+    result = compare_teams(TEAMS, [2, 0])
+    assert [t['team_name'] for t in result['teams']] == ['Boise State', 'Georgia']
+    # Georgia leads on every weighted factor; Elo (150 * 0.65) is its biggest edge
+    assert result['deciding_factor'] == [[None, 'team_quality'], ['team_quality', None]]
+    assert result['matrices']['score_diff'] == [[0.0, -200.0], [200.0, 0.0]]
@@ -0,0 +1,51 @@
+"""Tests for team name lookup: normalization, aliases, fuzzy matching and autocomplete."""
+from team_lookup import TeamIndex, normalize_team_name, team_index
+
+TEAMS = [
+    {'team_name': name}
+    for name in ['Ohio State', 'Miami', 'Texas A&M', "Hawai'i", 'Miami (OH)', 'San José State', 'Georgia',
+                 'Georgia Tech', 'Ole Miss']
+]
+
+
+def test_normalize_drops_case_accents_and_punctuation():
+    assert normalize_team_name('  San José  State ') == 'san jose state'
+    assert normalize_team_name('Ohio St.') == 'ohio st'
+    assert normalize_team_name('Texas A&M') == 'texas am'
+    assert normalize_team_name("Hawai'i") == 'hawaii'
+    assert normalize_team_name('Miami (OH)') == 'miami oh'
+
+
+def test_find_matches_names_short_forms_and_aliases():
+    index = TeamIndex(TEAMS)
+    assert index.find('ohio state') == 0
+    assert index.find('Ohio St.') == 0
+    assert index.find('Miami (FL)') == 1
+    assert index.find('Miami') == 1
+    assert index.find('miami ohio') == 4
+    assert index.find('Texas A&M') == 2
+    assert index.find('hawaii') == 3
+    assert index.find('San Jose St') == 5
+    assert index.find('Mississippi') == 8
+    assert index.find('Gorgia') is None
+    assert index.suggest('Gorgia') == [6]
+    assert index.suggest('Nowhere U') == []
+    assert index.suggest('Georgi Tech', limit=1) == [7]
+
+
+def test_complete_walks_prefixes_and_word_starts_in_rank_order():
+    index = TeamIndex(TEAMS)
+    assert index.complete('geo') == [6, 7]
+    assert index.complete('GEORGIA T') == [7]
+    assert index.complete('tech') == [7]
+    assert index.complete('mia', limit=1) == [1]
+    assert index.complete('zzz') == []
+
+
+def test_team_index_is_built_once_per_list():
+    teams = list(TEAMS)
+    index = team_index(teams)
+    assert team_index(teams) is index
+    assert team_index(list(TEAMS)) is not index
+    teams.append({'team_name': 'Navy'})
+    assert team_index(teams).find('navy') == len(TEAMS)
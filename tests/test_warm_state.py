@@ -0,0 +1,93 @@
+"""Tests for the boot-time warm-state snapshot."""
+import json
+import tempfile
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from cache import Cache, FileCacheBackend
+from data_processor import CFBDataProcessor
+from warm_state import (
+    collect_warm_state, hot_rankings_keys, load_warm_state, note_rankings_request, write_warm_state,
+)
+
+TEAMS = {'Georgia': {'conference': 'SEC', 'logos': ['g.png']}}
+
+
+@pytest.fixture
+def tmpdir_path():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+def _processor(lazy=True):
+    client = MagicMock()
+    client.get_teams_with_logos.return_value = TEAMS
+    return CFBDataProcessor(api_client=client, lazy_registry=lazy), client
+
+
+def test_snapshot_roundtrip_warms_new_worker(tmpdir_path, monkeypatch):
+    old_cache = Cache(backend=FileCacheBackend(cache_dir=f'{tmpdir_path}/old'))
+    processor, _ = _processor(lazy=False)
+    weeks_key = old_cache._generate_key('available_weeks', 2024)
+    old_cache.set(weeks_key, [1, 2, 3], 3600)
+    old_cache.set('hot-rankings', {'team_rankings': [{'team_name': 'Georgia'}]}, 600)
+    old_cache.set('cold-rankings', {'team_rankings': []}, 600)
+    for _ in range(3):
+        note_rankings_request('hot-rankings')
+    path = write_warm_state(
+        collect_warm_state(processor, old_cache, 2024, hot_limit=1), f'{tmpdir_path}/warm.json'
+    )
+
+    new_cache = Cache(backend=FileCacheBackend(cache_dir=f'{tmpdir_path}/new'))
+    fresh, client = _processor(lazy=True)
+    summary = load_warm_state(fresh, new_cache, path)
+    assert summary == {'team_registry': 1, 'week_index': 1, 'rankings': 1}
+    assert fresh.registry_ready
+    assert fresh.get_team_logo('Georgia') == 'g.png'
+    client.get_teams_with_logos.assert_not_called()
+    assert new_cache.get(weeks_key) == [1, 2, 3]
+    assert new_cache.get('hot-rankings')['team_rankings'][0]['team_name'] == 'Georgia'
+    assert new_cache.get('cold-rankings') is None
+
+
+def test_stale_or_missing_snapshot_is_ignored(tmpdir_path, monkeypatch):
+    processor, _ = _processor()
+    cache = Cache(backend=FileCacheBackend(cache_dir=tmpdir_path))
+    assert load_warm_state(processor, cache, f'{tmpdir_path}/missing.json') is None
+
+    path = f'{tmpdir_path}/warm.json'
+    with open(path, 'w') as f:
+        json.dump({'version': 1, 'written_at': time.time() - 10, 'team_registry': TEAMS}, f)
+    monkeypatch.setenv('WARM_STATE_MAX_AGE', '1')
+    assert load_warm_state(processor, cache, path) is None
+    assert not processor.registry_ready
+
+
+def test_manifest_is_read_from_disk_not_snapshot(tmpdir_path, monkeypatch):
+    import static_rankings
+
+    monkeypatch.setattr(static_rankings, 'DEFAULT_ROOT', tmpdir_path)
+    path = static_rankings.manifest_path_for()
+    path.write_text(json.dumps({'years': {'2024': [1]}}))
+    assert static_rankings.read_manifest() == {'years': {'2024': [1]}}
+    # A redeploy rewrites manifest.json; the running process picks it up
+    path.write_text(json.dumps({'years': {'2024': [1, 2, 3]}}))
+    assert static_rankings.read_manifest() == {'years': {'2024': [1, 2, 3]}}
+    processor, _ = _processor()
+    cache = Cache(backend=FileCacheBackend(cache_dir=tmpdir_path))
+    assert 'manifest' not in collect_warm_state(processor, cache, 2024)
+
+
+def test_hot_rankings_counter_is_bounded(monkeypatch):
+    import warm_state
+
+    monkeypatch.setattr(warm_state, '_hot_rankings', warm_state.Counter())
+    # Every custom config is requested once; the default keeps coming back
+    for i in range(warm_state.HOT_RANKINGS_TRACKED * 3):
+        note_rankings_request(f'custom-{i}')
+        if i % 10 == 0:
+            note_rankings_request('default')
+    assert len(warm_state._hot_rankings) <= warm_state.HOT_RANKINGS_TRACKED
+    assert hot_rankings_keys(1) == ['default']
@@ -0,0 +1,79 @@
+"""Tests for week-to-week delta encoding of archived seasons."""
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from week_deltas import apply_delta, build_season_deltas, diff_weeks, reconstruct_week
+
+SEASON = Path(__file__).resolve().parents[1] / 'frontend' / 'static' / 'rankings' / '2024'
+
+
+def _week(week, teams):
+    return {
+        'year': 2024,
+        'week': week,
+        'detail': False,
+        'team_rankings': teams,
+        'conference_rankings': [{'conference_name': 'SEC', 'number_of_teams': 16}],
+    }
+
+
+def test_real_season_rebuilds_exactly_and_shrinks():
+    weeks = {w: json.loads((SEASON / f'week-{w}.json').read_text()) for w in range(1, 16)}
+    base, deltas = build_season_deltas(weeks)
+    assert base is weeks[1] and sorted(deltas) == list(range(2, 16))
+    for week, payload in weeks.items():
+        assert reconstruct_week(base, deltas, week) == payload
+    full = sum(len(json.dumps(p)) for p in weeks.values())
+    bundle = len(json.dumps(base)) + sum(len(json.dumps(d)) for d in deltas.values())
+    assert bundle < full / 2
+
+
+def test_added_removed_unset_and_reorder():
+    old = _week(1, [
+        {'team_name': 'A', 'score': 1.0, 'records': {'wins': 1}, 'sos_rank': 4},
+        {'team_name': 'B', 'score': 2.0, 'records': {'wins': 0}},
+        {'team_name': 'C', 'score': 3.0, 'records': {'wins': 0}},
+    ])
+    new = _week(2, [
+        {'team_name': 'D', 'score': 9.0, 'records': {'wins': 2}},
+        {'team_name': 'A', 'score': 1.0, 'records': {'wins': 2}},
+        {'team_name': 'C', 'score': 3.5, 'records': {'wins': 0}},
+    ])
+    delta = json.loads(json.dumps(diff_weeks(old, new)))
+    teams = delta['tables']['team_rankings']
+    assert teams['changed'] == {
+        'rows': [0, 2],
+        'columns': {'records.wins': {'at': [0], 'values': [2]}, 'score': {'at': [1], 'values': [3.5]}},
+    }
+    assert teams['unset'] == {'A': ['sos_rank']}
+    assert teams['removed'] == ['B'] and teams['order'] == [2, 0, 1]
+    assert 'conference_rankings' not in delta['tables']
+    assert apply_delta(old, delta) == new
+    assert old['team_rankings'][0]['sos_rank'] == 4  # not mutated
+
+
+def test_delta_must_follow_its_source_week():
+    weeks = {1: _week(1, []), 2: _week(2, []), 3: _week(3, [])}
+    base, deltas = build_season_deltas(weeks)
+    with pytest.raises(ValueError):
+        apply_delta(base, deltas[3])
+    assert reconstruct_week(base, deltas, 4) is None
+
+
+def test_read_static_rankings_falls_back_to_delta_bundle():
+    from static_rankings import read_static_rankings, static_path_for, write_season_deltas, write_static_rankings
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for week in (1, 2, 3):
+            write_static_rankings(_week(week, [{'team_name': 'A', 'score': float(week)}]), 2024, week, root=tmp)
+        manifest_path = write_season_deltas(2024, root=tmp)
+        manifest = json.loads(manifest_path.read_text())
+        assert manifest['weeks'] == [1, 2, 3]
+        assert [e['from_week'] for e in manifest['deltas']] == [1, 2]
+        static_path_for(2024, 3, root=tmp).unlink()
+        rebuilt = read_static_rankings(2024, 3, root=tmp)
+        assert rebuilt['week'] == 3 and rebuilt['team_rankings'] == [{'team_name': 'A', 'score': 3.0}]
+        assert read_static_rankings(2024, 4, root=tmp) is None
@@ -0,0 +1,100 @@
+"""Tests for what-if rankings (checkpointed replay of hypothetical results)."""
+import os
+from collections import defaultdict
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+os.environ.setdefault('CFBD_API_KEY', 'test-key-for-unit-tests')
+
+import whatif
+from team_lookup import TeamNotFoundError
+from whatif import ScenarioGame, parse_scenario, run_whatif
+
+CONFERENCES = {'Alpha': 'SEC', 'Bravo': 'SEC', 'Charlie': 'SEC', 'Delta': 'Big Ten', 'Echo': 'Big Ten', 'Foxtrot': 'Big Ten'}
+# (week, home, away, home_score, away_score)
+RESULTS = [
+    (1, 'Alpha', 'Delta', 31, 10), (1, 'Bravo', 'Echo', 24, 21), (1, 'Charlie', 'Foxtrot', 17, 20),
+    (2, 'Delta', 'Bravo', 14, 28), (2, 'Echo', 'Charlie', 35, 7), (2, 'Foxtrot', 'Alpha', 3, 42),
+    (3, 'Alpha', 'Bravo', 27, 24), (3, 'Delta', 'Echo', 21, 17), (3, 'Charlie', 'Foxtrot', 30, 27),
+]
+
+
+def _game(week, home, away, home_score, away_score):
+    return {
+        'week': week, 'season_type': 'regular', 'notes': None,
+        'home_team_name': home, 'away_team_name': away, 'home_score': home_score, 'away_score': away_score,
+        'home_conference': CONFERENCES[home], 'away_conference': CONFERENCES[away],
+        'home_conference_type': 'Power 4', 'away_conference_type': 'Power 4',
+    }
+
+
+def _organize(games):
+    by_week = defaultdict(list)
+    for game in games:
+        by_week[game['week']].append(game)
+    return dict(by_week)
+
+
+@pytest.fixture
+def processor():
+    whatif._states.clear()
+    mock = MagicMock()
+    mock.get_games_for_season.return_value = [_game(*result) for result in RESULTS]
+    mock.organize_games_by_week.side_effect = _organize
+    mock.team_info_map = {}
+    with patch('whatif.compute_priors', return_value={}):
+        yield mock
+    whatif._states.clear()
+
+
+def test_flipped_result_replays_from_its_week(processor):
+    result = run_whatif(processor, 2024, 3, {}, [ScenarioGame('Bravo', 'Alpha')])
+    assert result['replayed_from_week'] == 3
+    assert result['games'] == [{
+        'type': 'result', 'week': 3, 'home_team': 'Alpha', 'away_team': 'Bravo', 'home_score': 24, 'away_score': 27,
+    }]
+    rows = {row['team_name']: row for row in result['teams']}
+    assert rows['Bravo']['rank_change'] > 0 and rows['Bravo']['score_change'] > 0
+    assert rows['Alpha']['score_change'] < 0
+    assert {row['team_name'] for row in result['movers']} >= {'Alpha', 'Bravo'}
+
+
+def test_unchanged_result_matches_baseline(processor):
+    # Re-applying week 1's real result replays weeks 1-3 from the checkpoint and lands on the baseline
+    result = run_whatif(processor, 2024, 3, {}, [ScenarioGame('Alpha', 'Delta', week=1, winner_score=31, loser_score=10)])
+    assert result['replayed_from_week'] == 1
+    assert all(row['rank_change'] == 0 and row['score_change'] == 0 for row in result['teams'])
+    assert result['movers'] == []
+
+
+def test_new_game_goes_after_last_week_and_reuses_state(processor):
+    first = run_whatif(processor, 2024, 3, {}, [ScenarioGame('foxtrot', 'bravo')])
+    second = run_whatif(processor, 2024, 3, {}, [ScenarioGame('Echo', 'Alpha', home='Echo', winner_score=20, loser_score=17)])
+    assert first['replayed_from_week'] == 4
+    assert first['games'][0] == {
+        'type': 'added', 'week': 4, 'home_team': 'Foxtrot', 'away_team': 'Bravo', 'home_score': 28, 'away_score': 21,
+    }
+    foxtrot = next(row for row in first['teams'] if row['team_name'] == 'Foxtrot')
+    assert foxtrot['score_change'] > 0
+    assert second['games'][0]['home_team'] == 'Echo'
+    # One baseline solve serves both scenarios
+    processor.get_games_for_season.assert_called_once_with(2024, through_week=3)
+
+
+def test_scenario_errors(processor):
+    with pytest.raises(TeamNotFoundError):
+        run_whatif(processor, 2024, 3, {}, [ScenarioGame('Nowhere U', 'Alpha')])
+    # A typo is not silently taken for another team
+    with pytest.raises(TeamNotFoundError) as typo:
+        run_whatif(processor, 2024, 3, {}, [ScenarioGame('Bravoo', 'Alpha')])
+    assert typo.value.suggestions == ['Bravo']
+    with pytest.raises(ValueError, match='home must be'):
+        run_whatif(processor, 2024, 3, {}, [ScenarioGame('Alpha', 'Echo', home='Delta')])
+    with pytest.raises(ValueError):
+        parse_scenario([])
+    with pytest.raises(ValueError, match='winner and a loser'):
+        parse_scenario([{'winner': 'Alpha'}])
+    with pytest.raises(ValueError, match='greater'):
+        parse_scenario([{'winner': 'Alpha', 'loser': 'Bravo', 'winner_score': 7, 'loser_score': 10}])
+    assert parse_scenario([{'winner': 'Alpha', 'loser': 'Bravo', 'week': '2'}]) == [ScenarioGame('Alpha', 'Bravo', week=2)]
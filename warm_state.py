@@ -0,0 +1,164 @@
+"""
+Warm-state snapshot: hot in-memory state persisted so a new worker boots warm.
+
+One JSON file (WARM_STATE_PATH, default CACHE_DIR/warm_state.json) holds:
+  - the team registry (CFBDataProcessor.team_info_map)
+  - the current-season week index (/weeks cache entry)
+  - the most-requested computed rankings payloads (memory cache entries + expiry)
+
+The running app rewrites it every WARM_STATE_INTERVAL seconds (0 disables);
+app startup loads it in a single read, seeding the memory cache and the
+registry. Snapshots older than WARM_STATE_MAX_AGE are ignored. The static
+manifest is not carried: it is read from disk (mtime-validated), so a fresh
+deploy's manifest.json always wins.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional
+
+import fast_json
+from cache import CACHE_DIR, Cache
+
+WARM_STATE_VERSION = 1
+WARM_STATE_PATH = os.environ.get('WARM_STATE_PATH', os.path.join(CACHE_DIR, 'warm_state.json'))
+
+
+def _env_number(name: str, default: float) -> float:
+    raw = os.environ.get(name, '').strip()
+    if raw:
+        try:
+            return float(raw)
+        except ValueError:
+            pass
+    return default
+
+
+def warm_state_interval() -> float:
+    return max(0.0, _env_number('WARM_STATE_INTERVAL', 300.0))
+
+
+def warm_state_max_age() -> float:
+    return _env_number('WARM_STATE_MAX_AGE', 24 * 60 * 60.0)
+
+
+def warm_state_hot_limit() -> int:
+    return max(0, int(_env_number('WARM_STATE_HOT_RANKINGS', 8)))
+
+
+# Distinct keys counted before every count is halved (one-off configs drop out)
+HOT_RANKINGS_TRACKED = 256
+
+_hot_rankings: Counter = Counter()
+_hot_lock = threading.Lock()
+
+
+def note_rankings_request(cache_key: str) -> None:
+    """Count a computed-rankings request so the hottest payloads get snapshotted."""
+    with _hot_lock:
+        _hot_rankings[cache_key] += 1
+        if len(_hot_rankings) > HOT_RANKINGS_TRACKED:
+            for key, count in list(_hot_rankings.items()):
+                if count > 1:
+                    _hot_rankings[key] = count // 2
+                else:
+                    del _hot_rankings[key]
+
+
+def hot_rankings_keys(limit: int) -> List[str]:
+    with _hot_lock:
+        return [key for key, _ in _hot_rankings.most_common(limit)]
+
+
+def collect_warm_state(
+    data_processor,
+    cache: Cache,
+    season: int,
+    hot_limit: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Gather the snapshot contents from live process state."""
+    limit = warm_state_hot_limit() if hot_limit is None else hot_limit
+    week_index_key = cache._generate_key('available_weeks', season)
+    hot = hot_rankings_keys(limit)
+    # Payload hashes (ranking_service ETags) travel with their payloads
+    hot += [cache._generate_key('rankings_version', key) for key in hot]
+    return {
+        'version': WARM_STATE_VERSION,
+        'written_at': time.time(),
+        # Never block the writer on a still-warming registry
+        'team_registry': data_processor._team_info_map if data_processor.registry_ready else None,
+        'season': season,
+        'week_index': cache.export_memory([week_index_key]),
+        'rankings': cache.export_memory(hot),
+    }
+
+
+def write_warm_state(state: Dict[str, Any], path: Optional[str] = None) -> str:
+    path = path or WARM_STATE_PATH
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    # Per-process tmp name: several workers may snapshot at once
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        fast_json.dump(state, f)
+    os.replace(tmp, path)
+    return path
+
+
+def load_warm_state(
+    data_processor,
+    cache: Cache,
+    path: Optional[str] = None,
+) -> Optional[Dict[str, int]]:
+    """Seed registry and cache from the snapshot; None when missing or stale."""
+    path = path or WARM_STATE_PATH
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            state = fast_json.load(f)
+    except FileNotFoundError:
+        return None
+    except (fast_json.JSONDecodeError, OSError) as e:
+        print(f"Warm state read error: {e}")
+        return None
+    if state.get('version') != WARM_STATE_VERSION:
+        return None
+    age = time.time() - state.get('written_at', 0)
+    if age > warm_state_max_age():
+        print(f"Warm state skipped: {age:.0f}s old")
+        return None
+
+    registry = state.get('team_registry')
+    summary = {
+        'team_registry': len(registry) if registry and data_processor.seed_registry(registry) else 0,
+        'week_index': cache.seed_memory(state.get('week_index') or {}),
+        'rankings': cache.seed_memory(state.get('rankings') or {}),
+    }
+    print(f"WARM STATE: loaded {path} ({age:.0f}s old) {summary}")
+    return summary
+
+
+def start_warm_state_writer(
+    data_processor,
+    cache: Cache,
+    season: Callable[[], int],
+    interval: Optional[float] = None,
+    path: Optional[str] = None,
+) -> Optional[threading.Thread]:
+    """Rewrite the snapshot every interval seconds on a daemon thread (None if disabled)."""
+    interval = warm_state_interval() if interval is None else interval
+    if interval <= 0:
+        return None
+
+    def run() -> None:
+        while True:
+            time.sleep(interval)
+            try:
+                write_warm_state(collect_warm_state(data_processor, cache, season()), path)
+            except Exception as e:
+                print(f"Warm state write error: {e}")
+
+    thread = threading.Thread(target=run, name='warm-state-writer', daemon=True)
+    thread.start()
+    return thread
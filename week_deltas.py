@@ -0,0 +1,203 @@
+"""
+Week-to-week delta encoding for archived seasons.
+
+Adjacent slim week files share almost everything (teams, logos, colors, the
+conference table), so a season is stored as a base snapshot (the first
+archived week) plus one patch per later week against the week before it:
+
+    {"format": "week-delta", "version": 1, "year": 2024, "week": 6, "from_week": 5,
+     "set": {"week": 6},
+     "tables": {"team_rankings": {
+         "changed": {"rows": [0, 1, ...], "columns": {
+             "final_ranking_score": [1799.2, ...],
+             "records.total_losses": {"at": [0], "values": [1]}}},
+         "unset": {"Alabama": ["sos_rank"]},
+         "added": [{...full row...}],
+         "removed": ["Old Team"],
+         "order": [3, 0, 1, ...]}}}
+
+Rows are matched by team/conference name and diffed on dotted field names
+(see columnar_rankings._flatten). `changed.rows` are indexes into the
+previous week's rows; each changed field is a column over those rows, or
+`at`/`values` when only some of them changed. Values are copied exactly, so
+a rebuilt week equals the original file. `order` indexes the previous rows
+(minus `removed`, plus `added` appended) and is omitted when unchanged.
+Empty sections are omitted. frontend/src/lib/api.ts has the matching decoder.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from columnar_rankings import _flatten
+
+DELTA_FORMAT = 'week-delta'
+DELTA_VERSION = 1
+# Table -> row key
+TABLE_KEYS = {'team_rankings': 'team_name', 'conference_rankings': 'conference_name'}
+
+
+def _unflatten(flat: Dict[str, Any]) -> Dict[str, Any]:
+    row: Dict[str, Any] = {}
+    for name, value in flat.items():
+        *parents, leaf = name.split('.')
+        target = row
+        for parent in parents:
+            target = target.setdefault(parent, {})
+        target[leaf] = value
+    return row
+
+
+def _diff_table(old: List[Dict[str, Any]], new: List[Dict[str, Any]], key: str) -> Dict[str, Any]:
+    old_rows = {row[key]: (i, _flatten(row)) for i, row in enumerate(old)}
+    new_names = [row[key] for row in new]
+    patches: Dict[int, Dict[str, Any]] = {}
+    unset: Dict[str, List[str]] = {}
+    added: List[Dict[str, Any]] = []
+    for row in new:
+        name = row[key]
+        if name not in old_rows:
+            added.append(row)
+            continue
+        index, before = old_rows[name]
+        after = _flatten(row)
+        patch = {k: v for k, v in after.items() if k not in before or before[k] != v}
+        if patch:
+            patches[index] = patch
+        gone = [k for k in before if k not in after]
+        if gone:
+            unset[name] = gone
+    new_set = set(new_names)
+    removed = [row[key] for row in old if row[key] not in new_set]
+    kept = [row[key] for row in old if row[key] in new_set]
+    position = {name: i for i, name in enumerate(kept + [row[key] for row in added])}
+    order = [position[name] for name in new_names]
+    diff: Dict[str, Any] = {
+        'changed': _patch_columns(patches),
+        'unset': unset,
+        'added': added,
+        'removed': removed,
+        'order': order if order != list(range(len(order))) else [],
+    }
+    return {k: v for k, v in diff.items() if v}
+
+
+def _patch_columns(patches: Dict[int, Dict[str, Any]]) -> Dict[str, Any]:
+    """Changed fields as columns over the changed rows (dense, or sparse via `at`)."""
+    if not patches:
+        return {}
+    rows = sorted(patches)
+    fields: Dict[str, None] = {}
+    for index in rows:
+        fields.update(dict.fromkeys(patches[index]))
+    columns: Dict[str, Any] = {}
+    for field in fields:
+        at = [j for j, index in enumerate(rows) if field in patches[index]]
+        values = [patches[rows[j]][field] for j in at]
+        columns[field] = values if len(at) == len(rows) else {'at': at, 'values': values}
+    return {'rows': rows, 'columns': columns}
+
+
+def _column_patches(changed: Dict[str, Any]) -> Dict[int, Dict[str, Any]]:
+    rows = changed.get('rows', [])
+    patches: Dict[int, Dict[str, Any]] = {index: {} for index in rows}
+    for field, column in changed.get('columns', {}).items():
+        if isinstance(column, dict):
+            pairs = zip((rows[j] for j in column['at']), column['values'])
+        else:
+            pairs = zip(rows, column)
+        for index, value in pairs:
+            patches[index][field] = value
+    return patches
+
+
+def _apply_table(old: List[Dict[str, Any]], diff: Dict[str, Any], key: str) -> List[Dict[str, Any]]:
+    removed = set(diff.get('removed', ()))
+    patches = _column_patches(diff.get('changed', {}))
+    unset = diff.get('unset', {})
+    rows = []
+    for index, row in enumerate(old):
+        name = row[key]
+        if name in removed:
+            continue
+        if index in patches or name in unset:
+            flat = _flatten(row)
+            for field in unset.get(name, ()):
+                flat.pop(field, None)
+            flat.update(patches.get(index, {}))
+            row = _unflatten(flat)
+        rows.append(row)
+    rows.extend(diff.get('added', ()))
+    order = diff.get('order')
+    return [rows[i] for i in order] if order else rows
+
+
+def diff_weeks(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """Patch that turns slim payload `old` into `new`."""
+    delta: Dict[str, Any] = {
+        'format': DELTA_FORMAT,
+        'version': DELTA_VERSION,
+        'year': new.get('year'),
+        'week': new.get('week'),
+        'from_week': old.get('week'),
+    }
+    top_set = {
+        k: v for k, v in new.items()
+        if k not in TABLE_KEYS and (k not in old or old[k] != v)
+    }
+    top_unset = [k for k in old if k not in TABLE_KEYS and k not in new]
+    tables = {
+        table: _diff_table(old.get(table) or [], new.get(table) or [], key)
+        for table, key in TABLE_KEYS.items()
+    }
+    if top_set:
+        delta['set'] = top_set
+    if top_unset:
+        delta['unset'] = top_unset
+    tables = {table: diff for table, diff in tables.items() if diff}
+    if tables:
+        delta['tables'] = tables
+    return delta
+
+
+def apply_delta(old: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """New payload from `old` (not mutated; unchanged rows are shared) and a week delta."""
+    if delta.get('format') != DELTA_FORMAT or delta.get('from_week') != old.get('week'):
+        raise ValueError(f"Delta for week {delta.get('week')} does not apply to week {old.get('week')}")
+    payload = {k: v for k, v in old.items() if k not in delta.get('unset', ())}
+    payload.update(delta.get('set', {}))
+    tables = delta.get('tables', {})
+    for table, key in TABLE_KEYS.items():
+        if table in tables:
+            payload[table] = _apply_table(old.get(table) or [], tables[table], key)
+    return payload
+
+
+def build_season_deltas(
+    weeks: Dict[int, Dict[str, Any]],
+) -> Tuple[Dict[str, Any], Dict[int, Dict[str, Any]]]:
+    """(base payload, {week: delta vs previous week}) for a season's slim payloads."""
+    ordered = sorted(weeks)
+    base = weeks[ordered[0]]
+    deltas = {
+        week: diff_weeks(weeks[prev], weeks[week])
+        for prev, week in zip(ordered, ordered[1:])
+    }
+    return base, deltas
+
+
+def reconstruct_week(
+    base: Dict[str, Any],
+    deltas: Dict[int, Dict[str, Any]],
+    week: int,
+) -> Optional[Dict[str, Any]]:
+    """Apply the delta chain from the base up to `week`; None when the chain doesn't reach it."""
+    by_source = {d.get('from_week'): d for d in deltas.values()}
+    payload = base
+    current = base.get('week')
+    while current != week:
+        step = by_source.get(current)
+        if step is None:
+            return None
+        payload = apply_delta(payload, step)
+        current = step.get('week')
+    return payload
@@ -0,0 +1,312 @@
+"""
+What-if rankings: hypothetical or flipped game results re-solved against a baseline.
+
+    scenario = parse_scenario([{'winner': 'Texas', 'loser': 'Georgia'}])
+    run_whatif(data_processor, 2024, 10, request.args, scenario)
+
+The baseline for a year/week/config is solved once with a checkpoint (the
+pickled ranker) taken ahead of every week of the final pass, and kept in a
+small in-process LRU. A scenario edits copies of the affected weeks,
+restores the checkpoint from just before the earliest of them and replays
+only the weeks from there; a game after the last played week starts from
+the end state and replays nothing else.
+
+The replay is the solver's final pass only: reference ranks and conference
+spreads from the earlier passes keep their baseline values rather than
+being re-derived, which a handful of changed games barely moves.
+"""
+from __future__ import annotations
+
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from cache import TTL_RANKINGS
+from ranking_service import (
+    compute_priors,
+    finish_rankings,
+    rankings_cache_key,
+    rankings_config,
+    replay_weeks,
+    run_solver,
+)
+from team_lookup import TeamIndex, TeamNotFoundError
+
+WHATIF_STATE_ENTRIES = int(os.environ.get('WHATIF_STATE_ENTRIES', '4'))
+WHATIF_MAX_GAMES = 16
+WHATIF_DIFF_LIMIT = 25
+WHATIF_MOVERS = 10
+# Score for a new game when the scenario gives none
+DEFAULT_SCORE = (28, 21)
+NEUTRAL_NOTES = 'Neutral site (what-if)'
+
+
+class ScenarioGame(NamedTuple):
+    winner: str
+    loser: str
+    week: Optional[int] = None
+    home: Optional[str] = None
+    winner_score: Optional[int] = None
+    loser_score: Optional[int] = None
+
+
+def _optional_int(game: Dict[str, Any], field: str) -> Optional[int]:
+    value = game.get(field)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f'{field} must be an integer') from None
+
+
+def parse_scenario(games: Any) -> List[ScenarioGame]:
+    """ScenarioGames from a list of {"winner", "loser", "week"?, "home"?, "winner_score"?, "loser_score"?}."""
+    if not isinstance(games, list) or not games:
+        raise ValueError('games must be a non-empty list')
+    if len(games) > WHATIF_MAX_GAMES:
+        raise ValueError(f'At most {WHATIF_MAX_GAMES} games per scenario')
+    scenario = []
+    for game in games:
+        if not isinstance(game, dict) or not game.get('winner') or not game.get('loser'):
+            raise ValueError('Each game needs a winner and a loser')
+        item = ScenarioGame(
+            str(game['winner']), str(game['loser']),
+            week=_optional_int(game, 'week'),
+            home=str(game['home']) if game.get('home') else None,
+            winner_score=_optional_int(game, 'winner_score'),
+            loser_score=_optional_int(game, 'loser_score'),
+        )
+        if (item.winner_score is None) != (item.loser_score is None):
+            raise ValueError('Give both winner_score and loser_score, or neither')
+        if item.winner_score is not None and item.winner_score <= item.loser_score:
+            raise ValueError('winner_score must be greater than loser_score')
+        if item.week is not None and item.week < 1:
+            raise ValueError('week must be >= 1')
+        scenario.append(item)
+    return scenario
+
+
+class WhatIfState(NamedTuple):
+    """A baseline solve and the checkpoints to resume it from."""
+    games_by_week: Dict[int, List[Dict[str, Any]]]
+    reference_ranks: Optional[Dict[str, float]]
+    # Pickled final-pass ranker before each played week, plus the end state at last week + 1
+    checkpoints: Dict[int, bytes]
+    conferences: Dict[str, Tuple[Optional[str], str]]
+    teams: TeamIndex
+    baseline: Dict[str, Any]
+    built_at: float
+
+
+def build_whatif_state(data_processor, year: int, week: Optional[int], request_args) -> Optional[WhatIfState]:
+    """Solve the baseline (same inputs as calculate_rankings_logic), checkpointing each week."""
+    games = data_processor.get_games_for_season(year, through_week=week)
+    if not games:
+        return None
+    games_by_week = data_processor.organize_games_by_week(games)
+    config = rankings_config(request_args, week)
+    priors = compute_priors(data_processor, year, config)
+
+    checkpoints: Dict[int, bytes] = {}
+
+    def checkpoint(week_num, ranker):
+        checkpoints[week_num] = pickle.dumps(ranker, protocol=pickle.HIGHEST_PROTOCOL)
+
+    run = run_solver(games_by_week, config, priors, before_week=checkpoint)
+    checkpoint(max(games_by_week) + 1, run.ranker)
+    conferences = {
+        name: (stats['conference'], stats['conference_type'])
+        for name, stats in run.ranker.team_stats.items()
+    }
+    baseline = finish_rankings(run.ranker, data_processor, year, week, request_args)
+    # Ranked teams first so an ambiguous name resolves to the ranked one
+    names = list(dict.fromkeys([t['team_name'] for t in baseline['team_rankings']] + sorted(conferences)))
+    return WhatIfState(
+        games_by_week=games_by_week,
+        reference_ranks=run.reference_ranks,
+        checkpoints=checkpoints,
+        conferences=conferences,
+        teams=TeamIndex([{'team_name': name} for name in names]),
+        baseline=baseline,
+        built_at=time.monotonic(),
+    )
+
+
+_states: 'OrderedDict[str, WhatIfState]' = OrderedDict()
+_states_lock = threading.Lock()
+
+
+def get_whatif_state(data_processor, year: int, week: Optional[int], request_args) -> Optional[WhatIfState]:
+    """Baseline state for a rankings request (LRU of WHATIF_STATE_ENTRIES, rebuilt after TTL_RANKINGS)."""
+    key = rankings_cache_key(year, week, request_args)
+    with _states_lock:
+        state = _states.get(key)
+        if state is not None and time.monotonic() - state.built_at < TTL_RANKINGS:
+            _states.move_to_end(key)
+            return state
+    state = build_whatif_state(data_processor, year, week, request_args)
+    if state is None:
+        return None
+    with _states_lock:
+        _states[key] = state
+        while len(_states) > WHATIF_STATE_ENTRIES:
+            _states.popitem(last=False)
+    return state
+
+
+def _team(state: WhatIfState, name: str) -> str:
+    """Team by exact name or alias; a typo raises with fuzzy suggestions instead of guessing."""
+    row = state.teams.find(name)
+    if row is None:
+        raise TeamNotFoundError(name, [state.teams.teams[i]['team_name'] for i in state.teams.suggest(name)])
+    return state.teams.teams[row]['team_name']
+
+
+def _find_game(state: WhatIfState, winner: str, loser: str, week: Optional[int]) -> Optional[Tuple[int, int]]:
+    """(week, position) of the latest game between two teams, in `week` if given."""
+    pair = {winner, loser}
+    for week_num in sorted(state.games_by_week, reverse=True):
+        if week is not None and week_num != week:
+            continue
+        for i, game in enumerate(state.games_by_week[week_num]):
+            if {game['home_team_name'], game['away_team_name']} == pair:
+                return week_num, i
+    return None
+
+
+def apply_scenario(
+    state: WhatIfState, scenario: List[ScenarioGame],
+) -> Tuple[Dict[int, List[Dict[str, Any]]], int, List[Dict[str, Any]]]:
+    """(games_by_week with the scenario applied, earliest changed week, applied games).
+
+    A pair that already played (in `week` when given) has that game's result
+    set; otherwise a new game is added, by default the week after the last
+    played one at a neutral site.
+    """
+    games_by_week = dict(state.games_by_week)
+    next_week = max(state.games_by_week) + 1
+    from_week = None
+    applied = []
+    for item in scenario:
+        winner, loser = _team(state, item.winner), _team(state, item.loser)
+        if winner == loser:
+            raise ValueError(f'A team cannot play itself: {winner}')
+        found = _find_game(state, winner, loser, item.week)
+        if found is not None:
+            week_num, i = found
+            original = state.games_by_week[week_num][i]
+            high = max(original['home_score'], original['away_score'])
+            low = min(original['home_score'], original['away_score'])
+            winner_score, loser_score = item.winner_score, item.loser_score
+            if winner_score is None:
+                # A tie becomes a field-goal win
+                winner_score, loser_score = (high, low) if high > low else (high + 3, low)
+            game = dict(original)
+            home_won = original['home_team_name'] == winner
+            game['home_score'] = winner_score if home_won else loser_score
+            game['away_score'] = loser_score if home_won else winner_score
+            games = list(games_by_week[week_num])
+            games[i] = game
+            kind = 'result'
+        else:
+            week_num = item.week or next_week
+            winner_score, loser_score = (
+                (item.winner_score, item.loser_score) if item.winner_score is not None else DEFAULT_SCORE
+            )
+            home = _team(state, item.home) if item.home else None
+            if home is not None and home not in (winner, loser):
+                raise ValueError(f'home must be {winner} or {loser}')
+            away = loser if home in (None, winner) else winner
+            home = home or winner
+            home_won = home == winner
+            game = {
+                'week': week_num,
+                'season_type': 'regular',
+                'home_team_name': home,
+                'away_team_name': away,
+                'home_score': winner_score if home_won else loser_score,
+                'away_score': loser_score if home_won else winner_score,
+                'home_conference': state.conferences[home][0],
+                'away_conference': state.conferences[away][0],
+                'home_conference_type': state.conferences[home][1],
+                'away_conference_type': state.conferences[away][1],
+                'notes': None if item.home else NEUTRAL_NOTES,
+                'spread_info': None,
+            }
+            games = list(games_by_week.get(week_num, []))
+            games.append(game)
+            kind = 'added'
+        games_by_week[week_num] = games
+        from_week = week_num if from_week is None else min(from_week, week_num)
+        applied.append({
+            'type': kind,
+            'week': week_num,
+            'home_team': game['home_team_name'],
+            'away_team': game['away_team_name'],
+            'home_score': game['home_score'],
+            'away_score': game['away_score'],
+        })
+    return games_by_week, from_week, applied
+
+
+def rankings_diff(
+    baseline: Dict[str, Any], scenario: Dict[str, Any], limit: int = WHATIF_DIFF_LIMIT,
+) -> Dict[str, Any]:
+    """Scenario ranks next to baseline ranks: the top `limit` rows and the biggest movers."""
+    before = {
+        team['team_name']: (i + 1, team.get('final_ranking_score'))
+        for i, team in enumerate(baseline.get('team_rankings', []))
+    }
+    rows = []
+    for i, team in enumerate(scenario.get('team_rankings', [])):
+        baseline_rank, baseline_score = before.get(team['team_name'], (None, None))
+        score = team.get('final_ranking_score')
+        rows.append({
+            'team_name': team['team_name'],
+            'conference': team.get('conference'),
+            'rank': i + 1,
+            'baseline_rank': baseline_rank,
+            # Positive = moved up
+            'rank_change': None if baseline_rank is None else baseline_rank - (i + 1),
+            'final_ranking_score': score,
+            'score_change': (
+                None if baseline_score is None or score is None else round(float(score - baseline_score), 4)
+            ),
+        })
+    movers = sorted(
+        (row for row in rows if row['rank_change']),
+        key=lambda row: (-abs(row['rank_change']), row['rank']),
+    )
+    return {'teams': rows[:limit], 'movers': movers[:WHATIF_MOVERS]}
+
+
+def run_whatif(
+    data_processor,
+    year: int,
+    week: Optional[int],
+    request_args,
+    scenario: List[ScenarioGame],
+    limit: int = WHATIF_DIFF_LIMIT,
+) -> Optional[Dict[str, Any]]:
+    """Rankings diff for a scenario against the baseline for year/week/config (None without games)."""
+    state = get_whatif_state(data_processor, year, week, request_args)
+    if state is None:
+        return None
+    games_by_week, from_week, applied = apply_scenario(state, scenario)
+    # State before from_week: the next checkpoint at or after it (weeks between have no games)
+    resume = min((k for k in state.checkpoints if k >= from_week), default=max(state.checkpoints))
+    ranker = pickle.loads(state.checkpoints[resume])
+    replay_weeks(ranker, games_by_week, state.reference_ranks, from_week=from_week)
+    result = finish_rankings(ranker, data_processor, year, week, request_args)
+    return {
+        'year': year,
+        'week': state.baseline.get('week', week),
+        'algo': result.get('algo'),
+        'games': applied,
+        'replayed_from_week': from_week,
+        **rankings_diff(state.baseline, result, limit),
+    }